@@ -0,0 +1,227 @@
+"""Benchmark project generation for every registered template.
+
+Each template from ``templates/cookiecutter.json`` is rendered for a few
+option combinations with install and git init disabled (the equivalent of
+``create --no-input --no-install --no-git``), so the numbers cover import,
+prompt resolution, rendering, publishing and the post-gen hook's validation
+and cleanup, but not the network::
+
+    python benchmarks/bench_render.py                        # print a table
+    python benchmarks/bench_render.py --output latest.json   # also save JSON
+    python benchmarks/bench_render.py --compare baseline.json --threshold 0.25
+
+Every round runs in a fresh interpreter so imports are paid each time and
+peak RSS is per run. Each case is measured twice, against a private
+``REPO_SCAFFOLD_CACHE_DIR`` so the user's cache is never read or written:
+``cold`` gives every round an empty cache (first run of a template version),
+``warm`` primes one cache with an unmeasured run and reuses it (render-cache
+hits). Per case the script records the median wall time, the
+files and bytes written and the peak RSS of the generating process (or of its
+hook, whichever is larger). ``--compare`` exits 1 when a case's wall time or
+peak RSS grew by more than ``--threshold`` over the baseline file.
+``just bench``, ``just bench-baseline`` (writes ``.benchmarks/baseline.json``)
+and ``just bench-check`` (compares against it) wrap the common invocations.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+
+FLAGS = {"install_after_generate": "no", "init_git": "no"}
+CACHE_STATES = ("cold", "warm")
+_YES_NO = ["yes", "no"]
+
+
+def template_cases(variables: dict[str, Any]) -> list[tuple[str, dict[str, str]]]:
+    """Return the option combinations to benchmark for one template.
+
+    ``default`` uses every default answer; ``minimal`` answers ``no`` to every
+    yes/no choice; each further choice of a multi-valued option (such as the
+    pnpm workspace's ``initial_package_type``) gets a case of its own.
+    """
+    yes_no = [name for name, value in variables.items() if not name.startswith("_") and value == _YES_NO]
+    multi = [
+        name
+        for name, value in variables.items()
+        if not name.startswith("_") and isinstance(value, list) and value != _YES_NO and len(value) > 1
+    ]
+    cases: list[tuple[str, dict[str, str]]] = [("default", {})]
+    if yes_no:
+        cases.append(("minimal", {name: "no" for name in yes_no}))
+    for name in multi:
+        cases.extend((f"{name}={choice}", {name: choice}) for choice in variables[name][1:])
+    return cases
+
+
+def _peak_rss_kib() -> int:
+    """Peak RSS of this process or its largest waited-for child, in KiB."""
+    scale = 1024 if sys.platform == "darwin" else 1  # macOS reports bytes
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    return peak // scale
+
+
+def _worker(template: str, answers: dict[str, str], output_dir: Path) -> dict[str, Any]:
+    """Generate one project in this process and measure it."""
+    start = time.perf_counter()
+    from repo_scaffold.render import RenderEngine
+
+    project_dir = RenderEngine().generate(template, output_dir=output_dir, extra_context={**answers, **FLAGS})
+    seconds = time.perf_counter() - start
+
+    files = 0
+    size = 0
+    for root, _, names in os.walk(project_dir):
+        for name in names:
+            files += 1
+            size += os.lstat(os.path.join(root, name)).st_size
+    return {"seconds": seconds, "files": files, "bytes": size, "peak_rss_kib": _peak_rss_kib()}
+
+
+def _run_worker(template: str, answers: dict[str, str], cache_dir: Path) -> dict[str, Any]:
+    """Generate one project in a fresh interpreter using ``cache_dir`` as the cache; return its sample."""
+    from repo_scaffold.render.cache import CACHE_DIR_ENV_VAR
+
+    with tempfile.TemporaryDirectory(prefix="repo-scaffold-bench-") as tmp:
+        proc = subprocess.run(
+            [sys.executable, __file__, "--worker", template, json.dumps(answers), tmp],
+            check=True,
+            capture_output=True,
+            text=True,
+            env={**os.environ, CACHE_DIR_ENV_VAR: str(cache_dir)},
+        )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def run_case(template: str, answers: dict[str, str], *, rounds: int, cache: str = "cold") -> dict[str, Any]:
+    """Run one case ``rounds`` times in fresh interpreters and aggregate the measurements.
+
+    With ``cache="cold"`` every round starts from an empty cache directory;
+    with ``"warm"`` all rounds share one that an unmeasured run filled first.
+    """
+    samples = []
+    with tempfile.TemporaryDirectory(prefix="repo-scaffold-bench-cache-") as caches:
+        if cache == "warm":
+            _run_worker(template, answers, Path(caches))
+        for round_number in range(rounds):
+            cache_dir = Path(caches) / str(round_number) if cache == "cold" else Path(caches)
+            samples.append(_run_worker(template, answers, cache_dir))
+    return {
+        "cache": cache,
+        "wall_seconds": statistics.median(sample["seconds"] for sample in samples),
+        "files": samples[-1]["files"],
+        "bytes": samples[-1]["bytes"],
+        "peak_rss_kib": max(sample["peak_rss_kib"] for sample in samples),
+        "rounds": rounds,
+    }
+
+
+def run_suite(templates: list[str] | None = None, *, rounds: int = 3) -> dict[str, Any]:
+    """Benchmark every case of every (or each selected) template."""
+    from repo_scaffold.registry import get_registry
+    from repo_scaffold.render.cache import package_version
+
+    registry = get_registry()
+    names = [registry.resolve(name) or name for name in templates] if templates else [*registry.templates]
+    results = []
+    for name in names:
+        for case, answers in template_cases(registry.variables[name]):
+            for cache in CACHE_STATES:
+                result = run_case(name, answers, rounds=rounds, cache=cache)
+                results.append({"template": name, "case": case, "answers": answers, **result})
+                print(_format_row(results[-1]), file=sys.stderr)
+    return {
+        "repo_scaffold": package_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "results": results,
+    }
+
+
+def _format_row(result: dict[str, Any]) -> str:
+    return (
+        f"{result['template']:<26} {result['case']:<32} {result['cache']:<4}"
+        f" {result['wall_seconds'] * 1000:>9.1f} ms"
+        f" {result['files']:>5} files {result['bytes'] / 1024:>9.1f} KiB {result['peak_rss_kib'] / 1024:>7.1f} MiB"
+    )
+
+
+def _key(result: dict[str, Any]) -> tuple[str, str, str | None]:
+    return result["template"], result["case"], result.get("cache")
+
+
+def _cache_label(result: dict[str, Any]) -> str:
+    return f", {result['cache']}" if result.get("cache") else ""
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], *, threshold: float) -> list[str]:
+    """Return a message for every case whose wall time or peak RSS regressed beyond ``threshold``.
+
+    Cases missing from either side are ignored, so adding a template or an
+    option does not fail the check.
+    """
+    previous = {_key(result): result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        old = previous.get(_key(result))
+        if old is None:
+            continue
+        for metric in ("wall_seconds", "peak_rss_kib"):
+            if old[metric] and result[metric] > old[metric] * (1 + threshold):
+                regressions.append(
+                    f"{result['template']} [{result['case']}{_cache_label(result)}] {metric}: "
+                    f"{old[metric]:.4g} -> {result[metric]:.4g} (+{result[metric] / old[metric] - 1:.0%})"
+                )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the suite, optionally saving results and checking them against a baseline."""
+    parser = argparse.ArgumentParser(prog="python benchmarks/bench_render.py")
+    parser.add_argument("templates", nargs="*", help="template names (default: all)")
+    parser.add_argument("--rounds", type=int, default=3, help="fresh-interpreter runs per case (default: 3)")
+    parser.add_argument("--output", type=Path, help="write results as JSON to this file")
+    parser.add_argument("--compare", type=Path, metavar="BASELINE", help="results JSON to check against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed relative growth (default: 0.25)")
+    parser.add_argument("--worker", nargs=3, metavar=("TEMPLATE", "ANSWERS", "OUTPUT_DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        template, answers, output_dir = args.worker
+        print(json.dumps(_worker(template, json.loads(answers), Path(output_dir))))
+        return 0
+    if args.compare and not args.compare.is_file():
+        parser.error(f"baseline {args.compare} not found; record one first with `just bench-baseline`")
+
+    current = run_suite(args.templates, rounds=args.rounds)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+        print(f"Wrote {args.output}", file=sys.stderr)
+    if args.compare:
+        regressions = compare(current, json.loads(args.compare.read_text(encoding="utf-8")), threshold=args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%} against {args.compare}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,6 +12,12 @@ Example:
 
     # Create a new project
     $ repo-scaffold create python
+
+    # Create many projects from a manifest in one process
+    $ repo-scaffold create-batch services.toml
+
+    # Serve generation requests over HTTP with the templates kept warm
+    $ repo-scaffold serve --port 8787
     ```
 
     To use this module in your code:
@@ -24,18 +30,49 @@ Example:
     ```
 """
 
+import importlib
 import importlib.resources
-import json
 import os
 from pathlib import Path
 from typing import Any
 
 import click
-from cookiecutter.main import cookiecutter
 
-from repo_scaffold.github_init import GhInitClient
-from repo_scaffold.github_init import build_config
-from repo_scaffold.github_init import init_repository
+from repo_scaffold.registry import get_registry
+
+
+# Heavy dependencies are resolved on first use instead of at import time:
+# ``repo_scaffold.render`` drags in cookiecutter and Jinja2, ``repo_scaffold.github_init``
+# drags in PyGithub and cryptography. Cheap commands such as ``list`` and
+# ``--help`` (called from shell completions and wrapper scripts) never pay for
+# them. Values are ``"module:attribute"`` import targets.
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "RenderEngine": "repo_scaffold.render:RenderEngine",
+    "ConcurrentGhInitClient": "repo_scaffold.github_init:ConcurrentGhInitClient",
+    "GhInitClient": "repo_scaffold.github_init:GhInitClient",
+    "build_config": "repo_scaffold.github_init:build_config",
+    "init_repository": "repo_scaffold.github_init:init_repository",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the attributes listed in ``_LAZY_ATTRIBUTES`` on first access (PEP 562)."""
+    target = _LAZY_ATTRIBUTES.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, _, attr = target.partition(":")
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str) -> Any:
+    """Return a lazily imported attribute, honouring values already bound on the module.
+
+    Commands go through this instead of a bare global lookup so that tests
+    which ``monkeypatch`` e.g. ``repo_scaffold.cli.RenderEngine`` keep working.
+    """
+    return globals()[name] if name in globals() else __getattr__(name)
 
 
 def get_package_path(relative_path: str) -> str:
@@ -58,7 +95,8 @@ def get_package_path(relative_path: str) -> str:
 def load_templates() -> dict[str, Any]:
     """Load available project templates configuration.
 
-    Reads template configurations from the cookiecutter.json file in the templates directory.
+    Served from the precompiled registry index (see :mod:`repo_scaffold.registry`),
+    or from the builtin and user overlay JSON files when an overlay registry exists.
     Each template contains information about its name, path, title, and description.
 
     Returns:
@@ -73,13 +111,10 @@ def load_templates() -> dict[str, Any]:
             }
 
     Raises:
-        FileNotFoundError: If the configuration file doesn't exist
-        json.JSONDecodeError: If the configuration file is not valid JSON
+        FileNotFoundError: If an overlay registry references a missing template
+        json.JSONDecodeError: If an overlay registry file is not valid JSON
     """
-    config_path = get_package_path("templates/cookiecutter.json")
-    with open(config_path, encoding="utf-8") as f:
-        config = json.load(f)
-    return config["templates"]
+    return get_registry().templates
 
 
 @click.group()
@@ -139,7 +174,39 @@ def list():
     is_flag=True,
     help="Generate the project without initializing a git repository (default branch: master)",
 )
-def create(template: str, output_dir: Path, no_input: bool, no_install: bool, no_git: bool):
+@click.option(
+    "--dep-cache",
+    envvar="REPO_SCAFFOLD_DEP_CACHE",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+    help="Shared uv/pnpm/cargo cache directory for dependency installation (env: REPO_SCAFFOLD_DEP_CACHE)",
+)
+@click.option(
+    "--format",
+    "archive_format",
+    type=click.Choice(["tar", "tar.gz", "zip"]),
+    help="Stream the project as an archive instead of creating it (no hooks run: no git init or install)",
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, allow_dash=True, path_type=Path),
+    help="Archive file to write, or - for stdout (default: <output-dir>/<project>.<format>)",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Print per-phase timings and write a Chrome trace (path: $REPO_SCAFFOLD_TRACE or ./repo-scaffold-trace.json)",
+)
+def create(
+    template: str,
+    output_dir: Path,
+    no_input: bool,
+    no_install: bool,
+    no_git: bool,
+    dep_cache: Path | None,
+    archive_format: str | None,
+    output: Path | None,
+    profile: bool,
+):
     """Create a new project from a template.
 
     Creates a new project based on the specified template. If no template is specified,
@@ -152,6 +219,10 @@ def create(template: str, output_dir: Path, no_input: bool, no_install: bool, no
         no_input: Do not prompt for parameters and only use cookiecutter defaults
         no_install: Skip post-generation dependency installation
         no_git: Skip git repository initialization (otherwise inits on branch master)
+        dep_cache: Shared dependency cache for the post-generation install
+        archive_format: Stream the project as a tar, tar.gz or zip archive instead
+        output: Archive destination (``-`` for stdout)
+        profile: Print per-phase timings and write a trace file
 
     Example:
         Create a Python project:
@@ -168,7 +239,52 @@ def create(template: str, output_dir: Path, no_input: bool, no_install: bool, no
             ```bash
             $ repo-scaffold list
             ```
+
+        Stream the project as a tarball to stdout, without writing it to disk:
+            ```bash
+            $ repo-scaffold create python --no-input --format tar --output - | upload
+            ```
+
+        Profile where the time goes (Chrome trace written to ./trace.json):
+            ```bash
+            $ REPO_SCAFFOLD_TRACE=trace.json repo-scaffold create python --no-input --profile
+            ```
     """
+    from repo_scaffold.trace import span
+    from repo_scaffold.trace import summarize
+    from repo_scaffold.trace import trace_path
+    from repo_scaffold.trace import tracing
+
+    if output is not None and archive_format is None:
+        raise click.UsageError("--output requires --format")
+    if output is not None and str(output) == "-" and not no_input:
+        raise click.UsageError("--output - requires --no-input (prompts would end up in the archive)")
+
+    path = trace_path(profile)
+    with tracing(path) as tracer, span("create", template=template or ""):
+        _create_project(template, output_dir, no_input, no_install, no_git, dep_cache, archive_format, output)
+
+    if tracer is not None:
+        if profile:
+            click.echo("\nPhase timings:", err=True)
+            for line in summarize(tracer.events):
+                click.echo(f"  {line}", err=True)
+        click.echo(f"Trace written to {path}", err=True)
+
+
+def _create_project(
+    template: str | None,
+    output_dir: Path,
+    no_input: bool,
+    no_install: bool,
+    no_git: bool,
+    dep_cache: Path | None,
+    archive_format: str | None = None,
+    output: Path | None = None,
+) -> None:
+    """Body of ``create``, run inside the trace context."""
+    from repo_scaffold.trace import span
+
     templates = load_templates()
 
     # 如果没有指定模板,让 cookiecutter 处理模板选择
@@ -179,31 +295,375 @@ def create(template: str, output_dir: Path, no_input: bool, no_install: bool, no
             click.echo(f"    {info['description']}")
         return
 
-    # 查找模板配置
-    template_info = None
-    for name, info in templates.items():
-        if name == template or info["title"] == template:
-            template_info = info
-            break
-
-    if not template_info:
+    # 查找模板配置 (名称、标题或路径均可)
+    registry = get_registry()
+    template_name = registry.resolve(template)
+    if template_name is None:
         click.echo(f"Error: Template '{template}' not found")
         click.echo("\nAvailable templates:")
         for name, info in templates.items():
             click.echo(f"  {info['title']} - {name}")
         return
 
-    # 使用模板创建项目
-    template_path = get_package_path(os.path.join("templates", template_info["path"]))
-    cookiecutter(
-        template=template_path,
-        output_dir=str(output_dir),
-        no_input=no_input,  # 根据用户选择决定是否启用交互式输入
-        extra_context={
-            "install_after_generate": "no" if no_install else "yes",
-            "init_git": "no" if no_git else "yes",
-        },
-    )
+    # 使用模板创建项目 (编译后的模板缓存在用户缓存目录, 见 `repo-scaffold cache stats`)
+    from repo_scaffold.depcache import dep_cache_environment
+
+    with span("import"):  # cookiecutter + Jinja2
+        engine = _lazy("RenderEngine")()
+    from repo_scaffold.render import InvalidAnswersError
+
+    extra_context = {
+        "install_after_generate": "no" if no_install else "yes",
+        "init_git": "no" if no_git else "yes",
+    }
+    if archive_format is not None:
+        try:
+            _stream_archive(engine, template_name, extra_context, no_input, archive_format, output_dir, output)
+        except InvalidAnswersError as error:
+            raise click.ClickException(str(error)) from error
+        return
+
+    with dep_cache_environment(dep_cache):  # hook 子进程继承共享依赖缓存的环境变量
+        try:
+            engine.generate(
+                template_name,
+                output_dir=output_dir,
+                no_input=no_input,  # 根据用户选择决定是否启用交互式输入
+                extra_context=extra_context,
+            )
+        except InvalidAnswersError as error:  # 渲染前按模板的 _answer_schema 校验, 未写入任何文件
+            raise click.ClickException(str(error)) from error
+
+
+def _stream_archive(
+    engine: Any,
+    template_name: str,
+    extra_context: dict[str, str],
+    no_input: bool,
+    archive_format: str,
+    output_dir: Path,
+    output: Path | None,
+) -> None:
+    """Render a project straight into an archive (``create --format``); nothing but the archive is written."""
+    from repo_scaffold.render import write_archive
+    from repo_scaffold.trace import span
+
+    # 边渲染边写入归档, 项目目录从不落盘; 需要真实目录的 hook (git init, 安装依赖) 不运行
+    project_name, files = engine.stream(template_name, extra_context=extra_context, no_input=no_input)
+    click.echo("Skipping post-generation hooks (git init, dependency installation) in archive mode.", err=True)
+    target = output if output is not None else output_dir / f"{project_name}.{archive_format}"
+    if str(target) != "-":
+        target.parent.mkdir(parents=True, exist_ok=True)
+    # atomic: 写入临时文件, 成功后再改名, 渲染失败时不留下半个归档
+    with span("archive", format=archive_format), click.open_file(str(target), "wb", atomic=True) as fileobj:
+        size = write_archive(files, fileobj, root=project_name, archive_format=archive_format)
+    if str(target) != "-":
+        click.echo(f"Wrote {target} ({size} bytes)", err=True)
+
+
+@cli.command("create-batch")
+@click.argument(
+    "manifest",
+    type=click.Path(file_okay=True, dir_okay=False, exists=True, path_type=Path),
+)
+@click.option(
+    "--no-install",
+    is_flag=True,
+    help="Generate the projects without running post-generation dependency installation",
+)
+@click.option(
+    "--no-git",
+    is_flag=True,
+    help="Generate the projects without initializing git repositories",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of projects to generate in parallel worker processes",
+)
+@click.option(
+    "--dep-cache",
+    envvar="REPO_SCAFFOLD_DEP_CACHE",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+    help="Shared uv/pnpm/cargo cache directory for dependency installation (env: REPO_SCAFFOLD_DEP_CACHE)",
+)
+def create_batch(manifest: Path, no_install: bool, no_git: bool, jobs: int, dep_cache: Path | None):
+    """Create many projects from a manifest in one process.
+
+    MANIFEST is a ``.toml``, ``.json`` or ``.yaml`` file with a ``projects``
+    list; each entry names a ``template``, an ``output_dir`` and an
+    ``extra_context`` table (an optional ``defaults`` table applies to every
+    entry). All entries render in this process without prompting, sharing each
+    template's compiled Jinja files, and a per-project timing table is printed
+    at the end. Exits non-zero if any project failed.
+
+    With ``--jobs N`` the entries are spread over N worker processes. Each
+    project's output is captured and replayed here in manifest order, so logs
+    from concurrent projects never interleave.
+
+    With ``--dep-cache DIR`` every project's install shares one uv, pnpm and
+    cargo cache, so dependencies are downloaded and built once per batch.
+
+    Example:
+        ```bash
+        $ repo-scaffold create-batch services.toml --no-install --jobs 4
+        ```
+    """
+    import time
+
+    from repo_scaffold.depcache import dep_cache_environment
+    from repo_scaffold.render import BatchResult
+    from repo_scaffold.render import format_results
+    from repo_scaffold.render import load_manifest
+    from repo_scaffold.render import run_batch
+
+    def replay(result: BatchResult) -> None:
+        if result.log:
+            click.echo(f"\n── {result.entry.template} → {result.project_dir or result.entry.output_dir}")
+            click.echo(result.log.rstrip("\n"))
+
+    entries = load_manifest(manifest)
+    start = time.perf_counter()
+    with dep_cache_environment(dep_cache):
+        results = run_batch(entries, no_install=no_install, no_git=no_git, jobs=jobs, on_result=replay)
+    wall_seconds = time.perf_counter() - start
+
+    click.echo("")
+    for line in format_results(results, wall_seconds=wall_seconds):
+        click.echo(line)
+
+    failed = sum(not result.ok for result in results)
+    if failed:
+        raise click.ClickException(f"{failed} of {len(results)} projects failed")
+
+
+@cli.command()
+@click.argument(
+    "project",
+    default=".",
+    type=click.Path(file_okay=False, dir_okay=True, exists=True, path_type=Path),
+)
+@click.option("--dry-run", is_flag=True, help="Show what would change without writing anything")
+def update(project: Path, dry_run: bool):
+    """Update a generated project to the installed template version.
+
+    Reads PROJECT's ``.repo-scaffold.json`` (default: current directory),
+    re-renders only the template files whose source changed since the project
+    was generated or last updated, and merges them with your edits. Files with
+    overlapping edits get conflict markers to resolve by hand; the command
+    then exits non-zero. Hooks are not run.
+
+    Example:
+        ```bash
+        $ repo-scaffold update services/billing --dry-run
+        ```
+    """
+    from repo_scaffold.render import format_changes
+    from repo_scaffold.render import update_project
+
+    try:
+        result = update_project(project, dry_run=dry_run)
+    except (FileNotFoundError, ValueError) as error:
+        raise click.ClickException(str(error)) from error
+    for line in format_changes(result):
+        click.echo(line)
+    if result.conflicts and not dry_run:
+        raise click.ClickException(f"{len(result.conflicts)} files have conflicts; resolve the <<<<<<< markers")
+
+
+@cli.command()
+@click.argument(
+    "targets",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, path_type=Path),
+)
+@click.option(
+    "--jobs",
+    "-j",
+    default=8,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of projects compared concurrently",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["json", "text"]),
+    default="json",
+    show_default=True,
+    help="Report format",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write the report to this file instead of stdout",
+)
+def drift(targets: tuple[Path, ...], jobs: int, output_format: str, output: Path | None):
+    """Report how generated projects differ from the current templates.
+
+    Each TARGET is a generated project, a directory to search for projects
+    (anything with a ``.repo-scaffold.json``), or a text file listing one
+    target per line. The template is rendered once per unique answer set and
+    the projects are compared in parallel; files whose size and mtime are
+    unchanged since the last scan are not re-hashed. Exits non-zero if any
+    project drifted or could not be checked.
+
+    Example:
+        ```bash
+        $ repo-scaffold drift ~/src/services --jobs 16 -o drift.json
+        ```
+    """
+    import json
+
+    from repo_scaffold.render import format_report
+    from repo_scaffold.render import scan_drift
+
+    report = scan_drift(targets, jobs=jobs)
+    text = json.dumps(report.to_dict(), indent=2) if output_format == "json" else "\n".join(format_report(report))
+    if output is not None:
+        output.write_text(text + "\n", encoding="utf-8")
+    else:
+        click.echo(text)
+    summary = report.to_dict()["summary"]
+    if summary["drifted"] or summary["error"]:
+        raise SystemExit(1)
+
+
+@cli.command()
+@click.argument("template")
+@click.option(
+    "--dep-cache",
+    envvar="REPO_SCAFFOLD_DEP_CACHE",
+    required=True,
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+    help="Shared uv/pnpm/cargo cache directory to fill (env: REPO_SCAFFOLD_DEP_CACHE)",
+)
+def prewarm(template: str, dep_cache: Path):
+    """Fill a shared dependency cache from a template's defaults.
+
+    Generates TEMPLATE with its default answers into a temporary directory,
+    runs its dependency installation against DEP_CACHE and throws the project
+    away. Later ``create --dep-cache`` runs then install mostly from local
+    hardlinks.
+
+    Example:
+        ```bash
+        $ repo-scaffold prewarm python --dep-cache ~/.cache/repo-scaffold-deps
+        ```
+    """
+    from repo_scaffold.depcache import prewarm as prewarm_cache
+
+    registry = get_registry()
+    template_name = registry.resolve(template)
+    if template_name is None:
+        raise click.ClickException(f"Template '{template}' not found")
+    prewarm_cache(template_name, dep_cache, engine=_lazy("RenderEngine")())
+    click.echo(f"Prewarmed {dep_cache} from {template_name}")
+
+
+@cli.command()
+@click.option("--host", default="127.0.0.1", show_default=True, help="Address to listen on")
+@click.option("--port", "-p", default=8787, show_default=True, type=click.IntRange(0, 65535), help="Port to listen on")
+@click.option(
+    "--workers",
+    "-j",
+    default=4,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of requests handled concurrently",
+)
+@click.option(
+    "--queue-size",
+    default=64,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Requests allowed to wait for a worker before new ones get 503",
+)
+@click.option(
+    "--root",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+    help="Directory generate requests may create projects under (default: only serve archives)",
+)
+@click.option(
+    "--dep-cache",
+    envvar="REPO_SCAFFOLD_DEP_CACHE",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+    help="Shared uv/pnpm/cargo cache directory for dependency installation (env: REPO_SCAFFOLD_DEP_CACHE)",
+)
+@click.option("--quiet", "-q", is_flag=True, help="Don't log every request to stderr")
+def serve(host: str, port: int, workers: int, queue_size: int, root: Path | None, dep_cache: Path | None, quiet: bool):
+    """Run an HTTP/JSON generation service with the templates kept warm.
+
+    Loads and compiles every template once, then serves ``POST /generate``
+    (an archive, or a project created under --root), ``GET /templates``,
+    ``GET /healthz`` and Prometheus ``GET /metrics`` (latency histograms,
+    queue depth, cache hit rates) from a bounded worker pool.
+
+    Example:
+        ```bash
+        $ repo-scaffold serve --port 8787 --workers 8 --root /srv/projects
+        $ curl -s localhost:8787/generate -d '{"template": "python", "answers": {"repo_name": "billing"}}' > billing.tar
+        ```
+    """
+    from repo_scaffold.depcache import dep_cache_environment
+    from repo_scaffold.serve import GenerationServer
+
+    if root is not None:
+        root.mkdir(parents=True, exist_ok=True)
+    try:
+        server = GenerationServer(
+            (host, port), engine=_lazy("RenderEngine")(), workers=workers, queue_size=queue_size, root=root, quiet=quiet
+        )
+    except OSError as error:
+        raise click.ClickException(f"Cannot listen on {host}:{port}: {error}") from error
+    with dep_cache_environment(dep_cache):  # hook 子进程继承共享依赖缓存的环境变量
+        warmed = server.warm()
+        bound_host, bound_port = server.server_address[:2]
+        click.echo(f"Warmed {len(warmed)} templates; serving on http://{bound_host}:{bound_port}", err=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            click.echo("Shutting down...", err=True)
+        finally:
+            server.server_close()
+
+
+@cli.group()
+def cache():
+    """Inspect or clear repo-scaffold's on-disk caches.
+
+    Compiled Jinja templates and rendered project trees are cached per
+    repo-scaffold version under ``$REPO_SCAFFOLD_CACHE_DIR`` (default:
+    ``~/.cache/repo-scaffold``); the rendered-tree cache is capped at
+    ``$REPO_SCAFFOLD_RENDER_CACHE_MB`` MiB (default 256).
+    """
+
+
+@cache.command("stats")
+def cache_stats_cmd():
+    """Show the location, entry count, size and hit rate of each cache."""
+    from repo_scaffold.render.cache import cache_stats
+
+    for stats in cache_stats():
+        line = f"{stats.name}: {stats.entries} entries, {stats.size_bytes / 1024:.1f} KiB"
+        if stats.hits is not None:
+            line += f", {stats.hits} hits, {stats.misses} misses"
+        click.echo(f"{line} ({stats.path})")
+
+
+@cache.command("clear")
+def cache_clear_cmd():
+    """Delete all cached data for every repo-scaffold version."""
+    from repo_scaffold.render.cache import cache_root
+    from repo_scaffold.render.cache import clear_cache
+
+    freed = clear_cache()
+    click.echo(f"Cleared {cache_root()} ({freed / 1024:.1f} KiB freed)")
 
 
 @cli.command("gh-init")
@@ -253,6 +713,19 @@ def create(template: str, output_dir: Path, no_input: bool, no_install: bool, no
     is_flag=True,
     help="Don't prompt; missing optional secrets are skipped.",
 )
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Write secrets and variables this many at a time over pooled HTTP connections (1: one by one via PyGithub).",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Print a timing breakdown of the bootstrap and write a Chrome trace "
+    "(path: $REPO_SCAFFOLD_TRACE or ./repo-scaffold-trace.json)",
+)
 def gh_init(
     project_path: Path,
     owner: str | None,
@@ -266,6 +739,8 @@ def gh_init(
     protect_branch: bool,
     force_push: bool,
     no_input: bool,
+    concurrency: int,
+    profile: bool,
 ):
     """Initialize a GitHub repository for an already-generated project.
 
@@ -297,6 +772,7 @@ def gh_init(
                 show_default=default is not None,
             )
 
+    build_config = _lazy("build_config")
     config = build_config(
         project_path=project_path,
         owner=owner,
@@ -340,7 +816,19 @@ def gh_init(
     if not no_input:
         click.confirm("Proceed?", default=True, abort=True)
 
-    result = init_repository(config, GhInitClient(token))
+    from repo_scaffold.trace import timeline
+    from repo_scaffold.trace import trace_path
+    from repo_scaffold.trace import tracing
+
+    init_repository = _lazy("init_repository")
+    path = trace_path(profile)
+    with tracing(path) as tracer:
+        if concurrency > 1:
+            with _lazy("ConcurrentGhInitClient")(token, concurrency=concurrency) as client:
+                result = init_repository(config, client)
+        else:
+            gh_init_client = _lazy("GhInitClient")
+            result = init_repository(config, gh_init_client(token))
 
     click.echo("")
     click.echo("✓ Repository ready")
@@ -364,6 +852,8 @@ def gh_init(
         click.echo(f"  Protected branch '{config.default_branch}' (PR review required)")
     elif result.protection_error:
         click.echo(f"  ⚠️  Could not protect '{config.default_branch}': {result.protection_error}")
+    if result.requests is not None:
+        click.echo(f"  API: {result.requests} requests, {result.retries} retries, {result.wait_seconds:.1f}s waiting")
     click.echo("")
     click.echo("Next steps:")
     click.echo("  1. Watch the first CI run on the Actions page above.")
@@ -377,6 +867,129 @@ def gh_init(
         click.echo("  2. After the first docs-deploy tag run, in repo Settings → Pages set")
         click.echo("     'Source: Deploy from a branch' to gh-pages / (root).")
 
+    if tracer is not None:
+        if profile:
+            click.echo("\nTimings (the docs build overlaps the steps before 'docs build wait'):", err=True)
+            for line in timeline(tracer.events):
+                click.echo(f"  {line}", err=True)
+        click.echo(f"Trace written to {path}", err=True)
+
+
+@cli.command("gh-init-batch")
+@click.argument("targets", nargs=-1, required=True, type=click.Path(exists=True, path_type=Path))
+@click.option("--owner", help="GitHub user or org for every project (default: detected per project).")
+@click.option("--private/--public", default=None, help="Repository visibility (default: public).")
+@click.option("--allow-existing", is_flag=True, help="Don't fail on repositories that already exist.")
+@click.option("--no-push", is_flag=True, help="Skip git init and push.")
+@click.option("--no-pages", is_flag=True, help="Skip deploying docs and configuring GitHub Pages.")
+@click.option("--protect-branch", is_flag=True, help="Protect each default branch (require PR review).")
+@click.option("--force-push", is_flag=True, help="Use --force when pushing the initial commits.")
+@click.option(
+    "--jobs",
+    "-j",
+    default=4,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Projects bootstrapped at once",
+)
+@click.option(
+    "--concurrency",
+    default=8,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="GitHub API requests in flight at once, across all projects",
+)
+@click.option(
+    "--rate",
+    default=10.0,
+    show_default=True,
+    type=click.FloatRange(min=0, min_open=True),
+    help="GitHub API requests per second, across all projects (rate-limit responses also pause and retry)",
+)
+@click.option("--no-input", is_flag=True, help="Don't ask for confirmation.")
+def gh_init_batch(
+    targets: tuple[Path, ...],
+    owner: str | None,
+    private: bool | None,
+    allow_existing: bool,
+    no_push: bool,
+    no_pages: bool,
+    protect_branch: bool,
+    force_push: bool,
+    jobs: int,
+    concurrency: int,
+    rate: float,
+    no_input: bool,
+):
+    """Initialize GitHub repositories for many generated projects at once.
+
+    TARGETS are project directories, or ``.toml``/``.json``/``.yaml``
+    manifests with a ``projects`` list of ``path`` entries (plus optional
+    per-project ``gh-init`` options and a ``defaults`` table). Flags given
+    here apply to every project; a manifest entry's own options win over them.
+
+    Secrets and variables are read from the environment and each project's
+    ``.env`` without prompting. All projects share one authenticated client
+    and HTTP connection pool, and up to ``--jobs`` of them are bootstrapped
+    at once, so one project's push overlaps the API calls of the others.
+    Requests are paced to ``--rate`` per second and rate-limited ones are
+    retried after the wait GitHub asks for. A summary table is printed at the
+    end; exits non-zero if any project failed.
+
+    Example:
+        ```bash
+        $ repo-scaffold gh-init-batch services/billing services/gateway --owner my-org --no-input
+        ```
+    """
+    import time
+
+    from repo_scaffold.github_init import format_batch_results
+    from repo_scaffold.github_init import load_targets
+    from repo_scaffold.github_init import run_gh_init_batch
+
+    token = os.environ.get("GITHUB_TOKEN", "").strip()
+    if not token:
+        raise click.ClickException(
+            "GITHUB_TOKEN environment variable is required (see `repo-scaffold gh-init --help`)."
+        )
+
+    flags = {
+        "owner": owner,
+        "private": private,
+        "allow_existing": allow_existing or None,
+        "push": False if no_push else None,
+        "setup_pages": False if no_pages else None,
+        "protect_branch": protect_branch or None,
+        "force_push": force_push or None,
+    }
+    entries = load_targets(targets, {key: value for key, value in flags.items() if value is not None})
+    build_config = _lazy("build_config")
+    configs = [build_config(entry.project_path, **entry.options) for entry in entries]
+
+    click.echo(f"Will create or update {len(configs)} repositories:")
+    for config in configs:
+        visibility = "private" if config.private else "public"
+        click.echo(
+            f"  {config.owner or '<authenticated user>'}/{config.name} ({visibility}, "
+            f"{len(config.secrets)} secrets, {len(config.variables)} variables) <- {config.project_path}"
+        )
+    click.echo("")
+    if not no_input:
+        click.confirm("Proceed?", default=True, abort=True)
+
+    start = time.perf_counter()
+    with _lazy("ConcurrentGhInitClient")(token, concurrency=concurrency, rate=rate) as client:
+        results = run_gh_init_batch(configs, client, jobs=jobs)
+    wall_seconds = time.perf_counter() - start
+
+    click.echo("")
+    for line in format_batch_results(results, wall_seconds=wall_seconds):
+        click.echo(line)
+
+    failed = sum(not result.ok for result in results)
+    if failed:
+        raise click.ClickException(f"{failed} of {len(results)} projects failed")
+
 
 @cli.command("add-package")
 @click.argument("name")
@@ -0,0 +1,97 @@
+"""Shared dependency caches for post-generation installs.
+
+Every template's post-gen hook ends with a cold ``uv sync``, ``pnpm install``
+or ``cargo build``. With ``--dep-cache DIR`` (or ``$REPO_SCAFFOLD_DEP_CACHE``)
+those tools are pointed at one shared directory, so a new project mostly
+links packages that an earlier project, or ``repo-scaffold prewarm``,
+already downloaded and built::
+
+    DIR/
+        uv/             UV_CACHE_DIR, installed with UV_LINK_MODE=hardlink
+        pnpm-store/     pnpm's content-addressed store (npm_config_store_dir)
+        cargo-target/   CARGO_TARGET_DIR for the hook's ``cargo build``
+        sccache/        SCCACHE_DIR, only when ``sccache`` is on PATH
+
+The hooks run inside repo-scaffold and the installers they start inherit its
+environment, so the cache is applied by setting these variables around
+generation; nothing in the templates changes. Keep ``DIR`` on the same
+filesystem as the generated projects, otherwise uv and pnpm fall back to
+copying.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+
+DEP_CACHE_ENV_VAR = "REPO_SCAFFOLD_DEP_CACHE"
+
+
+def dep_cache_env(cache_dir: Path) -> dict[str, str]:
+    """Return the environment variables that point uv, pnpm and cargo at ``cache_dir``."""
+    cache_dir = Path(cache_dir).expanduser().resolve()
+    env = {
+        "UV_CACHE_DIR": str(cache_dir / "uv"),
+        "UV_LINK_MODE": "hardlink",
+        "npm_config_store_dir": str(cache_dir / "pnpm-store"),
+        "CARGO_TARGET_DIR": str(cache_dir / "cargo-target"),
+    }
+    if shutil.which("sccache") and not os.environ.get("RUSTC_WRAPPER"):
+        env["RUSTC_WRAPPER"] = "sccache"
+        env["SCCACHE_DIR"] = str(cache_dir / "sccache")
+    return env
+
+
+@contextmanager
+def dep_cache_environment(cache_dir: Path | None) -> Iterator[dict[str, str]]:
+    """Apply :func:`dep_cache_env` to ``os.environ`` for the duration of the block.
+
+    ``None`` leaves the environment untouched, so callers can pass an optional
+    ``--dep-cache`` value straight through. Previous values are restored on exit.
+    """
+    if cache_dir is None:
+        yield {}
+        return
+    env = dep_cache_env(cache_dir)
+    Path(cache_dir).expanduser().mkdir(parents=True, exist_ok=True)
+    saved = {name: os.environ.get(name) for name in env}
+    os.environ.update(env)
+    try:
+        yield env
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def prewarm(template: str, cache_dir: Path, *, engine: Any = None) -> None:
+    """Fill ``cache_dir`` by generating ``template`` with its defaults and installing it.
+
+    The project is rendered into a temporary directory (without ``git init``)
+    and discarded afterwards; only what the install left in the shared caches
+    is kept.
+
+    Args:
+        template: Template name, title or path.
+        cache_dir: Dependency cache directory to fill.
+        engine: Render engine to use (defaults to a new ``RenderEngine``).
+    """
+    if engine is None:
+        from repo_scaffold.render import RenderEngine
+
+        engine = RenderEngine()
+    with dep_cache_environment(cache_dir), tempfile.TemporaryDirectory(prefix="repo-scaffold-prewarm-") as tmp:
+        engine.generate(
+            template,
+            output_dir=Path(tmp),
+            extra_context={"install_after_generate": "yes", "init_git": "no"},
+            no_input=True,
+        )
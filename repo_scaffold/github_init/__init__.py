@@ -8,6 +8,16 @@ Three layers, split across this package:
 - :mod:`repo_scaffold.github_init.client` — ``GhInitClient``, a thin wrapper
   around PyGithub so tests can swap the whole client out without monkey-patching
   the SDK.
+- :mod:`repo_scaffold.github_init.async_client` — ``ConcurrentGhInitClient``,
+  the same surface over pooled ``httpx`` connections, writing all secrets and
+  variables concurrently.
+- :mod:`repo_scaffold.github_init.batch` — ``load_targets`` and
+  ``run_gh_init_batch`` bootstrap many projects through one shared client.
+- :mod:`repo_scaffold.github_init.scheduler` — ``RateLimitTransport`` paces,
+  pauses and retries the concurrent client's requests and counts them.
+- :mod:`repo_scaffold.github_init.docs` — ``start_docs_build`` builds the docs
+  in the background while the bootstrap runs; ``publish_docs`` pushes the
+  built site to ``gh-pages``.
 - this module — ``init_repository`` orchestrates the calls and returns the URLs
   the CLI prints back to the user, plus the ``git_push``/``deploy_docs``
   subprocess helpers.
@@ -25,7 +35,17 @@ from pathlib import Path
 
 from github import GithubException
 
+from repo_scaffold.trace import span
+
+from .async_client import AsyncGhInitClient
+from .async_client import ConcurrentGhInitClient
+from .batch import GhInitBatchEntry
+from .batch import GhInitBatchResult
+from .batch import format_batch_results
+from .batch import load_targets
+from .batch import run_gh_init_batch
 from .client import GhInitClient
+from .config import BRANCH_PROTECTION
 from .config import DEFAULT_SECRET_KEYS
 from .config import DEFAULT_VARIABLE_KEYS
 from .config import PAGES_BRANCH
@@ -36,6 +56,14 @@ from .config import detect_default_branch
 from .config import detect_owner
 from .config import load_pyproject
 from .config import parse_dotenv
+from .docs import DOCS_BUILD_COMMAND
+from .docs import DocsBuild
+from .docs import _git_auth_args
+from .docs import publish_docs
+from .docs import start_docs_build
+from .scheduler import RateLimitTransport
+from .scheduler import RequestStats
+from .scheduler import track_requests
 
 
 # GitHub Actions recognizes this marker in commit messages and skips
@@ -45,23 +73,38 @@ INITIAL_COMMIT_USER = "repo-scaffold"
 INITIAL_COMMIT_EMAIL = "repo-scaffold@users.noreply.github.com"
 
 __all__ = [
+    "BRANCH_PROTECTION",
     "DEFAULT_SECRET_KEYS",
     "DEFAULT_VARIABLE_KEYS",
+    "DOCS_BUILD_COMMAND",
     "INITIAL_COMMIT_EMAIL",
     "INITIAL_COMMIT_MESSAGE",
     "INITIAL_COMMIT_USER",
     "PAGES_BRANCH",
+    "AsyncGhInitClient",
+    "ConcurrentGhInitClient",
+    "DocsBuild",
+    "GhInitBatchEntry",
+    "GhInitBatchResult",
     "GhInitClient",
     "GhInitConfig",
     "GhInitResult",
+    "RateLimitTransport",
+    "RequestStats",
     "build_config",
     "deploy_docs",
     "detect_default_branch",
     "detect_owner",
+    "format_batch_results",
     "git_push",
     "init_repository",
     "load_pyproject",
+    "load_targets",
     "parse_dotenv",
+    "publish_docs",
+    "run_gh_init_batch",
+    "start_docs_build",
+    "track_requests",
 ]
 
 
@@ -112,6 +155,35 @@ def _git(project_path: Path, *args: str) -> subprocess.CompletedProcess[str]:
     )
 
 
+def _commit_initial(project_path: Path) -> None:
+    """Run ``git init`` if needed and commit the whole tree when there is no HEAD yet."""
+    if not (project_path / ".git").exists():
+        subprocess.run(["git", "init", str(project_path)], check=True, capture_output=True, text=True)
+
+    head_exists = (
+        subprocess.run(
+            ["git", "-C", str(project_path), "rev-parse", "--verify", "HEAD"],
+            check=False,
+            capture_output=True,
+            text=True,
+        ).returncode
+        == 0
+    )
+
+    if not head_exists:
+        _git(project_path, "add", "-A")
+        _git(
+            project_path,
+            "-c",
+            f"user.name={INITIAL_COMMIT_USER}",
+            "-c",
+            f"user.email={INITIAL_COMMIT_EMAIL}",
+            "commit",
+            "-m",
+            INITIAL_COMMIT_MESSAGE,
+        )
+
+
 def git_push(
     project_path: Path,
     remote_url: str,
@@ -138,31 +210,7 @@ def git_push(
     being written to ``.git/config``.
     """
     try:
-        if not (project_path / ".git").exists():
-            subprocess.run(["git", "init", str(project_path)], check=True, capture_output=True, text=True)
-
-        head_exists = (
-            subprocess.run(
-                ["git", "-C", str(project_path), "rev-parse", "--verify", "HEAD"],
-                check=False,
-                capture_output=True,
-                text=True,
-            ).returncode
-            == 0
-        )
-
-        if not head_exists:
-            _git(project_path, "add", "-A")
-            _git(
-                project_path,
-                "-c",
-                f"user.name={INITIAL_COMMIT_USER}",
-                "-c",
-                f"user.email={INITIAL_COMMIT_EMAIL}",
-                "commit",
-                "-m",
-                INITIAL_COMMIT_MESSAGE,
-            )
+        _commit_initial(project_path)
 
         _git(project_path, "branch", "-M", branch)
 
@@ -175,11 +223,7 @@ def git_push(
         )
         _git(project_path, "remote", "add", "origin", remote_url)
 
-        push_args: list[str] = []
-        if token:
-            creds = base64.b64encode(f"x-access-token:{token}".encode()).decode()
-            push_args += ["-c", f"http.extraheader=Authorization: Basic {creds}"]
-        push_args += ["push", "-u"]
+        push_args = [*_git_auth_args(token), "push", "-u"]
         if force:
             push_args.append("--force")
         push_args += ["origin", branch]
@@ -188,30 +232,85 @@ def git_push(
         raise RuntimeError("`git` was not found on PATH; install git before running gh-init.") from exc
 
 
-def init_repository(config: GhInitConfig, client: GhInitClient) -> GhInitResult:
-    """Apply the config to GitHub and (optionally) push the initial commit."""
-    client.authenticated_login()
-    repo = client.get_or_create_repo(
-        config.owner,
-        config.name,
-        description=config.description,
-        private=config.private,
-        allow_existing=config.allow_existing,
-    )
-    for secret_name, value in config.secrets.items():
-        client.set_secret(repo, secret_name, value)
-    for variable_name, value in config.variables.items():
-        client.set_variable(repo, variable_name, value)
+def init_repository(config: GhInitConfig, client: GhInitClient | ConcurrentGhInitClient) -> GhInitResult:
+    """Apply the config to GitHub and (optionally) push the initial commit.
+
+    The result also carries this bootstrap's request, retry and wait counters
+    when the client counts its requests (both real clients do). Each step is
+    recorded as a :func:`repo_scaffold.trace.span` when tracing is on.
+    """
+    with track_requests() as stats, span("gh-init", project=config.name):
+        result = _bootstrap(config, client)
+    if hasattr(client, "stats"):
+        result.requests, result.retries, result.wait_seconds = stats.requests, stats.retries, stats.wait_seconds
+    return result
+
+
+def _bootstrap(config: GhInitConfig, client: GhInitClient | ConcurrentGhInitClient) -> GhInitResult:
+    # Decide up front what the bootstrap will do. The docs build is the slowest
+    # step and needs nothing from GitHub, so it starts right after the local
+    # initial commit and runs alongside repo creation, secrets and the push;
+    # only publishing it waits for them.
+    has_docs = (config.project_path / "mkdocs.yml").is_file()
+    setup_pages = config.setup_pages and config.push and has_docs
+    docs_build = None
+    if setup_pages:
+        # Commit first: `uv run` inside the build can write uv.lock and .venv/
+        # into the project, and the push must not depend on how far it got.
+        with span("commit"):
+            try:
+                _commit_initial(config.project_path)
+            except FileNotFoundError as exc:
+                raise RuntimeError("`git` was not found on PATH; install git before running gh-init.") from exc
+        docs_build = start_docs_build(config.project_path)
+    try:
+        return _configure(config, client, setup_pages=setup_pages, docs_build=docs_build)
+    finally:
+        if docs_build is not None:
+            docs_build.cancel()  # still running only if the bootstrap failed first
+
+
+def _configure(
+    config: GhInitConfig,
+    client: GhInitClient | ConcurrentGhInitClient,
+    *,
+    setup_pages: bool,
+    docs_build: DocsBuild | None,
+) -> GhInitResult:
+    # Writes that can be merged are: the docs URL goes into the create request
+    # instead of a later edit.
+    with span("login"):
+        login = client.authenticated_login()
+    planned_pages_url = f"https://{config.owner or login}.github.io/{config.name}"
+    with span("create repo"):
+        repo = client.get_or_create_repo(
+            config.owner,
+            config.name,
+            description=config.description,
+            private=config.private,
+            allow_existing=config.allow_existing,
+            homepage=planned_pages_url if setup_pages else None,
+        )
+    with span("secrets and variables"):
+        if hasattr(client, "set_actions_settings"):
+            # Clients that can write concurrently (ConcurrentGhInitClient) get all of them at once.
+            client.set_actions_settings(repo, config.secrets, config.variables)
+        else:
+            for secret_name, value in config.secrets.items():
+                client.set_secret(repo, secret_name, value)
+            for variable_name, value in config.variables.items():
+                client.set_variable(repo, variable_name, value)
 
     pushed = False
     if config.push:
-        git_push(
-            project_path=config.project_path,
-            remote_url=repo.clone_url,
-            branch=config.default_branch,
-            force=config.force_push,
-            token=client.token,
-        )
+        with span("push"):
+            git_push(
+                project_path=config.project_path,
+                remote_url=repo.clone_url,
+                branch=config.default_branch,
+                force=config.force_push,
+                token=client.token,
+            )
         pushed = True
 
     owner_login = repo.owner.login
@@ -219,24 +318,42 @@ def init_repository(config: GhInitConfig, client: GhInitClient) -> GhInitResult:
     actions_url = f"{html_url}/actions"
     pages_url = f"https://{owner_login}.github.io/{repo.name}"
 
-    # Build and publish the docs with `mkdocs gh-deploy` (which creates the
-    # gh-pages branch with the real styled site + .nojekyll), then enable Pages
-    # on it and point the repo's Website at the docs URL. Needs the push to have
-    # happened and the project to actually have docs (mkdocs.yml). Any failure
-    # is surfaced but never aborts a bootstrap that already created and pushed.
+    # Publish the docs built in the background to the gh-pages branch (with
+    # .nojekyll), or build and publish them now with `mkdocs gh-deploy` when
+    # the project cannot be built ahead, then enable Pages on it and point the
+    # repo's Website at the docs URL, unless it was set on creation. Needs the
+    # push to have happened and the project to actually have docs
+    # (mkdocs.yml). Any failure is surfaced but never aborts a bootstrap that
+    # already created and pushed; a Website the create request pointed at the
+    # docs is cleared again, so the repo never links to a missing site.
     pages_configured = False
-    homepage_set = False
+    homepage_preset = setup_pages and repo.homepage == pages_url
+    homepage_set = homepage_preset
     pages_error: str | None = None
-    has_docs = (config.project_path / "mkdocs.yml").is_file()
-    if config.setup_pages and pushed and has_docs:
+    if setup_pages:
         try:
-            deploy_docs(config.project_path, token=client.token)
-            client.enable_pages(repo, PAGES_BRANCH)
+            if docs_build is not None:
+                with span("docs build wait"):
+                    site_dir = docs_build.wait()
+                with span("docs publish"):
+                    publish_docs(config.project_path, site_dir, token=client.token)
+            else:
+                with span("docs deploy"):
+                    deploy_docs(config.project_path, token=client.token)
+            with span("enable pages"):
+                client.enable_pages(repo, PAGES_BRANCH)
             pages_configured = True
-            client.set_homepage(repo, pages_url)
-            homepage_set = True
+            if not homepage_set:
+                client.set_homepage(repo, pages_url)
+                homepage_set = True
         except (GithubException, RuntimeError) as exc:
             pages_error = _github_error_message(exc) if isinstance(exc, GithubException) else str(exc)
+            homepage_set = False
+            if homepage_preset and client.created(repo):
+                try:
+                    client.set_homepage(repo, "")
+                except GithubException as clear_exc:
+                    pages_error += f" (clearing the Website also failed: {_github_error_message(clear_exc)})"
 
     # Branch protection also needs the branch to exist on the remote. Like
     # Pages, a failure (e.g. private repo on a free plan, or a token without
@@ -245,7 +362,8 @@ def init_repository(config: GhInitConfig, client: GhInitClient) -> GhInitResult:
     protection_error: str | None = None
     if config.protect_branch and pushed:
         try:
-            client.protect_branch(repo, config.default_branch)
+            with span("protect branch"):
+                client.protect_branch(repo, config.default_branch)
             branch_protected = True
         except GithubException as exc:
             protection_error = _github_error_message(exc)
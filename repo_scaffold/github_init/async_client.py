@@ -0,0 +1,405 @@
+"""Concurrent ``httpx`` client for gh-init, a drop-in for ``GhInitClient``.
+
+``GhInitClient`` goes through synchronous PyGithub, so every secret and
+variable is written strictly one after another. This module talks to the
+REST API directly instead:
+
+- :class:`AsyncGhInitClient` is the coroutine API. It holds one pooled
+  ``httpx.AsyncClient`` (keep-alive, at most ``concurrency`` connections),
+  fetches each repository's Actions public key once, and
+  :meth:`~AsyncGhInitClient.set_actions_settings` writes all secrets and
+  variables concurrently, bounded by a semaphore.
+- Every request goes through the rate-limit-aware scheduler of
+  :mod:`repo_scaffold.github_init.scheduler` (pacing, ``Retry-After``,
+  jittered retries).
+- :class:`ConcurrentGhInitClient` wraps it behind the exact synchronous
+  ``GhInitClient`` method surface (running it on a private event-loop thread), so
+  ``init_repository`` and its tests can swap one for the other.
+
+Errors are raised as ``github.GithubException`` like PyGithub does, so the
+orchestrator's error handling is the same for both clients. Secrets are
+sealed with PyGithub's ``encrypt`` helper (libsodium sealed boxes).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Coroutine
+from dataclasses import dataclass
+from typing import Any
+from typing import TypeVar
+from urllib.parse import quote
+
+import httpx
+from github import GithubException
+from github.PublicKey import encrypt
+
+from .config import BRANCH_PROTECTION
+from .scheduler import DEFAULT_RATE
+from .scheduler import RateLimitTransport
+from .scheduler import RequestStats
+
+
+API_URL = "https://api.github.com"
+API_VERSION = "2022-11-28"
+DEFAULT_CONCURRENCY = 8
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class RepoOwner:
+    """The owner of a :class:`RepoRef`."""
+
+    login: str
+
+
+@dataclass(frozen=True)
+class RepoRef:
+    """The repository fields gh-init reads, in place of PyGithub's ``Repository``."""
+
+    full_name: str
+    name: str
+    owner: RepoOwner
+    url: str  # REST API URL
+    html_url: str
+    clone_url: str
+    homepage: str | None = None
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> RepoRef:
+        """Build from a REST ``repository`` object."""
+        return cls(
+            full_name=data["full_name"],
+            name=data["name"],
+            owner=RepoOwner(data["owner"]["login"]),
+            url=data["url"],
+            html_url=data["html_url"],
+            clone_url=data["clone_url"],
+            homepage=data.get("homepage"),
+        )
+
+
+class AsyncGhInitClient:
+    """Coroutine counterpart of ``GhInitClient`` over one pooled HTTP connection set."""
+
+    def __init__(
+        self,
+        token: str,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate: float = DEFAULT_RATE,
+        base_url: str = API_URL,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """Construct a client for ``token``.
+
+        Args:
+            token: Personal access token.
+            concurrency: Most requests (and connections) in flight at once.
+            rate: Requests per second the scheduler paces to (see
+                :class:`~repo_scaffold.github_init.scheduler.RateLimitTransport`).
+            base_url: REST API root (GitHub Enterprise, or a test server).
+            transport: Custom ``httpx`` transport under the scheduler (tests).
+        """
+        self._token = token
+        self._fetched: dict[str, asyncio.Future[Any]] = {}
+        self._created: set[str] = set()  # full names of repos this client created
+        self._semaphore = asyncio.Semaphore(concurrency)
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        self.scheduler = RateLimitTransport(transport or httpx.AsyncHTTPTransport(limits=limits), rate=rate)
+        self._http = httpx.AsyncClient(
+            base_url=base_url,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": API_VERSION,
+                "User-Agent": "repo-scaffold",
+            },
+            timeout=httpx.Timeout(30.0),
+            transport=self.scheduler,
+        )
+
+    @property
+    def token(self) -> str:
+        """The personal access token this client authenticates with (see ``GhInitClient.token``)."""
+        return self._token
+
+    @property
+    def stats(self) -> RequestStats:
+        """Requests, retries and seconds waited so far, across every caller."""
+        return self.scheduler.stats
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        await self._http.aclose()
+
+    async def _request(
+        self, method: str, path: str, payload: dict[str, Any] | None = None, params: dict[str, Any] | None = None
+    ) -> Any:
+        """Send one request; return the decoded JSON body (``None`` if empty).
+
+        Raises:
+            GithubException: On any 4xx/5xx response.
+        """
+        async with self._semaphore:
+            response = await self._http.request(method, path, json=payload, params=params)
+        if response.is_error:
+            try:
+                data = response.json()
+            except ValueError:
+                data = {"message": response.text}
+            raise GithubException(response.status_code, data, dict(response.headers))
+        return response.json() if response.content else None
+
+    async def _once(self, key: str, fetch: Callable[[], Awaitable[_T]]) -> _T:
+        """Await ``fetch()`` once per ``key``; concurrent and later callers share its result.
+
+        A failed fetch is forgotten, so a later call tries again.
+        """
+        future = self._fetched.get(key)
+        if future is None:
+            future = self._fetched[key] = asyncio.ensure_future(fetch())
+        try:
+            return await asyncio.shield(future)
+        except Exception:
+            if self._fetched.get(key) is future:
+                del self._fetched[key]
+            raise
+
+    async def authenticated_login(self) -> str:
+        """Return the login of the token's user. Raises on a bad token."""
+
+        async def fetch() -> str:
+            return (await self._request("GET", "/user"))["login"]
+
+        return await self._once("user", fetch)
+
+    async def get_or_create_repo(
+        self,
+        owner: str | None,
+        name: str,
+        *,
+        description: str,
+        private: bool,
+        allow_existing: bool,
+        homepage: str | None = None,
+    ) -> RepoRef:
+        """Create the repo on the right account, or look it up if already there.
+
+        ``homepage`` is sent with the create request (see ``GhInitClient.get_or_create_repo``).
+        """
+        login = await self.authenticated_login()
+        target_owner = owner or login
+        path = "/user/repos" if not owner or owner == login else f"/orgs/{owner}/repos"
+        payload: dict[str, Any] = {
+            "name": name,
+            "description": description or "",
+            "private": private,
+            "auto_init": False,
+        }
+        if homepage:
+            payload["homepage"] = homepage
+        try:
+            repo = RepoRef.from_json(await self._request("POST", path, payload))
+        except GithubException as exc:
+            if exc.status == 422 and allow_existing:
+                return RepoRef.from_json(await self._request("GET", f"/repos/{target_owner}/{name}"))
+            raise
+        self._created.add(repo.full_name)
+        return repo
+
+    def created(self, repo: RepoRef) -> bool:
+        """Whether this client created ``repo`` (rather than finding it already there)."""
+        return repo.full_name in self._created
+
+    async def _public_key(self, repo: RepoRef) -> tuple[str, str]:
+        """Return the repo's Actions ``(key_id, key)``, fetching it once per client."""
+
+        async def fetch() -> tuple[str, str]:
+            data = await self._request("GET", f"/repos/{repo.full_name}/actions/secrets/public-key")
+            return data["key_id"], data["key"]
+
+        return await self._once(f"public-key:{repo.full_name}", fetch)
+
+    async def set_secret(self, repo: RepoRef, name: str, value: str) -> None:
+        """Create or replace an Actions secret, sealed with the repo's public key."""
+        key_id, key = await self._public_key(repo)
+        payload = {"encrypted_value": encrypt(key, value), "key_id": key_id}
+        await self._request("PUT", f"/repos/{repo.full_name}/actions/secrets/{quote(name, safe='')}", payload)
+
+    async def _existing_variables(self, repo: RepoRef) -> set[str]:
+        """Names of the repo's Actions variables, listed once (never for a repo created here)."""
+
+        async def fetch() -> set[str]:
+            names: set[str] = set()
+            if repo.full_name in self._created:
+                return names
+            page = 1
+            while True:
+                params = {"per_page": 100, "page": page}
+                data = await self._request("GET", f"/repos/{repo.full_name}/actions/variables", params=params)
+                names.update(variable["name"] for variable in data["variables"])
+                if len(names) >= data["total_count"] or not data["variables"]:
+                    return names
+                page += 1
+
+        return await self._once(f"variables:{repo.full_name}", fetch)
+
+    async def set_variable(self, repo: RepoRef, name: str, value: str) -> None:
+        """Create an Actions variable, or update it in place if it exists (one POST or one PATCH)."""
+        existing = await self._existing_variables(repo)
+        payload = {"name": name, "value": value}
+        if name not in existing:
+            try:
+                await self._request("POST", f"/repos/{repo.full_name}/actions/variables", payload)
+            except GithubException as exc:
+                if exc.status not in (409, 422):
+                    raise
+            else:
+                existing.add(name)
+                return
+        await self._request("PATCH", f"/repos/{repo.full_name}/actions/variables/{quote(name, safe='')}", payload)
+        existing.add(name)
+
+    async def set_actions_settings(self, repo: RepoRef, secrets: dict[str, str], variables: dict[str, str]) -> None:
+        """Write all secrets and variables concurrently (at most ``concurrency`` requests at once).
+
+        Every write is attempted; the first failure is then re-raised.
+        """
+        writes = [self.set_secret(repo, name, value) for name, value in secrets.items()]
+        writes += [self.set_variable(repo, name, value) for name, value in variables.items()]
+        results = await asyncio.gather(*writes, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def set_homepage(self, repo: RepoRef, url: str) -> None:
+        """Point the repository's ``Website`` field at the docs URL."""
+        await self._request("PATCH", f"/repos/{repo.full_name}", {"homepage": url})
+
+    async def enable_pages(self, repo: RepoRef, branch: str, path: str = "/") -> None:
+        """Configure GitHub Pages to deploy from ``branch``/``path`` (see ``GhInitClient.enable_pages``)."""
+        payload = {"source": {"branch": branch, "path": path}}
+        if repo.full_name in self._created:
+            first, fallback, retry_on = "POST", "PUT", (409, 422)
+        else:
+            first, fallback, retry_on = "PUT", "POST", (400, 404, 422)
+        try:
+            await self._request(first, f"/repos/{repo.full_name}/pages", payload)
+        except GithubException as exc:
+            if exc.status in retry_on:
+                await self._request(fallback, f"/repos/{repo.full_name}/pages", payload)
+                return
+            raise
+
+    async def protect_branch(self, repo: RepoRef, branch: str) -> None:
+        """Enable branch protection on ``branch`` with ``BRANCH_PROTECTION``."""
+        await self._request(
+            "PUT", f"/repos/{repo.full_name}/branches/{quote(branch, safe='')}/protection", BRANCH_PROTECTION
+        )
+
+
+class ConcurrentGhInitClient:
+    """Synchronous ``GhInitClient`` surface over :class:`AsyncGhInitClient`.
+
+    Calls are run on an event loop owned by a background thread, so the
+    pooled connections, the login and the cached public keys survive between
+    calls, and one client can be shared by threads working on different
+    repositories (``gh-init-batch``): their requests interleave on the one
+    pool. Use as a context manager (or call :meth:`close`) to release it.
+    """
+
+    def __init__(self, token: str, **kwargs: Any):
+        """Construct a client; ``kwargs`` are passed to :class:`AsyncGhInitClient`."""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="gh-init-http", daemon=True)
+        self._thread.start()
+        self._async = self._run(self._create(token, kwargs))
+
+    @staticmethod
+    async def _create(token: str, kwargs: dict[str, Any]) -> AsyncGhInitClient:
+        # Built inside the loop so the semaphore and the pool belong to it.
+        return AsyncGhInitClient(token, **kwargs)
+
+    def _run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def __enter__(self) -> ConcurrentGhInitClient:
+        """Return the client itself."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the client."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled connections and stop the event loop."""
+        try:
+            self._run(self._async.aclose())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+    @property
+    def token(self) -> str:
+        """The personal access token this client authenticates with."""
+        return self._async.token
+
+    @property
+    def stats(self) -> RequestStats:
+        """Requests, retries and seconds waited so far, across every caller."""
+        return self._async.stats
+
+    def authenticated_login(self) -> str:
+        """Return the login of the token's user. Raises on a bad token."""
+        return self._run(self._async.authenticated_login())
+
+    def get_or_create_repo(
+        self,
+        owner: str | None,
+        name: str,
+        *,
+        description: str,
+        private: bool,
+        allow_existing: bool,
+        homepage: str | None = None,
+    ) -> RepoRef:
+        """Create the repo on the right account, or look it up if already there."""
+        return self._run(
+            self._async.get_or_create_repo(
+                owner, name, description=description, private=private, allow_existing=allow_existing, homepage=homepage
+            )
+        )
+
+    def created(self, repo: RepoRef) -> bool:
+        """Whether this client created ``repo`` (rather than finding it already there)."""
+        return self._async.created(repo)
+
+    def set_secret(self, repo: RepoRef, name: str, value: str) -> None:
+        """Create or replace an Actions secret."""
+        self._run(self._async.set_secret(repo, name, value))
+
+    def set_variable(self, repo: RepoRef, name: str, value: str) -> None:
+        """Create an Actions variable, updating it if it exists."""
+        self._run(self._async.set_variable(repo, name, value))
+
+    def set_actions_settings(self, repo: RepoRef, secrets: dict[str, str], variables: dict[str, str]) -> None:
+        """Write all secrets and variables concurrently."""
+        self._run(self._async.set_actions_settings(repo, secrets, variables))
+
+    def set_homepage(self, repo: RepoRef, url: str) -> None:
+        """Point the repository's ``Website`` field at the docs URL."""
+        self._run(self._async.set_homepage(repo, url))
+
+    def enable_pages(self, repo: RepoRef, branch: str, path: str = "/") -> None:
+        """Configure GitHub Pages to deploy from ``branch``/``path``."""
+        self._run(self._async.enable_pages(repo, branch, path))
+
+    def protect_branch(self, repo: RepoRef, branch: str) -> None:
+        """Enable branch protection on ``branch``."""
+        self._run(self._async.protect_branch(repo, branch))
@@ -0,0 +1,218 @@
+"""Batch bootstrap for ``repo-scaffold gh-init-batch``.
+
+Targets are project directories, or manifests listing them. Manifests use the
+formats of ``create-batch`` manifests (TOML, JSON or YAML) and one shape::
+
+    [defaults]                      # optional, applied to every entry
+    owner = "my-org"
+    private = true
+
+    [[projects]]
+    path = "services/billing"
+
+    [[projects]]
+    path = "services/gateway"
+    name = "edge-gateway"
+    setup_pages = false
+
+Besides ``path`` (relative paths are resolved against the manifest's
+directory) an entry takes the ``build_config`` options in ``MANIFEST_KEYS``.
+
+Every project is configured without prompting: secrets and variables come
+from the environment and each project's ``.env``. The projects then go
+through ``init_repository`` on a thread pool that shares one
+``ConcurrentGhInitClient``, i.e. one login and one pool of keep-alive
+connections. With several projects in flight, one project's ``git push`` or
+docs deploy (subprocesses) overlaps the API calls of the others, so the
+creation, secrets, push, Pages and protection steps pipeline across projects.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+
+import click
+from github import GithubException
+
+from .async_client import ConcurrentGhInitClient
+from .config import GhInitConfig
+from .config import GhInitResult
+
+
+MANIFEST_KEYS = frozenset(
+    {
+        "owner",
+        "name",
+        "description",
+        "private",
+        "default_branch",
+        "push",
+        "force_push",
+        "allow_existing",
+        "setup_pages",
+        "protect_branch",
+    }
+)
+
+
+@dataclass
+class GhInitBatchEntry:
+    """One project to bootstrap, with its ``build_config`` options."""
+
+    project_path: Path
+    options: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class GhInitBatchResult:
+    """Outcome of one project in a batch."""
+
+    config: GhInitConfig
+    seconds: float
+    result: GhInitResult | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the repository was created (Pages or protection warnings aside)."""
+        return self.error is None
+
+
+def _check_options(options: dict[str, Any], where: str) -> dict[str, Any]:
+    unknown = sorted(set(options) - MANIFEST_KEYS)
+    if unknown:
+        raise click.ClickException(f"{where}: unknown option(s) {', '.join(unknown)}")
+    return options
+
+
+def load_targets(targets: Iterable[Path], options: dict[str, Any] | None = None) -> list[GhInitBatchEntry]:
+    """Resolve project directories and manifests to entries, in order and without duplicates.
+
+    Args:
+        targets: Project directories or manifest files.
+        options: ``build_config`` options for every project (e.g. from CLI
+            flags). They override a manifest's ``defaults``; a manifest entry's
+            own options override them.
+
+    Raises:
+        click.ClickException: When a manifest is malformed.
+    """
+    from repo_scaffold.render.batch import read_manifest
+
+    options = _check_options(dict(options or {}), "options")
+    entries: dict[Path, GhInitBatchEntry] = {}
+    for target in targets:
+        target = Path(target)
+        if target.is_dir():
+            entries.setdefault(target.resolve(), GhInitBatchEntry(target.resolve(), dict(options)))
+            continue
+        data = read_manifest(target)
+        defaults = _check_options(dict(data.get("defaults") or {}), f"{target}: defaults")
+        projects = data.get("projects")
+        if not isinstance(projects, list) or not projects:
+            raise click.ClickException(f"{target}: expected a non-empty 'projects' list")
+        for index, project in enumerate(projects, start=1):
+            if not isinstance(project, dict):
+                raise click.ClickException(f"{target}: project #{index} must be a table with a 'path'")
+            project = dict(project)
+            if not project.get("path"):
+                raise click.ClickException(f"{target}: project #{index} has no 'path'")
+            path = Path(project.pop("path"))
+            path = (path if path.is_absolute() else target.resolve().parent / path).resolve()
+            if not path.is_dir():
+                raise click.ClickException(f"{target}: project #{index}: {path} is not a directory")
+            own = _check_options(project, f"{target}: project #{index}")
+            entries.setdefault(path, GhInitBatchEntry(path, {**defaults, **options, **own}))
+    return [*entries.values()]
+
+
+def run_gh_init_batch(
+    configs: Iterable[GhInitConfig],
+    client: ConcurrentGhInitClient,
+    *,
+    jobs: int = 4,
+    on_result: Callable[[GhInitBatchResult], None] | None = None,
+) -> list[GhInitBatchResult]:
+    """Bootstrap every project with one shared client; return results in input order.
+
+    Args:
+        configs: Resolved configurations, one per project.
+        client: Client shared by all projects (thread-safe).
+        jobs: Projects in flight at once.
+        on_result: Called with each result, in input order, once it and every
+            earlier project have finished.
+
+    A failing project does not stop the batch; the error is recorded on its result.
+    """
+    from . import _github_error_message
+    from . import init_repository
+
+    def run(config: GhInitConfig) -> GhInitBatchResult:
+        start = time.perf_counter()
+        try:
+            result = init_repository(config, client)
+        except Exception as exc:
+            error = _github_error_message(exc) if isinstance(exc, GithubException) else str(exc) or type(exc).__name__
+            return GhInitBatchResult(config, time.perf_counter() - start, error=error)
+        return GhInitBatchResult(config, time.perf_counter() - start, result=result)
+
+    configs = [*configs]
+    results: list[GhInitBatchResult] = []
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(configs)))) as pool:
+        for result in pool.map(run, configs):
+            if on_result is not None:
+                on_result(result)
+            results.append(result)
+    return results
+
+
+def _step(done: bool, error: str | None) -> str:
+    if done:
+        return "yes"
+    return "failed" if error else "-"
+
+
+def format_batch_results(results: list[GhInitBatchResult], *, wall_seconds: float | None = None) -> list[str]:
+    """Render results as the lines of a fixed-width summary table."""
+    rows = []
+    for entry in results:
+        result = entry.result
+        repository = result.html_url if result else f"{entry.config.owner or '<user>'}/{entry.config.name}"
+        steps = (
+            (
+                _step(result.pushed, None),
+                _step(result.pages_configured, result.pages_error),
+                _step(result.branch_protected, result.protection_error),
+            )
+            if result
+            else ("-", "-", "-")
+        )
+        requests = str(result.requests) if result and result.requests is not None else "-"
+        status = "ok" if entry.ok else f"FAILED: {entry.error}"
+        rows.append((str(entry.config.project_path), repository, *steps, requests, f"{entry.seconds:.2f}s", status))
+    header = ("Project", "Repository", "Pushed", "Pages", "Protected", "Requests", "Time", "Status")
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header) - 1)]
+    lines = []
+    for row in [header, *rows]:
+        cells = [f"{cell:<{width}}" for cell, width in zip(row[:5], widths, strict=False)]
+        cells += [f"{row[5]:>{widths[5]}}", f"{row[6]:>{widths[6]}}"]
+        lines.append("  ".join([*cells, row[7]]))
+    total = sum(entry.seconds for entry in results)
+    summary = f"{len(results)} projects, {sum(not entry.ok for entry in results)} failed, {total:.2f}s total"
+    if wall_seconds is not None:
+        summary += f" ({wall_seconds:.2f}s wall)"
+    counted = [entry.result for entry in results if entry.result and entry.result.requests is not None]
+    if counted:
+        summary += (
+            f"; {sum(r.requests for r in counted)} requests, {sum(r.retries for r in counted)} retries, "
+            f"{sum(r.wait_seconds for r in counted):.1f}s waiting"
+        )
+    lines.append(summary)
+    return lines
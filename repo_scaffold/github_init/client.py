@@ -3,24 +3,62 @@
 Isolating the SDK behind ``GhInitClient`` lets the orchestrator depend on a
 small, mockable surface instead of ``github`` module internals, and lets the
 generated tests swap the whole client out without monkey-patching the SDK.
+
+Where a PyGithub helper costs more round trips than the operation needs (a
+public-key fetch per secret, a GET before every edit), the client calls the
+REST endpoint through the repository's requester instead.
 """
 
 from __future__ import annotations
 
+from typing import Any
+from urllib.parse import quote
+
 from github import Auth
 from github import Github
 from github import GithubException
+from github.GithubObject import NotSet
+from github.PublicKey import PublicKey
 from github.Repository import Repository
 
+from .config import BRANCH_PROTECTION
+from .scheduler import RequestStats
+from .scheduler import record_requests
+
 
 class GhInitClient:
     """Tiny PyGithub wrapper that orchestrator and tests both consume."""
 
-    def __init__(self, token: str):
-        """Construct a client backed by the given personal access token."""
-        self._gh = Github(auth=Auth.Token(token))
+    def __init__(self, token: str, **github_options: Any):
+        """Construct a client backed by the given personal access token.
+
+        ``github_options`` are passed on to ``github.Github``, e.g. ``base_url``
+        for GitHub Enterprise Server (or a local stand-in) and its throttling
+        settings.
+        """
+        self._gh = Github(auth=Auth.Token(token), **github_options)
         self._user_login: str | None = None
         self._token = token
+        self._created: set[str] = set()  # full names of repos this client created
+        self._public_keys: dict[str, PublicKey] = {}
+        self._variables: dict[str, set[str]] = {}  # existing variable names, per repo
+        self.stats = RequestStats()
+        self._count_requests()
+
+    def _count_requests(self) -> None:
+        """Count every request PyGithub sends into ``stats`` (and any ``track_requests`` block).
+
+        Every object this client gets back shares the ``Github`` instance's
+        requester, and all their JSON requests go through its ``requestJson``.
+        """
+        requester = self._gh.requester
+        send = requester.requestJson
+
+        def counted(*args: Any, **kwargs: Any) -> Any:
+            record_requests(self.stats, requests=1)
+            return send(*args, **kwargs)
+
+        requester.requestJson = counted  # type: ignore[method-assign]
 
     @property
     def token(self) -> str:
@@ -47,44 +85,89 @@ class GhInitClient:
         description: str,
         private: bool,
         allow_existing: bool,
+        homepage: str | None = None,
     ) -> Repository:
-        """Create the repo on the right account, or look it up if already there."""
+        """Create the repo on the right account, or look it up if already there.
+
+        ``homepage`` is sent with the create request, saving a later edit; an
+        existing repo is returned as is, so the caller checks its ``homepage``.
+        ``get_user``/``get_organization`` are lazy, so creating costs one request.
+        """
         login = self.authenticated_login()
         target_owner = owner or login
         try:
             if not owner or owner == login:
                 user = self._gh.get_user()
-                return user.create_repo(
+                repo = user.create_repo(
+                    name=name,
+                    description=description or "",
+                    homepage=homepage or NotSet,
+                    private=private,
+                    auto_init=False,
+                )
+            else:
+                org = self._gh.get_organization(owner)
+                repo = org.create_repo(
                     name=name,
                     description=description or "",
+                    homepage=homepage or NotSet,
                     private=private,
                     auto_init=False,
                 )
-            org = self._gh.get_organization(owner)
-            return org.create_repo(
-                name=name,
-                description=description or "",
-                private=private,
-                auto_init=False,
-            )
         except GithubException as exc:
             if exc.status == 422 and allow_existing:
                 return self._gh.get_repo(f"{target_owner}/{name}")
             raise
+        self._created.add(repo.full_name)
+        return repo
+
+    def created(self, repo: Repository) -> bool:
+        """Whether this client created ``repo`` (rather than finding it already there)."""
+        return repo.full_name in self._created
 
     def set_secret(self, repo: Repository, name: str, value: str) -> None:
-        """Create or replace an Actions secret. ``create_secret`` is PUT-based."""
-        repo.create_secret(name, value)
+        """Create or replace an Actions secret.
+
+        ``Repository.create_secret`` fetches the public key for every secret;
+        here it is fetched once per repo and the sealed value PUT directly.
+        """
+        key = self._public_keys.get(repo.full_name)
+        if key is None:
+            key = self._public_keys[repo.full_name] = repo.get_public_key()
+        payload = {"encrypted_value": key.encrypt(value), "key_id": key.key_id}
+        repo.requester.requestJsonAndCheck("PUT", f"{repo.url}/actions/secrets/{quote(name, safe='')}", input=payload)
+
+    def _existing_variables(self, repo: Repository) -> set[str]:
+        """Names of the repo's Actions variables, listed once (never for a repo created here)."""
+        names = self._variables.get(repo.full_name)
+        if names is None:
+            names = set() if repo.full_name in self._created else {variable.name for variable in repo.get_variables()}
+            self._variables[repo.full_name] = names
+        return names
 
     def set_variable(self, repo: Repository, name: str, value: str) -> None:
-        """Create an Actions variable, falling back to ``edit`` if it exists."""
-        try:
-            repo.create_variable(name, value)
-        except GithubException as exc:
-            if exc.status in (409, 422):
-                repo.get_variable(name).edit(value=value)
+        """Create an Actions variable, or update it in place if it exists.
+
+        Whether it exists comes from :meth:`_existing_variables`, so each
+        variable is one POST or one PATCH. A conflict on create (the variable
+        appeared since the listing) still falls back to the PATCH.
+        """
+        existing = self._existing_variables(repo)
+        if name not in existing:
+            try:
+                repo.create_variable(name, value)
+            except GithubException as exc:
+                if exc.status not in (409, 422):
+                    raise
+            else:
+                existing.add(name)
                 return
-            raise
+        repo.requester.requestJsonAndCheck(
+            "PATCH",
+            f"{repo.url}/actions/variables/{quote(name, safe='')}",
+            input={"name": name, "value": value},
+        )
+        existing.add(name)
 
     def set_homepage(self, repo: Repository, url: str) -> None:
         """Point the repository's ``Website`` field at the docs URL."""
@@ -93,31 +176,36 @@ class GhInitClient:
     def enable_pages(self, repo: Repository, branch: str, path: str = "/") -> None:
         """Configure GitHub Pages to deploy from ``branch``/``path``.
 
-        PyGithub 2.x has no Pages helper, so this calls the REST API directly:
-        ``POST .../pages`` to create the site, falling back to ``PUT`` to update
-        the source when a site already exists.
+        PyGithub 2.x has no Pages helper, so this calls the REST API directly.
+        A repo this client created has no site yet, so it is created with
+        ``POST .../pages`` (falling back to ``PUT`` if one exists after all);
+        on an existing repo a site most likely exists from an earlier run, so
+        its source is updated with ``PUT`` (falling back to ``POST`` when there is no site).
         """
         source = {"branch": branch, "path": path}
+        if repo.full_name in self._created:
+            first, fallback, retry_on = "POST", "PUT", (409, 422)
+        else:
+            first, fallback, retry_on = "PUT", "POST", (400, 404, 422)
         try:
-            repo.requester.requestJsonAndCheck("POST", f"{repo.url}/pages", input={"source": source})
+            repo.requester.requestJsonAndCheck(first, f"{repo.url}/pages", input={"source": source})
         except GithubException as exc:
-            if exc.status in (409, 422):
-                repo.requester.requestJsonAndCheck("PUT", f"{repo.url}/pages", input={"source": source})
+            if exc.status in retry_on:
+                repo.requester.requestJsonAndCheck(fallback, f"{repo.url}/pages", input={"source": source})
                 return
             raise
 
     def protect_branch(self, repo: Repository, branch: str) -> None:
         """Enable branch protection on ``branch`` (requires admin on the repo).
 
-        Rules are intentionally compatible with the generated ``version-bump``
-        workflow: ``enforce_admins`` is left off so the release token (owned by
-        a repo admin) can still push ``chore(version):`` commits and tags
-        directly. Branch protection is unavailable on private repos without a
-        paid GitHub plan; such a failure surfaces to the caller.
+        Applies ``BRANCH_PROTECTION`` with one PUT to the protection endpoint
+        (``Branch.edit_protection`` would GET the branch first). Rules are
+        intentionally compatible with the generated ``version-bump`` workflow:
+        ``enforce_admins`` is left off so the release token (owned by a repo
+        admin) can still push ``chore(version):`` commits and tags directly.
+        Branch protection is unavailable on private repos without a paid GitHub
+        plan; such a failure surfaces to the caller.
         """
-        repo.get_branch(branch).edit_protection(
-            required_approving_review_count=1,
-            enforce_admins=False,
-            allow_force_pushes=False,
-            allow_deletions=False,
+        repo.requester.requestJsonAndCheck(
+            "PUT", f"{repo.url}/branches/{quote(branch, safe='')}/protection", input=BRANCH_PROTECTION
         )
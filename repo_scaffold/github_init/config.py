@@ -32,6 +32,18 @@ DEFAULT_VARIABLE_KEYS: tuple[str, ...] = ("PUBLISH_TO_PUBLIC_PYPI",)
 # and which GitHub Pages is configured to serve from.
 PAGES_BRANCH = "gh-pages"
 
+# Rules ``--protect-branch`` applies, as the body of ``PUT .../branches/{branch}/protection``.
+# ``enforce_admins`` stays off so the generated ``version-bump`` workflow (whose
+# token belongs to a repo admin) can still push ``chore(version):`` commits and tags.
+BRANCH_PROTECTION: dict[str, Any] = {
+    "required_status_checks": None,
+    "enforce_admins": False,
+    "required_pull_request_reviews": {"required_approving_review_count": 1},
+    "restrictions": None,
+    "allow_force_pushes": False,
+    "allow_deletions": False,
+}
+
 
 @dataclass
 class GhInitConfig:
@@ -67,6 +79,11 @@ class GhInitResult:
     homepage_set: bool = False
     branch_protected: bool = False
     protection_error: str | None = None
+    # API counters of this bootstrap (see ``scheduler.track_requests``); ``requests``
+    # stays None for clients that do not count (test doubles).
+    requests: int | None = None
+    retries: int = 0
+    wait_seconds: float = 0.0
 
 
 def parse_dotenv(text: str) -> dict[str, str]:
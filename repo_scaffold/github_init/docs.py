@@ -0,0 +1,193 @@
+"""Docs build and publish for gh-init, split so the build overlaps the bootstrap.
+
+``mkdocs gh-deploy`` builds the site and pushes it in one go, and it is the
+slowest gh-init step; as one step it can only start once the default branch is
+pushed. Here the two halves are separate:
+
+- :func:`start_docs_build` runs the project's ``docs-build`` just recipe
+  (``mkdocs build`` into the git-ignored ``site/``) in the background once
+  the initial commit exists, overlapping repo creation, secrets and the push.
+  Committing first keeps what ``uv run`` writes during the build (``uv.lock``,
+  ``.venv/``) out of the pushed tree.
+- :func:`publish_docs` commits the built site to the ``gh-pages`` branch with
+  git plumbing (a throwaway index, so the project's own index and work tree
+  are never touched) and force-pushes it, which is what ``gh-deploy --force``
+  does after its build.
+
+Projects that cannot be built ahead (no ``docs-build`` recipe, or ``site/``
+not git-ignored, so the initial commit could pick up a half-built site) keep
+going through ``deploy_docs`` after the push.
+"""
+
+from __future__ import annotations
+
+import base64
+import os
+import re
+import subprocess
+import tempfile
+import threading
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+from repo_scaffold.trace import span
+
+from .config import PAGES_BRANCH
+
+
+DOCS_BUILD_COMMAND: tuple[str, ...] = ("uvx", "--from", "rust-just", "just", "docs-build")
+SITE_DIR = "site"  # mkdocs' default ``site_dir``
+
+
+def _git_auth_args(token: str | None) -> list[str]:
+    """``git -c`` options sending ``token`` as an ``Authorization: Basic`` header (none without a token)."""
+    if not token:
+        return []
+    creds = base64.b64encode(f"x-access-token:{token}".encode()).decode()
+    return ["-c", f"http.extraheader=Authorization: Basic {creds}"]
+
+
+def _tail(output: str | None) -> str:
+    return "\n".join((output or "").strip().splitlines()[-5:])
+
+
+class DocsBuild:
+    """A ``docs-build`` run in the background; :meth:`wait` for the site, :meth:`cancel` to drop it."""
+
+    def __init__(self, project_path: Path, command: Sequence[str] = DOCS_BUILD_COMMAND):
+        """Prepare (but do not start) a build of ``project_path``'s docs with ``command``."""
+        self.project_path = project_path
+        self.site_dir = project_path / SITE_DIR
+        self.command = list(command)
+        self.seconds: float | None = None  # build duration, once finished
+        self._error: str | None = None
+        self._process: subprocess.Popen[str] | None = None
+        self._cancelled = False
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="docs-build", daemon=True)
+
+    def start(self) -> DocsBuild:
+        """Start the build on a background thread."""
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        start = time.monotonic()
+        with span("docs build"):
+            try:
+                with self._lock:
+                    if self._cancelled:
+                        return
+                    self._process = subprocess.Popen(
+                        self.command,
+                        cwd=str(self.project_path),
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                        text=True,
+                    )
+                stdout, stderr = self._process.communicate()
+            except FileNotFoundError:
+                self._error = f"`{self.command[0]}` was not found on PATH; install uv before running gh-init."
+                return
+            finally:
+                self.seconds = time.monotonic() - start
+            if self._process.returncode != 0 and not self._cancelled:
+                self._error = f"`mkdocs build` failed:\n{_tail(stderr or stdout)}"
+
+    def wait(self) -> Path:
+        """Wait for the build and return the site directory.
+
+        Raises:
+            RuntimeError: If the build failed or was cancelled.
+        """
+        self._thread.join()
+        if self._cancelled:
+            raise RuntimeError("The docs build was cancelled.")
+        if self._error is not None:
+            raise RuntimeError(self._error)
+        return self.site_dir
+
+    def cancel(self) -> None:
+        """Stop the build if it is still running (a no-op once it finished)."""
+        with self._lock:
+            self._cancelled = True
+            if self._process is not None and self._process.poll() is None:
+                self._process.terminate()
+        if self._thread.is_alive():
+            self._thread.join()
+
+
+def _site_ignored(project_path: Path) -> bool:
+    """Whether the project's ``.gitignore`` ignores ``site/`` at its root."""
+    try:
+        lines = (project_path / ".gitignore").read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return False
+    return any(line.strip() in {SITE_DIR, f"{SITE_DIR}/", f"/{SITE_DIR}", f"/{SITE_DIR}/"} for line in lines)
+
+
+def start_docs_build(project_path: Path) -> DocsBuild | None:
+    """Start building the project's docs in the background, if it can be built ahead of the push.
+
+    Returns ``None`` when the project has no ``docs-build`` just recipe or does
+    not git-ignore ``site/``; the caller then deploys with ``deploy_docs``.
+    """
+    try:
+        justfile = (project_path / "justfile").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    if not re.search(r"^docs-build\s*:", justfile, re.MULTILINE) or not _site_ignored(project_path):
+        return None
+    return DocsBuild(project_path).start()
+
+
+def publish_docs(
+    project_path: Path,
+    site_dir: Path,
+    *,
+    token: str | None = None,
+    branch: str = PAGES_BRANCH,
+) -> None:
+    """Commit ``site_dir`` as the whole content of ``branch`` and force-push it to ``origin``.
+
+    Adds the ``.nojekyll`` marker, like ``mkdocs gh-deploy``. The token is
+    sent as in ``git_push``, never written to ``.git/config``.
+
+    Raises:
+        RuntimeError: If a git command fails.
+    """
+    from . import INITIAL_COMMIT_EMAIL
+    from . import INITIAL_COMMIT_USER
+
+    (site_dir / ".nojekyll").touch()
+    with tempfile.TemporaryDirectory(prefix="repo-scaffold-pages-") as tmp:
+        env = {
+            **os.environ,
+            "GIT_INDEX_FILE": str(Path(tmp) / "index"),
+            "GIT_AUTHOR_NAME": INITIAL_COMMIT_USER,
+            "GIT_AUTHOR_EMAIL": INITIAL_COMMIT_EMAIL,
+            "GIT_COMMITTER_NAME": INITIAL_COMMIT_USER,
+            "GIT_COMMITTER_EMAIL": INITIAL_COMMIT_EMAIL,
+            "GIT_TERMINAL_PROMPT": "0",
+        }
+
+        site = site_dir.resolve()
+        repository = ["git", f"--git-dir={project_path.resolve() / '.git'}", f"--work-tree={site}"]
+
+        def git(*args: str) -> str:
+            return subprocess.run(
+                [*repository, *args], cwd=site, check=True, capture_output=True, text=True, env=env
+            ).stdout.strip()
+
+        try:
+            git("add", "--all", "--force", ".")
+            tree = git("write-tree")
+            head = git("rev-parse", "--short", "HEAD")
+            commit = git("commit-tree", tree, "-m", f"Deployed {head} with repo-scaffold gh-init")
+            git("update-ref", f"refs/heads/{branch}", commit)
+            git(*_git_auth_args(token), "push", "--force", "origin", f"refs/heads/{branch}:refs/heads/{branch}")
+        except FileNotFoundError as exc:
+            raise RuntimeError("`git` was not found on PATH; install git before running gh-init.") from exc
+        except subprocess.CalledProcessError as exc:
+            raise RuntimeError(f"Publishing the docs to '{branch}' failed:\n{_tail(exc.stderr or exc.stdout)}") from exc
@@ -0,0 +1,202 @@
+"""Rate-limit-aware request scheduling for the ``httpx`` gh-init client.
+
+:class:`RateLimitTransport` sits between ``AsyncGhInitClient`` and the
+network and applies to every request:
+
+- **Pacing.** Requests are queued (FIFO) through a token bucket, ``rate``
+  requests per second with bursts of ``burst``, so a batch bootstrap spreads
+  its writes out instead of tripping GitHub's secondary rate limits.
+- **Rate-limit headers.** A ``Retry-After`` header, or ``X-RateLimit-Remaining:
+  0`` with its ``X-RateLimit-Reset``, pauses the whole queue until then, so
+  every project sharing the client backs off together.
+- **Retries.** A request rejected by a rate limit (429, or 403 with the
+  headers above) was never processed, so it is retried whatever its method.
+  Server errors (5xx) and connection failures are retried only for idempotent
+  methods, e.g. the secret, Pages and branch-protection ``PUT``s, after a
+  jittered exponential backoff. A wait longer than ``max_wait``, or more than
+  ``max_retries`` retries, hands the response back to the client instead.
+
+Counters (requests sent, retries, seconds spent queued or backing off) are
+kept on the transport and on every :func:`track_requests` block the request
+was sent from; ``init_repository`` uses one to report per-bootstrap numbers.
+:func:`record_requests` feeds the same counters from other clients
+(``GhInitClient`` counts PyGithub's requests with it).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+import httpx
+
+
+DEFAULT_RATE = 10.0
+DEFAULT_BURST = 20
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+_RETRIED_STATUSES = frozenset({500, 502, 503, 504})
+
+
+@dataclass
+class RequestStats:
+    """Counters of the requests sent through a :class:`RateLimitTransport`."""
+
+    requests: int = 0
+    retries: int = 0
+    wait_seconds: float = 0.0
+
+
+_tracked: ContextVar[tuple[RequestStats, ...]] = ContextVar("_tracked", default=())
+
+
+@contextmanager
+def track_requests() -> Iterator[RequestStats]:
+    """Count the requests sent from this context (and tasks started from it) while the block runs."""
+    stats = RequestStats()
+    token = _tracked.set((*_tracked.get(), stats))
+    try:
+        yield stats
+    finally:
+        _tracked.reset(token)
+
+
+def record_requests(stats: RequestStats, *, requests: int = 0, retries: int = 0, wait_seconds: float = 0.0) -> None:
+    """Add to ``stats`` and to every :func:`track_requests` block active in this context."""
+    for target in (stats, *_tracked.get()):
+        target.requests += requests
+        target.retries += retries
+        target.wait_seconds += wait_seconds
+
+
+class RateLimitTransport(httpx.AsyncBaseTransport):
+    """Token-bucket pacing, rate-limit pauses and jittered retries around another transport."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        *,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        max_retries: int = 5,
+        backoff: float = 1.0,
+        max_wait: float = 120.0,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], object] = asyncio.sleep,
+    ):
+        """Wrap ``transport``.
+
+        Args:
+            transport: Transport that actually sends the requests.
+            rate: Requests per second allowed on average.
+            burst: Requests allowed back to back after an idle period.
+            max_retries: Retries per request before giving up.
+            backoff: Base delay of the exponential backoff, in seconds.
+            max_wait: Longest single wait worth sleeping through; beyond it the
+                rate-limited response is returned as is.
+            clock: Monotonic clock (tests).
+            wall_clock: Epoch clock for ``X-RateLimit-Reset`` (tests).
+            sleep: Coroutine function used to wait (tests).
+        """
+        self._transport = transport
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_wait = max_wait
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._queue = asyncio.Lock()
+        self.stats = RequestStats()
+
+    def _count(self, *, requests: int = 0, retries: int = 0, wait_seconds: float = 0.0) -> None:
+        record_requests(self.stats, requests=requests, retries=retries, wait_seconds=wait_seconds)
+
+    async def _acquire(self) -> None:
+        """Wait for the queue, any rate-limit pause and a token from the bucket."""
+        start = self._clock()
+        async with self._queue:
+            while True:
+                now = self._clock()
+                delay = self._paused_until - now
+                if delay <= 0:
+                    self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        break
+                    delay = (1 - self._tokens) / self.rate
+                await self._sleep(delay)
+        self._count(wait_seconds=self._clock() - start)
+
+    def _pause(self, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def _rate_limit_delay(self, response: httpx.Response) -> float | None:
+        """Seconds GitHub asks us to wait before the next request, if any."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                return None
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            try:
+                return max(0.0, float(response.headers["X-RateLimit-Reset"]) - self._wall_clock())
+            except (KeyError, ValueError):
+                return None
+        return None
+
+    def _jittered(self, attempt: int) -> float:
+        return random.uniform(0, self.backoff * 2**attempt)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send ``request``, pacing it and retrying it as described in the module docstring."""
+        idempotent = request.method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            await self._acquire()
+            self._count(requests=1)
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError:
+                if not idempotent or attempt >= self.max_retries:
+                    raise
+                delay = self._jittered(attempt)
+            else:
+                limited = self._rate_limit_delay(response)
+                if limited is not None and limited <= self.max_wait:
+                    self._pause(limited)  # later requests from every caller wait too
+                if response.status_code == 429 or (response.status_code == 403 and limited is not None):
+                    # Rejected before being processed, so resending is safe for any method.
+                    if limited is None:
+                        limited = self._jittered(attempt)
+                        self._pause(limited)
+                    delay = 0.0  # the retry waits out the pause in _acquire
+                    if attempt >= self.max_retries or limited > self.max_wait:
+                        return response
+                elif idempotent and response.status_code in _RETRIED_STATUSES and attempt < self.max_retries:
+                    delay = self._jittered(attempt)
+                else:
+                    return response
+                await response.aclose()
+            attempt += 1
+            self._count(retries=1)
+            if delay > 0:
+                start = self._clock()
+                await self._sleep(delay)
+                self._count(wait_seconds=self._clock() - start)
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.aclose()
@@ -0,0 +1,49 @@
+"""Runtime shared by the templates' post-generation hooks.
+
+Every template's ``hooks/post_gen_project.py`` keeps only what is specific to
+it (which paths each answer removes, how dependencies are installed) and calls
+into this package for the rest. The package is stdlib-only and ships next to
+the templates, so a hook run by plain ``cookiecutter`` from another
+environment loads ``repo_scaffold`` from there by file location, without
+putting the directory that contains it (usually ``site-packages``) on
+``sys.path``.
+
+- :mod:`repo_scaffold.hooks.answers` — the ``_answer_schema`` checks, the same
+  code the render engine runs before rendering.
+- :mod:`repo_scaffold.hooks.remove` — ``remove_paths``, batched removal of the
+  files the answers opted out of.
+- :mod:`repo_scaffold.hooks.steps` — ``git init``, dependency installation
+  (``InstallStep``) and ``initialize``, which overlaps the two.
+- :mod:`repo_scaffold.hooks.tasks` — ``TaskGraph``, which runs independent
+  initialization steps (``git init``, dependency installation) concurrently
+  while keeping their output in registration order.
+"""
+
+from __future__ import annotations
+
+from .answers import answer_errors
+from .answers import check_answers
+from .remove import PARALLEL_UNLINK_THRESHOLD
+from .remove import remove_paths
+from .steps import GIT_BRANCH
+from .steps import InstallStep
+from .steps import init_git_repo
+from .steps import initialize
+from .steps import install_dependencies
+from .tasks import Task
+from .tasks import TaskGraph
+
+
+__all__ = [
+    "GIT_BRANCH",
+    "PARALLEL_UNLINK_THRESHOLD",
+    "InstallStep",
+    "Task",
+    "TaskGraph",
+    "answer_errors",
+    "check_answers",
+    "init_git_repo",
+    "initialize",
+    "install_dependencies",
+    "remove_paths",
+]
@@ -0,0 +1,53 @@
+"""The ``_answer_schema`` rules, shared by the render engine and the hooks.
+
+The rules are described in :mod:`repo_scaffold.render.schema`, which checks
+them before rendering; this module holds the implementation so the hooks
+(which must not import cookiecutter) run the very same checks.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from typing import Any
+
+
+ANSWER_SCHEMA_KEY = "_answer_schema"
+
+
+def _version(value: str) -> tuple[int, ...]:
+    return tuple(int(part) for part in value.split("."))
+
+
+def answer_errors(variables: dict[str, Any]) -> list[str]:
+    """Return one message per schema rule the resolved cookiecutter variables break."""
+    errors = []
+    for name, rule in (variables.get(ANSWER_SCHEMA_KEY) or {}).items():
+        value = str(variables.get(name, ""))
+        pattern = rule.get("pattern")
+        if pattern is not None and not re.fullmatch(pattern, value):
+            description = rule.get("description") or f"a match for {pattern!r}"
+            errors.append(f"{name} must be {description} (got {value!r})")
+        choices = rule.get("choices")
+        if choices is not None and value not in choices:
+            errors.append(f"{name} must be one of {', '.join(choices)} (got {value!r})")
+        lower = rule.get("at_least")
+        if lower is not None:
+            minimum = str(variables.get(lower, ""))
+            try:
+                broken = _version(minimum) > _version(value)
+            except ValueError:
+                errors.append(f"{lower} and {name} must be version numbers (got {minimum!r} and {value!r})")
+                continue
+            if broken:
+                errors.append(f"{lower} must be less than or equal to {name} ({minimum} > {value})")
+    return errors
+
+
+def check_answers(context: dict[str, Any]) -> None:
+    """Print every broken rule as ``Error: ...`` and exit with status 1 if there is any."""
+    errors = answer_errors(context)
+    for error in errors:
+        print(f"Error: {error}")
+    if errors:
+        sys.exit(1)
@@ -0,0 +1,124 @@
+"""Batched removal of generated files the user opted out of.
+
+Hooks used to check every path with ``exists``/``is_file``/``is_dir`` and then
+remove it, one path at a time. :func:`remove_paths` instead groups the paths
+by parent directory and reads each parent once with ``os.scandir``, whose
+entries carry the file type, so nothing is stat'ed just to decide how to
+remove it and missing paths cost nothing. Entries are removed relative to an
+open descriptor of their parent:
+
+- files and symlinks with ``os.unlink(name, dir_fd=...)``;
+- small directories with ``shutil.rmtree(name, dir_fd=...)``, which walks them
+  through descriptors as well;
+- directories holding at least ``parallel_threshold`` files by unlinking the
+  files on a thread pool (``unlink`` releases the GIL), then removing the
+  emptied directories deepest first.
+
+Platforms without descriptor-relative calls (Windows) get the same batching
+with plain paths.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+PARALLEL_UNLINK_THRESHOLD = 512
+_MAX_UNLINK_WORKERS = 8
+# Descriptor-relative removal needs scandir(fd) and unlink(dir_fd=); elsewhere (Windows) paths are used.
+_USE_DIR_FD = os.scandir in os.supports_fd and os.unlink in os.supports_dir_fd and shutil.rmtree.avoids_symlink_attacks
+
+
+def _files_and_dirs(top: str) -> tuple[list[str], list[str]]:
+    """Every file (or symlink) below ``top`` and every directory, ``top`` included, deepest first."""
+    files: list[str] = []
+    dirs: list[str] = []
+    stack = [top]
+    while stack:
+        directory = stack.pop()
+        dirs.append(directory)
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                (stack if entry.is_dir(follow_symlinks=False) else files).append(entry.path)
+    dirs.reverse()  # every directory was appended after its parent
+    return files, dirs
+
+
+def _rmtree_parallel(path: str) -> None:
+    files, dirs = _files_and_dirs(path)
+    workers = min(_MAX_UNLINK_WORKERS, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="unlink") as pool:
+        for _ in pool.map(os.unlink, files, chunksize=64):
+            pass
+    for directory in dirs:
+        os.rmdir(directory)
+
+
+def _count_files(path: str, limit: int) -> int:
+    """Count the files below ``path``, stopping early once ``limit`` is reached."""
+    count = 0
+    stack = [path]
+    while stack and count < limit:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    count += 1
+    return count
+
+
+def remove_paths(
+    paths: Iterable[str | os.PathLike[str]],
+    *,
+    root: str | os.PathLike[str] = ".",
+    parallel_threshold: int = PARALLEL_UNLINK_THRESHOLD,
+) -> list[Path]:
+    """Remove files and directories (relative to ``root``) that exist; return the ones removed.
+
+    Missing paths are skipped silently. Each removal is printed, and a failure
+    is printed as a warning instead of stopping the hook, as the hooks always did.
+    """
+    by_parent: dict[Path, set[str]] = {}
+    for path in paths:
+        path = Path(path)
+        by_parent.setdefault(path.parent, set()).add(path.name)
+
+    removed: list[Path] = []
+    for parent, names in by_parent.items():
+        parent_dir = os.path.join(root, parent)
+        try:
+            fd = os.open(parent_dir, os.O_RDONLY | os.O_DIRECTORY) if _USE_DIR_FD else None
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        try:
+            try:
+                with os.scandir(parent_dir if fd is None else fd) as entries:
+                    matches = [entry for entry in entries if entry.name in names]
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            for entry in matches:
+                path = parent / entry.name
+                target = entry.name if fd is not None else os.path.join(parent_dir, entry.name)
+                try:
+                    if not entry.is_dir(follow_symlinks=False):
+                        os.unlink(target, dir_fd=fd)
+                        print(f"Removed file: {path}")
+                    else:
+                        full = os.path.join(parent_dir, entry.name)
+                        if _count_files(full, parallel_threshold) >= parallel_threshold:
+                            _rmtree_parallel(full)
+                        else:
+                            shutil.rmtree(target, dir_fd=fd)
+                        print(f"Removed directory: {path}")
+                    removed.append(path)
+                except OSError as e:
+                    print(f"Warning: Failed to remove {path}: {e}")
+        finally:
+            if fd is not None:
+                os.close(fd)
+    return removed
@@ -0,0 +1,124 @@
+"""Initialization steps shared by every template's post-generation hook.
+
+- :func:`init_git_repo` runs ``git init`` on branch ``master`` (best effort:
+  a missing or failing git only prints a warning).
+- :func:`install_dependencies` runs the template's :class:`InstallStep`
+  (``uv sync``, ``pnpm install``, ``cargo build``) and exits the hook with
+  status 1 if it fails. The command's combined stdout/stderr is piped and
+  printed line by line, so it lands after the step's own header.
+- :func:`initialize` runs both through a :class:`~repo_scaffold.hooks.TaskGraph`,
+  so they overlap while their output stays in that order.
+
+Each function works in the project directory it is given (``root``) and runs
+its commands with ``cwd=root``; nothing changes the process's working
+directory, so hooks called in-process for several projects at once (``serve``)
+do not step on each other.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from repo_scaffold.trace import span
+
+from .tasks import TaskGraph
+
+
+GIT_BRANCH = "master"
+
+
+@dataclass(frozen=True)
+class InstallStep:
+    """How a template installs (or builds) a generated project's dependencies."""
+
+    command: tuple[str, ...]
+    manifest: str  # file that must exist in the project root, e.g. ``pyproject.toml``
+    starting: str  # printed before running ``command``
+    not_found: str  # printed when ``command[0]`` is not installed
+    missing_manifest: str = "Error: Project {manifest} not found in {directory}"
+    succeeded: str = "Dependencies installed successfully"
+    failed: str = "Failed to install dependencies"
+
+
+def init_git_repo(enabled: bool = True, *, root: str | os.PathLike[str] = ".") -> None:
+    """Initialize a git repository on branch ``master`` in ``root`` (best effort)."""
+    if not enabled:
+        print("Skipping git init (--no-git selected).")
+        return
+
+    if (Path(root) / ".git").exists():
+        print("Git repository already initialized, skipping git init.")
+        return
+
+    try:
+        print(f"Initializing git repository (branch: {GIT_BRANCH})...")
+        with span("git init"):
+            try:
+                subprocess.run(["git", "init", "-b", GIT_BRANCH], cwd=root, check=True, capture_output=True)
+            except subprocess.CalledProcessError:
+                # Older git without `-b`: init, then point HEAD at the branch.
+                subprocess.run(["git", "init"], cwd=root, check=True, capture_output=True)
+                subprocess.run(
+                    ["git", "symbolic-ref", "HEAD", f"refs/heads/{GIT_BRANCH}"],
+                    cwd=root,
+                    check=True,
+                    capture_output=True,
+                )
+        print(f"✅ Initialized empty git repository on branch '{GIT_BRANCH}'")
+    except FileNotFoundError:
+        print("⚠️  git not found; skipped git init. Install git to enable version control.")
+    except subprocess.CalledProcessError as e:
+        print(f"⚠️  Skipped git init: {e}")
+
+
+def install_dependencies(step: InstallStep, enabled: bool = True, *, root: str | os.PathLike[str] = ".") -> None:
+    """Run ``step`` in ``root``, exiting with status 1 if it cannot run or fails."""
+    if not enabled:
+        print("Skipping dependency installation (--no-install selected).")
+        return
+
+    directory = Path(root).absolute()
+    if not (directory / step.manifest).exists():
+        print(step.missing_manifest.format(manifest=step.manifest, directory=directory))
+        sys.exit(1)
+
+    try:
+        print(step.starting)
+        with span(" ".join(step.command)):
+            _run_printing_output(step.command, directory)
+        print(f"✅ {step.succeeded}")
+    except subprocess.CalledProcessError as e:
+        print(f"❌ {step.failed}: {e}")
+        sys.exit(1)
+    except FileNotFoundError:
+        print(f"❌ {step.not_found}")
+        sys.exit(1)
+
+
+def _run_printing_output(command: tuple[str, ...], cwd: Path) -> None:
+    """Run ``command``, printing its combined output through ``sys.stdout`` as it arrives.
+
+    Raises:
+        subprocess.CalledProcessError: If the command exits with a non-zero status.
+    """
+    with subprocess.Popen(
+        [*command], cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace"
+    ) as process:
+        for line in process.stdout:
+            sys.stdout.write(line)
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, [*command])
+
+
+def initialize(
+    step: InstallStep, *, init_git: bool = True, install: bool = True, root: str | os.PathLike[str] = "."
+) -> None:
+    """Run :func:`init_git_repo` and :func:`install_dependencies` in ``root`` concurrently, printing in that order."""
+    graph = TaskGraph()
+    graph.add("git", lambda: init_git_repo(init_git, root=root))
+    graph.add("install", lambda: install_dependencies(step, install, root=root))
+    graph.run()
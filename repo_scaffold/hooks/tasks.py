@@ -0,0 +1,214 @@
+"""A small dependency-aware task runner for post-generation hooks.
+
+Hooks register their initialization steps (``git init``, dependency
+installation, ...) with the names of the steps they depend on. Steps with no
+unfinished dependencies run concurrently in threads, but their output is
+shown exactly as if they had run one after another in registration order:
+
+- the earliest unfinished step writes straight to the terminal;
+- later steps' ``print`` output is buffered and flushed as soon as every step
+  registered before them has finished.
+
+Routing applies only to the graph's own step threads: while any graph runs,
+``sys.stdout``/``sys.stderr`` are a single shared proxy that sends every other
+thread's writes (``serve`` workers, other requests) straight to the original
+stream. Child processes do not write to the terminal themselves; steps pipe
+their output and print it (see
+:func:`~repo_scaffold.hooks.steps.install_dependencies`), so it is ordered
+like any other ``print``.
+
+Failure semantics match sequential execution: a step that raises (including
+``sys.exit``) skips every step that depends on it, steps already running are
+allowed to finish, and the first failure in registration order is re-raised
+once the graph has settled.
+
+Each step is recorded as a :func:`repo_scaffold.trace.span` when tracing is on.
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+import threading
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TextIO
+
+from repo_scaffold.trace import span
+
+
+@dataclass
+class Task:
+    """One registered step and its run state."""
+
+    name: str
+    func: Callable[[], object]
+    after: tuple[str, ...] = ()
+    done: threading.Event = field(default_factory=threading.Event)
+    error: BaseException | None = None
+    skipped: bool = False
+    output: list[tuple[TextIO, str]] = field(default_factory=list)
+
+
+class _RoutedStream(io.TextIOBase):
+    """``sys.stdout``/``sys.stderr`` proxy that routes writes from graph step threads."""
+
+    def __init__(self, target: TextIO):
+        super().__init__()
+        self._target = target
+
+    def write(self, text: str) -> int:
+        graph = _routes.get(threading.get_ident())
+        if graph is None:
+            self._target.write(text)
+        else:
+            graph._write(self._target, text)
+        return len(text)
+
+    def flush(self) -> None:
+        self._target.flush()
+
+    def fileno(self) -> int:
+        return self._target.fileno()
+
+    def isatty(self) -> bool:
+        return self._target.isatty()
+
+    @property
+    def encoding(self) -> str:
+        return self._target.encoding
+
+
+_routes: dict[int, TaskGraph] = {}  # step thread ident -> graph routing its output
+_routes_lock = threading.Lock()
+_installed: list[TextIO] = []  # the streams replaced by the proxies, while any graph runs
+_running = 0
+
+
+@contextmanager
+def _routed_streams() -> Iterator[None]:
+    """Install the stream proxies for the first running graph and remove them after the last."""
+    global _running
+    with _routes_lock:
+        if not _running:
+            _installed[:] = [sys.stdout, sys.stderr]
+            sys.stdout = _RoutedStream(_installed[0])
+            sys.stderr = _RoutedStream(_installed[1])
+        _running += 1
+    try:
+        yield
+    finally:
+        with _routes_lock:
+            _running -= 1
+            if not _running:
+                # Leave a stream someone else swapped in meanwhile alone.
+                if isinstance(sys.stdout, _RoutedStream):
+                    sys.stdout = _installed[0]
+                if isinstance(sys.stderr, _RoutedStream):
+                    sys.stderr = _installed[1]
+                _installed.clear()
+
+
+class TaskGraph:
+    """Runs registered steps concurrently while keeping their output in order.
+
+    Example:
+        ```python
+        graph = TaskGraph()
+        graph.add("git", initializer.init_git_repo)
+        graph.add("install", initializer.setup_environment)
+        graph.run()
+        ```
+    """
+
+    def __init__(self) -> None:
+        """Create an empty graph."""
+        self._tasks: list[Task] = []
+        self._by_thread: dict[int, Task] = {}
+        self._head = 0
+        self._lock = threading.Lock()
+
+    @property
+    def tasks(self) -> list[Task]:
+        """Registered tasks in registration (and output) order."""
+        return self._tasks
+
+    def add(self, name: str, func: Callable[[], object], *, after: tuple[str, ...] = ()) -> None:
+        """Register a step that runs once every step named in ``after`` succeeded.
+
+        Raises:
+            ValueError: If ``name`` is taken or ``after`` names an unknown step.
+                Dependencies must be registered first, which also rules out cycles.
+        """
+        known = {task.name for task in self._tasks}
+        if name in known:
+            raise ValueError(f"Duplicate task '{name}'")
+        missing = [dep for dep in after if dep not in known]
+        if missing:
+            raise ValueError(f"Task '{name}' depends on unknown task(s): {', '.join(missing)}")
+        self._tasks.append(Task(name=name, func=func, after=tuple(after)))
+
+    def run(self) -> None:
+        """Run every step, then re-raise the first failure in registration order."""
+        by_name = {task.name: task for task in self._tasks}
+        with _routed_streams():
+            threads = [
+                threading.Thread(target=self._run_task, args=(task, by_name), name=f"hook-{task.name}", daemon=True)
+                for task in self._tasks
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        for task in self._tasks:
+            if task.error is not None:
+                raise task.error
+
+    def _run_task(self, task: Task, by_name: dict[str, Task]) -> None:
+        ident = threading.get_ident()
+        with self._lock:
+            self._by_thread[ident] = task
+        _routes[ident] = self
+        try:
+            for dep in task.after:
+                by_name[dep].done.wait()
+            if any(by_name[dep].error is not None or by_name[dep].skipped for dep in task.after):
+                task.skipped = True
+                return
+            with span(task.name):
+                task.func()
+        except BaseException as exc:  # SystemExit from the hook's sys.exit(1) included
+            task.error = exc
+        finally:
+            _routes.pop(ident, None)
+            task.done.set()
+            self._advance()
+
+    def _write(self, target: TextIO, text: str) -> None:
+        with self._lock:
+            task = self._by_thread.get(threading.get_ident())
+            if task is None or self._is_head(task):
+                target.write(text)
+                target.flush()
+            else:
+                task.output.append((target, text))
+
+    def _is_head(self, task: Task) -> bool:
+        return self._head < len(self._tasks) and self._tasks[self._head] is task
+
+    def _advance(self) -> None:
+        """Move the head past finished tasks, flushing the output each one buffered."""
+        with self._lock:
+            while self._head < len(self._tasks):
+                head = self._tasks[self._head]
+                for target, text in head.output:
+                    target.write(text)
+                    target.flush()
+                head.output.clear()
+                if not head.done.is_set():
+                    break
+                self._head += 1
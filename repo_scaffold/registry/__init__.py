@@ -0,0 +1,139 @@
+"""Template registry for ``repo-scaffold``.
+
+Three layers, split across this package:
+
+- :mod:`repo_scaffold.registry._index` — a generated module holding the
+  name/title/alias maps and each template's variable schema (the parsed
+  ``cookiecutter.json``). Importing it is O(1): no resource lookups, no JSON.
+- :mod:`repo_scaffold.registry.build` — regenerates ``_index`` from
+  ``templates/cookiecutter.json`` (``just registry``; also run by ``just build``).
+- this module — ``TemplateRegistry`` and ``get_registry``. The precompiled
+  index is used unless a user overlay registry exists, in which case the
+  builtin JSON and the overlay are parsed and merged at runtime.
+
+The overlay is a JSON file with the same ``{"templates": {...}}`` shape as the
+builtin registry; its ``path`` entries are resolved relative to the overlay
+file. It is read from ``$REPO_SCAFFOLD_TEMPLATES`` or, if unset,
+``$XDG_CONFIG_HOME/repo-scaffold/templates.json``.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib.resources
+import json
+import os
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+
+from repo_scaffold.trace import span
+
+
+OVERLAY_ENV_VAR = "REPO_SCAFFOLD_TEMPLATES"
+
+__all__ = [
+    "OVERLAY_ENV_VAR",
+    "TemplateRegistry",
+    "builtin_templates_dir",
+    "get_registry",
+    "load_registry_json",
+    "overlay_path",
+]
+
+
+@dataclass(frozen=True)
+class TemplateRegistry:
+    """Resolved template registry with O(1) lookups by name, title or path."""
+
+    templates: dict[str, dict[str, str]]
+    aliases: dict[str, str]
+    variables: dict[str, dict[str, Any]]
+    # Template name -> directory its ``path`` is relative to. Templates not
+    # listed here live in the builtin ``repo_scaffold/templates`` directory.
+    roots: dict[str, Path] = field(default_factory=dict)
+
+    def resolve(self, key: str) -> str | None:
+        """Return the registry name for a template name, title or path, else ``None``."""
+        return self.aliases.get(key)
+
+    def template_dir(self, name: str) -> Path:
+        """Return the directory holding the template's own ``cookiecutter.json``."""
+        root = self.roots.get(name) or builtin_templates_dir()
+        return root / self.templates[name]["path"]
+
+
+def builtin_templates_dir() -> Path:
+    """Return the ``templates`` directory shipped inside the package."""
+    return Path(str(importlib.resources.files("repo_scaffold").joinpath("templates")))
+
+
+def overlay_path() -> Path | None:
+    """Return the user overlay registry file if one exists, else ``None``."""
+    configured = os.environ.get(OVERLAY_ENV_VAR, "").strip()
+    if configured:
+        path = Path(configured).expanduser()
+    else:
+        config_home = os.environ.get("XDG_CONFIG_HOME") or str(Path.home() / ".config")
+        path = Path(config_home) / "repo-scaffold" / "templates.json"
+    return path if path.is_file() else None
+
+
+def load_registry_json(registry_file: Path, *, root: Path | None = None) -> TemplateRegistry:
+    """Parse a ``{"templates": {...}}`` registry file and each template's ``cookiecutter.json``.
+
+    Args:
+        registry_file: Registry JSON file to read.
+        root: Directory that template ``path`` entries are relative to
+            (default: the registry file's directory).
+
+    Returns:
+        TemplateRegistry: Registry whose ``roots`` point every entry at ``root``.
+    """
+    root = root or registry_file.parent
+    with open(registry_file, encoding="utf-8") as f:
+        templates: dict[str, dict[str, str]] = json.load(f)["templates"]
+
+    aliases: dict[str, str] = {}
+    variables: dict[str, dict[str, Any]] = {}
+    for name, info in templates.items():
+        for alias in (info["path"], info["title"], name):
+            aliases[alias] = name
+        with open(root / info["path"] / "cookiecutter.json", encoding="utf-8") as f:
+            variables[name] = json.load(f)
+
+    return TemplateRegistry(
+        templates=templates,
+        aliases=aliases,
+        variables=variables,
+        roots=dict.fromkeys(templates, root),
+    )
+
+
+@functools.cache
+def _load(overlay: Path | None) -> TemplateRegistry:
+    with span("registry"):
+        if overlay is None:
+            from . import _index
+
+            return TemplateRegistry(templates=_index.TEMPLATES, aliases=_index.ALIASES, variables=_index.VARIABLES)
+
+        builtin_dir = builtin_templates_dir()
+        builtin = load_registry_json(builtin_dir / "cookiecutter.json")
+        user = load_registry_json(overlay)
+        return TemplateRegistry(
+            templates={**builtin.templates, **user.templates},
+            aliases={**builtin.aliases, **user.aliases},
+            variables={**builtin.variables, **user.variables},
+            roots={**builtin.roots, **user.roots},
+        )
+
+
+def get_registry() -> TemplateRegistry:
+    """Return the active registry: the precompiled index, or builtin + overlay JSON.
+
+    The result is memoized per overlay file, so repeated calls within one
+    process (completions, batch generation) cost a dict lookup.
+    """
+    return _load(overlay_path())
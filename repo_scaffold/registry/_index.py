@@ -0,0 +1,682 @@
+"""Precompiled template registry.
+
+Generated by ``python -m repo_scaffold.registry.build`` from
+``repo_scaffold/templates/**/cookiecutter.json``. Do not edit by hand.
+"""
+
+from typing import Any
+
+
+TEMPLATES: dict[str, dict[str, str]] = {
+    "template-python": {
+        "path": "template-python",
+        "title": "python",
+        "description": "template for python project",
+    },
+    "template-uv-workspace": {
+        "path": "template-uv-workspace",
+        "title": "uv-workspace",
+        "description": "template for uv workspace python project",
+    },
+    "template-react": {
+        "path": "template-react",
+        "title": "react",
+        "description": "template for TanStack Start React project",
+    },
+    "template-rust": {
+        "path": "template-rust",
+        "title": "rust",
+        "description": "template for Axum + SQLx Rust workspace project",
+    },
+    "template-pnpm-workspace": {
+        "path": "template-pnpm-workspace",
+        "title": "pnpm-workspace",
+        "description": "template for pnpm workspace monorepo (vue-app / ts-lib / react-app / ts-cli)",
+    },
+    "template-ts-sdk": {
+        "path": "template-ts-sdk",
+        "title": "ts-sdk",
+        "description": "template for TypeScript SDK library (Vite lib mode, dual ESM+CJS)",
+    },
+    "template-vue-project": {
+        "path": "template-vue-project",
+        "title": "vue-project",
+        "description": "template for Vue 3 project with Router, Pinia, and Tailwind CSS",
+    },
+}
+
+ALIASES: dict[str, str] = {
+    "template-python": "template-python",
+    "python": "template-python",
+    "template-uv-workspace": "template-uv-workspace",
+    "uv-workspace": "template-uv-workspace",
+    "template-react": "template-react",
+    "react": "template-react",
+    "template-rust": "template-rust",
+    "rust": "template-rust",
+    "template-pnpm-workspace": "template-pnpm-workspace",
+    "pnpm-workspace": "template-pnpm-workspace",
+    "template-ts-sdk": "template-ts-sdk",
+    "ts-sdk": "template-ts-sdk",
+    "template-vue-project": "template-vue-project",
+    "vue-project": "template-vue-project",
+}
+
+VARIABLES: dict[str, dict[str, Any]] = {
+    "template-python": {
+        "repo_name": "my-python-project",
+        "full_name": "Your Name",
+        "email": "you@example.com",
+        "github_username": "your-github-username",
+        "project_slug": "{{ cookiecutter.repo_name.strip().lower().replace(' ', '_').replace('-', '_') }}",
+        "description": "A short description of the project.",
+        "min_python_version": [
+            "3.12",
+            "3.11",
+            "3.10",
+            "3.9",
+            "3.13",
+            "3.14",
+        ],
+        "max_python_version": [
+            "3.12",
+            "3.13",
+            "3.14",
+            "3.11",
+            "3.10",
+            "3.9",
+        ],
+        "use_podman": [
+            "no",
+            "yes",
+        ],
+        "include_cli": [
+            "yes",
+            "no",
+        ],
+        "use_github_actions": [
+            "yes",
+            "no",
+        ],
+        "pypi_server_url": "",
+        "install_after_generate": "yes",
+        "init_git": "yes",
+        "_conditional_paths": [
+            {
+                "when": {
+                    "include_cli": "no",
+                },
+                "exclude": [
+                    "{{cookiecutter.project_slug}}/cli.py",
+                ],
+            },
+            {
+                "when": {
+                    "use_podman": "no",
+                },
+                "exclude": [
+                    ".dockerignore",
+                    "container",
+                    ".github/workflows/container-release.yaml",
+                ],
+            },
+            {
+                "when": {
+                    "use_github_actions": "no",
+                },
+                "exclude": [
+                    ".github",
+                    "mkdocs.yml",
+                    "docs",
+                ],
+            },
+        ],
+        "_in_process_hooks": [
+            "post_gen_project",
+        ],
+        "_answer_schema": {
+            "project_slug": {
+                "pattern": "[a-zA-Z_][a-zA-Z0-9_]*",
+                "description": "a valid Python package name",
+            },
+            "max_python_version": {
+                "at_least": "min_python_version",
+            },
+            "install_after_generate": {
+                "choices": [
+                    "yes",
+                    "no",
+                ],
+            },
+            "init_git": {
+                "choices": [
+                    "yes",
+                    "no",
+                ],
+            },
+        },
+        "__prompts__": {
+            "repo_name": "项目名称 (my-awesome-project)",
+            "full_name": "作者姓名",
+            "email": "作者邮箱",
+            "github_username": "GitHub 用户名或组织名",
+            "description": "项目简短描述",
+            "min_python_version": "最低支持的 Python 版本 (这将影响测试范围和依赖兼容性)",
+            "max_python_version": "最高支持的 Python 版本",
+            "use_podman": "是否添加 Podman 支持?",
+            "include_cli": "是否添加命令行界面?",
+            "use_github_actions": "是否添加 GitHub Actions 和文档配置?",
+            "pypi_server_url": "私有 PyPI Server URL (可留空，发布时也可用 PYPI_SERVER_URL 覆盖)",
+        },
+    },
+    "template-uv-workspace": {
+        "repo_name": "my-uv-workspace",
+        "full_name": "Your Name",
+        "email": "you@example.com",
+        "github_username": "your-github-username",
+        "project_slug": "{{ cookiecutter.repo_name.strip().lower().replace(' ', '-').replace('_', '-') }}",
+        "package_name": "{{ cookiecutter.project_slug }}-core",
+        "package_slug": "{{ cookiecutter.package_name.strip().lower().replace(' ', '-').replace('_', '-') }}",
+        "package_module": "{{ cookiecutter.package_slug.replace('-', '_') }}",
+        "description": "A short description of the workspace.",
+        "min_python_version": [
+            "3.12",
+            "3.11",
+            "3.10",
+            "3.13",
+            "3.14",
+        ],
+        "max_python_version": [
+            "3.12",
+            "3.13",
+            "3.14",
+            "3.11",
+            "3.10",
+        ],
+        "use_github_actions": [
+            "yes",
+            "no",
+        ],
+        "pypi_server_url": "",
+        "install_after_generate": "yes",
+        "init_git": "yes",
+        "_conditional_paths": [
+            {
+                "when": {
+                    "use_github_actions": "no",
+                },
+                "exclude": [
+                    ".github",
+                    "mkdocs.yml",
+                    "docs",
+                ],
+            },
+        ],
+        "_in_process_hooks": [
+            "post_gen_project",
+        ],
+        "_answer_schema": {
+            "project_slug": {
+                "pattern": "[a-z0-9][a-z0-9-]*",
+                "description": "a lowercase repository slug using letters, numbers, and hyphens",
+            },
+            "package_slug": {
+                "pattern": "[a-z0-9][a-z0-9-]*",
+                "description": "a lowercase distribution name using letters, numbers, and hyphens",
+            },
+            "package_module": {
+                "pattern": "[a-zA-Z_][a-zA-Z0-9_]*",
+                "description": "a valid Python module name",
+            },
+            "max_python_version": {
+                "at_least": "min_python_version",
+            },
+            "install_after_generate": {
+                "choices": [
+                    "yes",
+                    "no",
+                ],
+            },
+            "init_git": {
+                "choices": [
+                    "yes",
+                    "no",
+                ],
+            },
+        },
+        "__prompts__": {
+            "repo_name": "工作区仓库名称 (my-uv-workspace)",
+            "full_name": "作者姓名",
+            "email": "作者邮箱",
+            "github_username": "GitHub 用户名或组织名",
+            "package_name": "初始 workspace member 包名 (如 my-project-core)",
+            "description": "项目简短描述",
+            "min_python_version": "最低支持的 Python 版本",
+            "max_python_version": "最高支持的 Python 版本",
+            "use_github_actions": "是否添加 GitHub Actions 和文档配置?",
+            "pypi_server_url": "私有 PyPI Server URL (可留空，发布时也可用 PYPI_SERVER_URL 覆盖)",
+        },
+    },
+    "template-react": {
+        "repo_name": "my-react-app",
+        "full_name": "Your Name",
+        "email": "you@example.com",
+        "github_username": "your-github-username",
+        "project_slug": "{{ cookiecutter.repo_name.strip().lower().replace(' ', '-').replace('_', '-') }}",
+        "description": "A TanStack Start application.",
+        "include_demos": [
+            "yes",
+            "no",
+        ],
+        "use_docker": [
+            "yes",
+            "no",
+        ],
+        "use_github_actions": [
+            "yes",
+            "no",
+        ],
+        "install_after_generate": "yes",
+        "init_git": "yes",
+        "_conditional_paths": [
+            {
+                "exclude": [
+                    "_shared",
+                ],
+            },
+            {
+                "when": {
+                    "include_demos": "no",
+                },
+                "exclude": [
+                    "src/routes/examples",
+                    "src/lib/store.ts",
+                    "src/lib/store-devtools.tsx",
+                    "src/components/FormComponents.tsx",
+                    "src/hooks/form-context.ts",
+                    "src/hooks/form.ts",
+                ],
+            },
+            {
+                "when": {
+                    "use_docker": "no",
+                },
+                "exclude": [
+                    ".dockerignore",
+                    "container",
+                ],
+            },
+            {
+                "when": {
+                    "use_github_actions": "no",
+                },
+                "exclude": [
+                    ".github",
+                    "cog.toml",
+                ],
+            },
+        ],
+        "_in_process_hooks": [
+            "post_gen_project",
+        ],
+        "_answer_schema": {
+            "project_slug": {
+                "pattern": "[a-z0-9][a-z0-9-]*",
+                "description": "a lowercase repository slug using letters, numbers, and hyphens",
+            },
+            "install_after_generate": {
+                "choices": [
+                    "yes",
+                    "no",
+                ],
+            },
+            "init_git": {
+                "choices": [
+                    "yes",
+                    "no",
+                ],
+            },
+        },
+        "__prompts__": {
+            "repo_name": "项目名称 (my-react-app)",
+            "full_name": "作者姓名",
+            "email": "作者邮箱",
+            "github_username": "GitHub 用户名或组织名",
+            "description": "项目简短描述",
+            "include_demos": "是否包含 Demo 示例页面?",
+            "use_docker": "是否添加 Docker/Podman 容器化支持?",
+            "use_github_actions": "是否添加 GitHub Actions CI 配置?",
+        },
+    },
+    "template-rust": {
+        "repo_name": "my-rust-project",
+        "full_name": "Your Name",
+        "email": "you@example.com",
+        "github_username": "your-github-username",
+        "project_slug": "{{ cookiecutter.repo_name.strip().lower().replace(' ', '-').replace('_', '-') }}",
+        "crate_name": "{{ cookiecutter.project_slug.replace('-', '_') }}",
+        "description": "An Axum + SQLx web API.",
+        "use_docker": [
+            "yes",
+            "no",
+        ],
+        "use_github_actions": [
+            "yes",
+            "no",
+        ],
+        "use_openapi": [
+            "yes",
+            "no",
+        ],
+        "use_opentelemetry": [
+            "yes",
+            "no",
+        ],
+        "install_after_generate": "yes",
+        "init_git": "yes",
+        "_conditional_paths": [
+            {
+                "when": {
+                    "use_docker": "no",
+                },
+                "exclude": [
+                    ".dockerignore",
+                    "container",
+                ],
+            },
+            {
+                "when": {
+                    "use_github_actions": "no",
+                },
+                "exclude": [
+                    ".github",
+                    "cog.toml",
+                ],
+            },
+            {
+                "when": {
+                    "use_opentelemetry": "no",
+                },
+                "exclude": [
+                    "packages/api-server/src/common/opentelemetry.rs",
+                ],
+            },
+        ],
+        "_in_process_hooks": [
+            "post_gen_project",
+        ],
+        "_answer_schema": {
+            "project_slug": {
+                "pattern": "[a-z0-9][a-z0-9-]*",
+                "description": "a lowercase repository slug using letters, numbers, and hyphens",
+            },
+            "install_after_generate": {
+                "choices": [
+                    "yes",
+                    "no",
+                ],
+            },
+            "init_git": {
+                "choices": [
+                    "yes",
+                    "no",
+                ],
+            },
+        },
+        "__prompts__": {
+            "repo_name": "项目名称 (my-rust-project)",
+            "full_name": "作者姓名",
+            "email": "作者邮箱",
+            "github_username": "GitHub 用户名或组织名",
+            "crate_name": "Rust crate 名称 (默认从项目名生成)",
+            "description": "项目简短描述",
+            "use_docker": "是否添加 Docker/Podman 容器化支持?",
+            "use_github_actions": "是否添加 GitHub Actions CI 配置?",
+            "use_openapi": "是否添加 OpenAPI/Swagger 文档 (utoipa)?",
+            "use_opentelemetry": "是否添加 OpenTelemetry 可观测性支持?",
+        },
+    },
+    "template-pnpm-workspace": {
+        "repo_name": "my-pnpm-workspace",
+        "full_name": "Your Name",
+        "email": "you@example.com",
+        "github_username": "your-github-username",
+        "project_slug": "{{ cookiecutter.repo_name.strip().lower().replace(' ', '-').replace('_', '-') }}",
+        "package_name": "{{ cookiecutter.project_slug }}-core",
+        "package_slug": "{{ cookiecutter.package_name.strip().lower().replace(' ', '-').replace('_', '-') }}",
+        "description": "A pnpm workspace monorepo.",
+        "initial_package_type": [
+            "vue-app",
+            "ts-lib",
+            "react-app",
+            "ts-cli",
+        ],
+        "use_github_actions": [
+            "yes",
+            "no",
+        ],
+        "install_after_generate": "yes",
+        "init_git": "yes",
+        "_conditional_paths": [
+            {
+                "exclude": [
+                    "_shared",
+                ],
+            },
+            {
+                "when": {
+                    "initial_package_type": "vue-app",
+                },
+                "exclude": [
+                    "packages/_ts-lib",
+                    "packages/_react-app",
+                    "packages/_ts-cli",
+                ],
+                "rename": {
+                    "packages/_vue-app": "packages/{{cookiecutter.package_slug}}",
+                },
+            },
+            {
+                "when": {
+                    "initial_package_type": "ts-lib",
+                },
+                "exclude": [
+                    "packages/_vue-app",
+                    "packages/_react-app",
+                    "packages/_ts-cli",
+                ],
+                "rename": {
+                    "packages/_ts-lib": "packages/{{cookiecutter.package_slug}}",
+                },
+            },
+            {
+                "when": {
+                    "initial_package_type": "react-app",
+                },
+                "exclude": [
+                    "packages/_vue-app",
+                    "packages/_ts-lib",
+                    "packages/_ts-cli",
+                ],
+                "rename": {
+                    "packages/_react-app": "packages/{{cookiecutter.package_slug}}",
+                },
+            },
+            {
+                "when": {
+                    "initial_package_type": "ts-cli",
+                },
+                "exclude": [
+                    "packages/_vue-app",
+                    "packages/_ts-lib",
+                    "packages/_react-app",
+                ],
+                "rename": {
+                    "packages/_ts-cli": "packages/{{cookiecutter.package_slug}}",
+                },
+            },
+            {
+                "when": {
+                    "use_github_actions": "no",
+                },
+                "exclude": [
+                    ".github",
+                    "cog.toml",
+                ],
+            },
+        ],
+        "_in_process_hooks": [
+            "post_gen_project",
+        ],
+        "_answer_schema": {
+            "project_slug": {
+                "pattern": "[a-z0-9][a-z0-9-]*",
+                "description": "a lowercase repository slug using letters, numbers, and hyphens",
+            },
+            "package_slug": {
+                "pattern": "[a-z0-9][a-z0-9-]*",
+                "description": "a lowercase distribution name using letters, numbers, and hyphens",
+            },
+            "install_after_generate": {
+                "choices": [
+                    "yes",
+                    "no",
+                ],
+            },
+            "init_git": {
+                "choices": [
+                    "yes",
+                    "no",
+                ],
+            },
+        },
+        "__prompts__": {
+            "repo_name": "工作区仓库名称 (my-pnpm-workspace)",
+            "full_name": "作者姓名",
+            "email": "作者邮箱",
+            "github_username": "GitHub 用户名或组织名",
+            "package_name": "初始子包名称 (如 my-project-core)",
+            "description": "项目简短描述",
+            "initial_package_type": "初始子包类型",
+            "use_github_actions": "是否添加 GitHub Actions CI 配置?",
+        },
+    },
+    "template-ts-sdk": {
+        "repo_name": "my-ts-sdk",
+        "full_name": "Your Name",
+        "email": "you@example.com",
+        "github_username": "your-github-username",
+        "project_slug": "{{ cookiecutter.repo_name.strip().lower().replace(' ', '-').replace('_', '-') }}",
+        "description": "A TypeScript SDK library.",
+        "use_github_actions": [
+            "yes",
+            "no",
+        ],
+        "install_after_generate": "yes",
+        "init_git": "yes",
+        "_conditional_paths": [
+            {
+                "exclude": [
+                    "_shared",
+                ],
+            },
+            {
+                "when": {
+                    "use_github_actions": "no",
+                },
+                "exclude": [
+                    ".github",
+                    "cog.toml",
+                ],
+            },
+        ],
+        "_in_process_hooks": [
+            "post_gen_project",
+        ],
+        "_answer_schema": {
+            "project_slug": {
+                "pattern": "[a-z0-9][a-z0-9-]*",
+                "description": "a lowercase repository slug using letters, numbers, and hyphens",
+            },
+            "install_after_generate": {
+                "choices": [
+                    "yes",
+                    "no",
+                ],
+            },
+            "init_git": {
+                "choices": [
+                    "yes",
+                    "no",
+                ],
+            },
+        },
+        "__prompts__": {
+            "repo_name": "项目名称 (my-ts-sdk)",
+            "full_name": "作者姓名",
+            "email": "作者邮箱",
+            "github_username": "GitHub 用户名或组织名",
+            "description": "项目简短描述",
+            "use_github_actions": "是否添加 GitHub Actions CI 配置?",
+        },
+    },
+    "template-vue-project": {
+        "repo_name": "my-vue-app",
+        "full_name": "Your Name",
+        "email": "you@example.com",
+        "github_username": "your-github-username",
+        "project_slug": "{{ cookiecutter.repo_name.strip().lower().replace(' ', '-').replace('_', '-') }}",
+        "description": "A Vue 3 application with Router, Pinia, and Tailwind CSS.",
+        "use_github_actions": [
+            "yes",
+            "no",
+        ],
+        "install_after_generate": "yes",
+        "init_git": "yes",
+        "_conditional_paths": [
+            {
+                "exclude": [
+                    "_shared",
+                ],
+            },
+            {
+                "when": {
+                    "use_github_actions": "no",
+                },
+                "exclude": [
+                    ".github",
+                    "cog.toml",
+                ],
+            },
+        ],
+        "_in_process_hooks": [
+            "post_gen_project",
+        ],
+        "_answer_schema": {
+            "project_slug": {
+                "pattern": "[a-z0-9][a-z0-9-]*",
+                "description": "a lowercase repository slug using letters, numbers, and hyphens",
+            },
+            "install_after_generate": {
+                "choices": [
+                    "yes",
+                    "no",
+                ],
+            },
+            "init_git": {
+                "choices": [
+                    "yes",
+                    "no",
+                ],
+            },
+        },
+        "__prompts__": {
+            "repo_name": "项目名称 (my-vue-app)",
+            "full_name": "作者姓名",
+            "email": "作者邮箱",
+            "github_username": "GitHub 用户名或组织名",
+            "description": "项目简短描述",
+            "use_github_actions": "是否添加 GitHub Actions CI 配置?",
+        },
+    },
+}
@@ -0,0 +1,94 @@
+"""Generate :mod:`repo_scaffold.registry._index` from the template JSON files.
+
+Run after editing ``templates/cookiecutter.json`` or any template's own
+``cookiecutter.json``::
+
+    python -m repo_scaffold.registry.build          # rewrite _index.py
+    python -m repo_scaffold.registry.build --check  # exit 1 if _index.py is stale
+
+``just registry`` wraps the first form and ``just build`` runs it before
+packaging, so released wheels always ship an up-to-date index.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from . import builtin_templates_dir
+from . import load_registry_json
+
+
+INDEX_PATH = Path(__file__).with_name("_index.py")
+
+_HEADER = '''"""Precompiled template registry.
+
+Generated by ``python -m repo_scaffold.registry.build`` from
+``repo_scaffold/templates/**/cookiecutter.json``. Do not edit by hand.
+"""
+
+from typing import Any
+
+
+'''
+
+
+def _literal(value: object, indent: int = 0) -> str:
+    """Format JSON-compatible data as a Python literal, one element per line.
+
+    Every container is fully expanded with a trailing comma, which is what
+    ``ruff format`` would produce for it, so regenerating never fights the
+    formatter.
+    """
+    pad = " " * (indent + 4)
+    if isinstance(value, dict):
+        if not value:
+            return "{}"
+        items = "".join(
+            f"{pad}{json.dumps(k, ensure_ascii=False)}: {_literal(v, indent + 4)},\n" for k, v in value.items()
+        )
+        return "{\n" + items + " " * indent + "}"
+    if isinstance(value, list):
+        if not value:
+            return "[]"
+        items = "".join(f"{pad}{_literal(v, indent + 4)},\n" for v in value)
+        return "[\n" + items + " " * indent + "]"
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    return repr(value)
+
+
+def render_index() -> str:
+    """Return the source of ``_index.py`` for the current template JSON files."""
+    registry = load_registry_json(builtin_templates_dir() / "cookiecutter.json")
+    return (
+        _HEADER
+        + f"TEMPLATES: dict[str, dict[str, str]] = {_literal(registry.templates)}\n\n"
+        + f"ALIASES: dict[str, str] = {_literal(registry.aliases)}\n\n"
+        + f"VARIABLES: dict[str, dict[str, Any]] = {_literal(registry.variables)}\n"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Write (or with ``--check``, verify) the generated index module."""
+    parser = argparse.ArgumentParser(prog="python -m repo_scaffold.registry.build")
+    parser.add_argument("--check", action="store_true", help="fail if the index is out of date")
+    args = parser.parse_args(argv)
+
+    source = render_index()
+    current = INDEX_PATH.read_text(encoding="utf-8") if INDEX_PATH.is_file() else ""
+    if args.check:
+        if current != source:
+            print(f"{INDEX_PATH} is out of date; run `just registry`.", file=sys.stderr)
+            return 1
+        return 0
+    if current != source:
+        INDEX_PATH.write_text(source, encoding="utf-8")
+        print(f"Wrote {INDEX_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""In-process project generation for ``repo-scaffold``.
+
+The package is split into:
+
+- :mod:`repo_scaffold.render.engine` — ``RenderEngine`` resolves answers and
+  renders projects; ``TemplateRenderer`` holds one template's Jinja
+  environment, compiled templates and scanned source tree so they are reused
+  for every project rendered from it.
+- :mod:`repo_scaffold.render.conditions` — per-template ``_conditional_paths``
+  rules that keep files the post-gen hook would delete from being rendered.
+- :mod:`repo_scaffold.render.schema` — per-template ``_answer_schema`` rules
+  checked before rendering (and by the post-gen hooks).
+- :mod:`repo_scaffold.render.hooks` — runs the hooks a template lists under
+  ``_in_process_hooks`` in this process (imported once per template) instead
+  of a fresh interpreter per project.
+- :mod:`repo_scaffold.render.archive` — ``create --format tar|tar.gz|zip``:
+  stream a rendered project as an archive without writing it to disk.
+- :mod:`repo_scaffold.render.batch` — manifest parsing and the
+  ``create-batch`` driver (``load_manifest``, ``run_batch``).
+- :mod:`repo_scaffold.render.cache` — the per-version on-disk cache directory
+  (compiled Jinja bytecode) and the merge-base store behind
+  ``repo-scaffold cache stats|clear``.
+- :mod:`repo_scaffold.render.lockfile` — the ``.repo-scaffold.json`` lockfile
+  recording each project's template, version, answers and file hashes.
+- :mod:`repo_scaffold.render.update` — ``repo-scaffold update``: re-render the
+  changed template files of a project and merge them with the user's edits
+  (three-way merge in :mod:`repo_scaffold.render.merge`).
+- :mod:`repo_scaffold.render.drift` — ``repo-scaffold drift``: compare many
+  generated projects with the current templates and report what differs.
+"""
+
+from __future__ import annotations
+
+from .archive import ARCHIVE_FORMATS
+from .archive import archive_chunks
+from .archive import write_archive
+from .batch import BatchEntry
+from .batch import BatchResult
+from .batch import format_results
+from .batch import load_manifest
+from .batch import run_batch
+from .conditions import excluded_paths
+from .conditions import is_excluded
+from .drift import DriftReport
+from .drift import ProjectDrift
+from .drift import format_report
+from .drift import scan_drift
+from .engine import ProjectOutsideRootError
+from .engine import RenderedFile
+from .engine import RenderEngine
+from .engine import TemplateRenderer
+from .engine import write_tree
+from .lockfile import LOCKFILE_NAME
+from .lockfile import Lockfile
+from .lockfile import read_lockfile
+from .schema import InvalidAnswersError
+from .schema import answer_errors
+from .schema import validate_answers
+from .update import FileChange
+from .update import UpdateResult
+from .update import format_changes
+from .update import update_project
+
+
+__all__ = [
+    "ARCHIVE_FORMATS",
+    "LOCKFILE_NAME",
+    "BatchEntry",
+    "BatchResult",
+    "DriftReport",
+    "FileChange",
+    "InvalidAnswersError",
+    "Lockfile",
+    "ProjectDrift",
+    "ProjectOutsideRootError",
+    "RenderEngine",
+    "RenderedFile",
+    "TemplateRenderer",
+    "UpdateResult",
+    "answer_errors",
+    "archive_chunks",
+    "excluded_paths",
+    "format_changes",
+    "format_report",
+    "format_results",
+    "is_excluded",
+    "load_manifest",
+    "read_lockfile",
+    "run_batch",
+    "scan_drift",
+    "update_project",
+    "validate_answers",
+    "write_archive",
+    "write_tree",
+]
@@ -0,0 +1,279 @@
+"""Batch generation for ``repo-scaffold create-batch``.
+
+A manifest lists the projects to generate. TOML, JSON and YAML are accepted
+and share one shape::
+
+    [defaults]                      # optional, applied to every entry
+    output_dir = "services"
+    extra_context = { full_name = "Platform Team" }
+
+    [[projects]]
+    template = "python"
+    extra_context = { repo_name = "billing" }
+
+    [[projects]]
+    template = "rust"
+    output_dir = "edge"
+    extra_context = { repo_name = "gateway" }
+
+Relative ``output_dir`` values are resolved against the manifest's directory.
+With ``jobs=1`` every entry is rendered in the current process by one
+``RenderEngine``, so each template's Jinja environment and compiled files are
+shared by all the entries that use it. With ``jobs > 1`` entries fan out over a
+``ProcessPoolExecutor``; each worker keeps its own engine for the entries it
+runs, writes only to that entry's output directory, and captures the entry's
+stdout/stderr (including hook subprocesses) so the parent can replay the logs
+in manifest order without interleaving. Before fanning out, the parent checks
+every entry's answers against its template's ``_answer_schema``, so invalid
+entries fail straight away instead of occupying a worker.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import time
+import tomllib
+from collections.abc import Callable
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+
+import click
+
+from .engine import RenderEngine
+
+
+@dataclass
+class BatchEntry:
+    """One project to generate from a manifest."""
+
+    template: str
+    output_dir: Path
+    extra_context: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one manifest entry."""
+
+    entry: BatchEntry
+    seconds: float
+    project_dir: Path | None = None
+    error: str | None = None
+    log: str = ""  # captured output; only filled in when running with jobs > 1
+
+    @property
+    def ok(self) -> bool:
+        """Whether the project was generated successfully."""
+        return self.error is None
+
+
+def read_manifest(path: Path) -> dict[str, Any]:
+    """Load a ``.toml``, ``.json`` or ``.yaml`` manifest into a dict (shared with ``gh-init-batch``)."""
+    suffix = path.suffix.lower()
+    if suffix == ".toml":
+        with path.open("rb") as f:
+            return tomllib.load(f)
+    if suffix == ".json":
+        with path.open(encoding="utf-8") as f:
+            return json.load(f)
+    if suffix in {".yaml", ".yml"}:
+        # PyYAML ships with cookiecutter; imported here so TOML/JSON manifests don't need it.
+        import yaml
+
+        with path.open(encoding="utf-8") as f:
+            return yaml.safe_load(f) or {}
+    raise click.ClickException(f"Unsupported manifest format '{path.suffix}' (expected .toml, .json or .yaml)")
+
+
+def load_manifest(path: Path) -> list[BatchEntry]:
+    """Parse a batch manifest into entries.
+
+    Args:
+        path: Manifest file (``.toml``, ``.json``, ``.yaml`` or ``.yml``).
+
+    Returns:
+        list[BatchEntry]: Entries in manifest order.
+
+    Raises:
+        click.ClickException: When the manifest is malformed.
+    """
+    data = read_manifest(path)
+    defaults = data.get("defaults", {}) or {}
+    projects = data.get("projects")
+    if not isinstance(projects, list) or not projects:
+        raise click.ClickException(f"{path}: expected a non-empty 'projects' list")
+
+    base_dir = path.resolve().parent
+    entries: list[BatchEntry] = []
+    for index, project in enumerate(projects, start=1):
+        template = project.get("template") or defaults.get("template")
+        if not template:
+            raise click.ClickException(f"{path}: project #{index} has no 'template'")
+        output_dir = Path(project.get("output_dir") or defaults.get("output_dir") or ".")
+        extra_context = {**(defaults.get("extra_context") or {}), **(project.get("extra_context") or {})}
+        entries.append(
+            BatchEntry(
+                template=str(template),
+                output_dir=output_dir if output_dir.is_absolute() else base_dir / output_dir,
+                extra_context=extra_context,
+            )
+        )
+    return entries
+
+
+def run_entry(engine: RenderEngine, entry: BatchEntry, flags: dict[str, str]) -> BatchResult:
+    """Generate one entry, capturing any failure in the result instead of raising."""
+    start = time.perf_counter()
+    try:
+        entry.output_dir.mkdir(parents=True, exist_ok=True)
+        project_dir = engine.generate(
+            entry.template,
+            output_dir=entry.output_dir,
+            extra_context={**entry.extra_context, **flags},
+            no_input=True,
+        )
+    except Exception as exc:
+        return BatchResult(entry=entry, seconds=time.perf_counter() - start, error=str(exc) or type(exc).__name__)
+    return BatchResult(entry=entry, seconds=time.perf_counter() - start, project_dir=project_dir)
+
+
+def check_entry(engine: RenderEngine, entry: BatchEntry, flags: dict[str, str]) -> BatchResult | None:
+    """Validate one entry's answers without rendering; return its failed result, or ``None`` if it is valid."""
+    start = time.perf_counter()
+    try:
+        engine.check(entry.template, output_dir=entry.output_dir, extra_context={**entry.extra_context, **flags})
+    except Exception as exc:
+        return BatchResult(entry=entry, seconds=time.perf_counter() - start, error=str(exc) or type(exc).__name__)
+    return None
+
+
+# Engine owned by a pool worker process, reused for every entry it runs.
+_worker_engine: RenderEngine | None = None
+
+
+def _run_in_worker(entry: BatchEntry, flags: dict[str, str]) -> BatchResult:
+    """Pool task: generate one entry with file descriptors 1 and 2 captured into ``log``.
+
+    Redirecting the descriptors also captures the output of hook scripts and
+    of the commands hooks run as child processes; ``sys.stdout`` and
+    ``sys.stderr`` are pointed at the log too, for hooks called in-process.
+    """
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = RenderEngine()
+
+    with tempfile.TemporaryFile() as log:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        saved = (os.dup(1), os.dup(2))
+        os.dup2(log.fileno(), 1)
+        os.dup2(log.fileno(), 2)
+        stream = open(log.fileno(), "w", encoding="utf-8", buffering=1, closefd=False)  # noqa: SIM115
+        try:
+            with contextlib.redirect_stdout(stream), contextlib.redirect_stderr(stream):
+                result = run_entry(_worker_engine, entry, flags)
+        finally:
+            stream.close()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved[0], 1)
+            os.dup2(saved[1], 2)
+            os.close(saved[0])
+            os.close(saved[1])
+        log.seek(0)
+        result.log = log.read().decode("utf-8", errors="replace")
+    return result
+
+
+def run_batch(
+    entries: Iterable[BatchEntry],
+    *,
+    no_install: bool = False,
+    no_git: bool = False,
+    jobs: int = 1,
+    engine: RenderEngine | None = None,
+    on_result: Callable[[BatchResult], None] | None = None,
+) -> list[BatchResult]:
+    """Generate every entry and return results in manifest order.
+
+    Args:
+        entries: Entries to generate.
+        no_install: Skip post-generation dependency installation.
+        no_git: Skip ``git init``.
+        jobs: Number of worker processes; ``1`` renders in this process.
+        engine: Engine for in-process rendering (``jobs=1`` only).
+        on_result: Called with each result in manifest order as soon as it
+            and every earlier entry have finished (used to replay logs).
+
+    A failing entry, or a crashed worker, does not stop the batch; the error
+    is recorded on that entry's result.
+    """
+    entries = [*entries]
+    flags = {
+        "install_after_generate": "no" if no_install else "yes",
+        "init_git": "no" if no_git else "yes",
+    }
+    results: list[BatchResult] = []
+
+    if jobs <= 1:
+        engine = engine or RenderEngine()
+        for entry in entries:
+            result = run_entry(engine, entry, flags)
+            if on_result is not None:
+                on_result(result)
+            results.append(result)
+        return results
+
+    checker = RenderEngine(use_bytecode_cache=False, use_render_cache=False)
+    rejected = [check_entry(checker, entry, flags) for entry in entries]
+    valid = [entry for entry, failed in zip(entries, rejected, strict=True) if failed is None]
+    with ProcessPoolExecutor(max_workers=max(1, min(jobs, len(valid) or 1))) as pool:
+        futures = iter([pool.submit(_run_in_worker, entry, flags) for entry in valid])
+        for entry, failed in zip(entries, rejected, strict=True):
+            if failed is not None:
+                result = failed
+            else:
+                try:
+                    result = next(futures).result()
+                except Exception as exc:  # the worker itself died, e.g. BrokenProcessPool
+                    result = BatchResult(entry=entry, seconds=0.0, error=str(exc) or type(exc).__name__)
+            if on_result is not None:
+                on_result(result)
+            results.append(result)
+    return results
+
+
+def format_results(results: list[BatchResult], *, wall_seconds: float | None = None) -> list[str]:
+    """Render results as the lines of a fixed-width timing table.
+
+    ``wall_seconds``, when given, is appended to the summary line; with a
+    process pool it is smaller than the summed per-project times.
+    """
+    rows = [
+        (
+            result.entry.template,
+            str(result.project_dir or result.entry.output_dir),
+            f"{result.seconds:.2f}s",
+            "ok" if result.ok else f"FAILED: {result.error}",
+        )
+        for result in results
+    ]
+    header = ("Template", "Project", "Time", "Status")
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(3)]
+    lines = []
+    for row in [header, *rows]:
+        lines.append(f"{row[0]:<{widths[0]}}  {row[1]:<{widths[1]}}  {row[2]:>{widths[2]}}  {row[3]}")
+    total = sum(result.seconds for result in results)
+    summary = f"{len(results)} projects, {sum(not r.ok for r in results)} failed, {total:.2f}s total"
+    if wall_seconds is not None:
+        summary += f" ({wall_seconds:.2f}s wall)"
+    lines.append(summary)
+    return lines
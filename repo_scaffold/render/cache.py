@@ -0,0 +1,449 @@
+"""On-disk caches for the render engine, and the ``repo-scaffold cache`` helpers.
+
+Everything lives under one user cache directory (``$REPO_SCAFFOLD_CACHE_DIR``,
+else ``$XDG_CACHE_HOME/repo-scaffold``, else ``~/.cache/repo-scaffold``), in a
+subdirectory per repo-scaffold version so an upgrade never reads entries
+written by another release::
+
+    ~/.cache/repo-scaffold/
+        0.24.0/
+            jinja/      compiled template bytecode (``RenderBytecodeCache``)
+            render/     complete rendered trees (``RenderCache``)
+        base/           rendered file contents by SHA-256, shared by all versions
+        drift/          per-project file stats and hashes from the last ``drift`` scan
+
+``base/`` keeps what ``create`` and ``update`` wrote for each template file, so
+``repo-scaffold update`` can three-way merge a file the user edited against
+the output it was generated from. It is shared across versions on purpose:
+the base is needed exactly when the template has changed. Identical files
+generated into many projects are stored once; clearing the cache only means
+later updates of edited files report conflicts instead of merging.
+
+Jinja names each bytecode entry after the template's path and stores the
+SHA-1 of its source alongside the code; an entry whose source hash no longer
+matches is recompiled and overwritten, so warm renders skip compilation and
+edited templates never run stale code.
+
+``render/`` goes one step further: a project rendered from the same template
+contents with the same resolved answers is not rendered at all. Trees are
+content-addressed (``trees/<key>.json`` lists the files, ``objects/`` holds
+each distinct file content once) and materialized by cloning the objects:
+
+- ``REPO_SCAFFOLD_LINK_MODE=clone`` (default): reflink where the filesystem
+  supports it (btrfs, XFS), else copy. Projects never share storage.
+- ``REPO_SCAFFOLD_LINK_MODE=hardlink``: hardlink, else copy. Fastest, but
+  projects created from identical answers share inodes with the cache and with
+  each other, so an editor that writes in place changes all of them; only
+  use it for throwaway or read-only trees (CI checks, benchmarks).
+- ``REPO_SCAFFOLD_LINK_MODE=copy``.
+
+Every object's size, mode and mtime are checked before a hit is used, so an
+object changed through a hardlink is detected and the tree re-rendered. The
+cache is bounded to ``$REPO_SCAFFOLD_RENDER_CACHE_MB`` (default 256) MiB,
+evicting the least recently used trees first. Its size is tracked as a running
+total next to the hit and miss counters, in a fixed-size ``counters`` file
+updated under a file lock; stores add what they write, and the cache is only
+walked (and the total corrected) once that total crosses the bound.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import struct
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+from jinja2 import FileSystemBytecodeCache
+from jinja2.bccache import Bucket
+
+
+if TYPE_CHECKING:
+    from .engine import RenderedFile
+
+
+CACHE_DIR_ENV_VAR = "REPO_SCAFFOLD_CACHE_DIR"
+LINK_MODE_ENV_VAR = "REPO_SCAFFOLD_LINK_MODE"
+RENDER_CACHE_SIZE_ENV_VAR = "REPO_SCAFFOLD_RENDER_CACHE_MB"
+DEFAULT_RENDER_CACHE_MB = 256
+_FICLONE = 0x40049409  # linux/fs.h: _IOW(0x94, 9, int)
+# render/counters: lookup hits, lookup misses, estimated size of trees/ and objects/ in bytes.
+_COUNTERS = struct.Struct("<qqq")
+
+
+@dataclass
+class CacheStats:
+    """Size of one named cache on disk."""
+
+    name: str
+    path: Path
+    entries: int
+    size_bytes: int
+    hits: int | None = None  # for caches that count lookups across runs
+    misses: int | None = None
+
+
+def package_version() -> str:
+    """Return the installed repo-scaffold version (``"dev"`` for a source checkout)."""
+    try:
+        return version("repo-scaffold")
+    except PackageNotFoundError:
+        return "dev"
+
+
+def cache_root() -> Path:
+    """Return the user cache directory shared by every repo-scaffold version."""
+    configured = os.environ.get(CACHE_DIR_ENV_VAR, "").strip()
+    if configured:
+        return Path(configured).expanduser()
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "repo-scaffold"
+
+
+def version_cache_dir() -> Path:
+    """Return the cache directory for the running repo-scaffold version."""
+    return cache_root() / package_version()
+
+
+class RenderBytecodeCache(FileSystemBytecodeCache):
+    """``FileSystemBytecodeCache`` that counts hits and misses for this process."""
+
+    def __init__(self, directory: Path):
+        """Store bytecode under ``directory`` (created if missing)."""
+        directory.mkdir(parents=True, exist_ok=True)
+        super().__init__(str(directory))
+        self.hits = 0
+        self.misses = 0
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        """Load ``bucket`` and record whether it held code for the current source."""
+        super().load_bytecode(bucket)
+        if bucket.code is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+
+def open_bytecode_cache() -> RenderBytecodeCache | None:
+    """Return the bytecode cache for this version, or ``None`` if it can't be created.
+
+    A read-only or missing home directory must never break generation, so any
+    ``OSError`` simply disables the cache.
+    """
+    try:
+        return RenderBytecodeCache(version_cache_dir() / "jinja")
+    except OSError:
+        return None
+
+
+class RenderCache:
+    """Rendered project trees keyed by template contents and resolved context, with LRU eviction.
+
+    Lookups are counted across runs in the ``counters`` file, read and
+    rewritten under an exclusive lock so concurrent ``create-batch`` workers
+    never lose an update, and for this process in the ``hits`` and ``misses``
+    attributes.
+    """
+
+    def __init__(self, directory: Path, *, max_bytes: int, link_mode: str = "clone"):
+        """Keep trees under ``directory`` (created if missing), at most ``max_bytes`` in total."""
+        self.directory = directory
+        self.trees = directory / "trees"
+        self.objects = directory / "objects"
+        self.counters = directory / "counters"
+        self.trees.mkdir(parents=True, exist_ok=True)
+        self.objects.mkdir(exist_ok=True)
+        self.max_bytes = max_bytes
+        self.link_mode = link_mode
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(template_hash: str, context: dict[str, Any]) -> str:
+        """Return the cache key for rendering a template with contents ``template_hash`` in ``context``.
+
+        ``_output_dir`` is left out: it does not affect what is rendered, and
+        including it would make every new output directory a miss.
+        """
+        variables = {name: value for name, value in context["cookiecutter"].items() if name != "_output_dir"}
+        return content_hash(json.dumps([template_hash, variables], sort_keys=True, default=str).encode("utf-8"))
+
+    def _count(self, name: str) -> None:
+        setattr(self, name, getattr(self, name) + 1)
+        self._update_counters(hits=int(name == "hits"), misses=int(name == "misses"))
+
+    def _update_counters(
+        self, *, hits: int = 0, misses: int = 0, size: int = 0, actual_size: int | None = None
+    ) -> tuple[int, int, int]:
+        """Add to the shared counters (or set the size to ``actual_size``); return the new values.
+
+        A missing or unreadable file starts from zero lookups and the size found
+        by walking the cache. Failing to write only loses the count.
+        """
+        try:
+            fd = os.open(self.counters, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError:
+            return 0, 0, 0
+        try:
+            _lock(fd)
+            data = os.read(fd, _COUNTERS.size)
+            if len(data) == _COUNTERS.size:
+                old_hits, old_misses, old_size = _COUNTERS.unpack(data)
+            else:
+                old_hits, old_misses, old_size = 0, 0, self._stored_bytes()
+            values = (
+                old_hits + hits,
+                old_misses + misses,
+                old_size + size if actual_size is None else actual_size,
+            )
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.write(fd, _COUNTERS.pack(*values))
+            return values
+        except OSError:
+            return 0, 0, 0
+        finally:
+            os.close(fd)  # also releases the lock
+
+    def _stored_bytes(self) -> int:
+        return _dir_stats("trees", self.trees).size_bytes + _dir_stats("objects", self.objects).size_bytes
+
+    def _object(self, digest: str, mode: int) -> Path:
+        return self.objects / digest[:2] / f"{digest}.{mode:o}"
+
+    def lookup(self, key: str) -> list[list[Any]] | None:
+        """Return the entries of a stored tree whose objects are intact, counting a hit or a miss."""
+        manifest = self.trees / f"{key}.json"
+        try:
+            entries = json.loads(manifest.read_text(encoding="utf-8"))
+            for entry in entries:
+                if len(entry) > 2:
+                    path, mode, digest, size, mtime_ns = entry
+                    st = os.stat(self._object(digest, mode))
+                    if (st.st_size, st.st_mtime_ns, st.st_mode & 0o7777) != (size, mtime_ns, mode):
+                        raise ValueError(f"cached object for {path} was modified")
+            os.utime(manifest)  # LRU order is manifest mtime order
+        except FileNotFoundError:
+            self._count("misses")
+            return None
+        except (OSError, ValueError):
+            manifest.unlink(missing_ok=True)
+            self._count("misses")
+            return None
+        self._count("hits")
+        return entries
+
+    def materialize(self, entries: list[list[Any]], target: Path) -> None:
+        """Recreate a tree returned by :meth:`lookup` under ``target`` (which must exist)."""
+        clone = self.link_mode == "clone" and sys.platform == "linux"
+        hardlink = self.link_mode == "hardlink"
+        for entry in entries:
+            path = target / entry[0]
+            if len(entry) == 2:
+                path.mkdir(exist_ok=True)
+                continue
+            source = self._object(entry[2], entry[1])
+            if hardlink:
+                try:
+                    os.link(source, path)
+                    continue
+                except OSError:
+                    hardlink = False  # e.g. another filesystem: copy the rest
+            if clone:
+                try:
+                    _reflink(source, path)
+                    os.chmod(path, entry[1])
+                    continue
+                except OSError:
+                    path.unlink(missing_ok=True)
+                    clone = False
+            shutil.copyfile(source, path)
+            os.chmod(path, entry[1])
+
+    def store(self, key: str, files: Iterable[RenderedFile]) -> None:
+        """Store a rendered tree under ``key``, then evict old trees if the size bound is crossed."""
+        entries: list[list[Any]] = []
+        added = 0
+        for entry in files:
+            if entry.is_dir:
+                entries.append([entry.path, entry.mode])
+                continue
+            digest = content_hash(entry.content or b"")
+            path = self._object(digest, entry.mode)
+            if not path.exists():
+                path.parent.mkdir(exist_ok=True)
+                tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                tmp.write_bytes(entry.content or b"")
+                os.chmod(tmp, entry.mode)
+                os.replace(tmp, path)
+                added += len(entry.content or b"")
+            st = os.stat(path)
+            entries.append([entry.path, entry.mode, digest, st.st_size, st.st_mtime_ns])
+        manifest = self.trees / f"{key}.json"
+        tmp = manifest.with_name(f"{key}.{os.getpid()}.tmp")
+        added += tmp.write_text(json.dumps(entries), encoding="utf-8")
+        os.replace(tmp, manifest)
+        if self._update_counters(size=added)[2] > self.max_bytes:
+            self.evict()
+
+    def evict(self) -> None:
+        """Drop least recently used trees, and objects no tree uses any more, until under ``max_bytes``.
+
+        Walks the whole cache, so :meth:`store` only calls it once the running
+        total crosses the bound; the walk's result then replaces that total.
+        """
+        total = self._stored_bytes()
+        if total <= self.max_bytes:
+            self._update_counters(actual_size=total)
+            return
+        manifests = sorted(self.trees.glob("*.json"), key=lambda path: path.stat().st_mtime_ns)
+        uses: dict[Path, set[Path]] = {}
+        refcounts: dict[Path, int] = {}
+        for manifest in manifests:
+            try:
+                entries = json.loads(manifest.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                entries = []
+            uses[manifest] = {self._object(entry[2], entry[1]) for entry in entries if len(entry) > 2}
+            for path in uses[manifest]:
+                refcounts[path] = refcounts.get(path, 0) + 1
+
+        def remove(path: Path) -> int:
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except OSError:
+                return 0
+            return size
+
+        for root, _, names in os.walk(self.objects):  # leftovers of interrupted stores
+            for name in names:
+                if not name.endswith(".tmp") and Path(root, name) not in refcounts:
+                    total -= remove(Path(root, name))
+        while manifests and total > self.max_bytes:
+            manifest = manifests.pop(0)
+            total -= remove(manifest)
+            for path in uses[manifest]:
+                refcounts[path] -= 1
+                if not refcounts[path]:
+                    total -= remove(path)
+        self._update_counters(actual_size=total)
+
+    def stats(self) -> CacheStats:
+        """Return the number of stored trees, the size on disk and the lookup counters."""
+        stats = _dir_stats("render", self.directory)
+        try:
+            data = self.counters.read_bytes()
+        except OSError:
+            data = b""
+        hits, misses, _ = _COUNTERS.unpack(data) if len(data) == _COUNTERS.size else (0, 0, 0)
+        stats.entries = sum(1 for _ in self.trees.glob("*.json"))
+        stats.hits, stats.misses = hits, misses
+        return stats
+
+
+def _lock(fd: int) -> None:
+    """Take an exclusive lock on ``fd`` where the platform has ``flock`` (released when it is closed)."""
+    try:
+        import fcntl
+    except ImportError:  # Windows: counters may lose concurrent updates
+        return
+    fcntl.flock(fd, fcntl.LOCK_EX)
+
+
+def _reflink(source: Path, target: Path) -> None:
+    """Clone ``source`` to ``target`` sharing extents (copy-on-write); ``OSError`` if unsupported."""
+    import fcntl
+
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+
+
+def open_render_cache() -> RenderCache | None:
+    """Return the rendered-tree cache for this version, or ``None`` if it can't be created."""
+    try:
+        size_mb = int(os.environ.get(RENDER_CACHE_SIZE_ENV_VAR) or DEFAULT_RENDER_CACHE_MB)
+    except ValueError:
+        size_mb = DEFAULT_RENDER_CACHE_MB
+    link_mode = os.environ.get(LINK_MODE_ENV_VAR, "").strip() or "clone"
+    try:
+        return RenderCache(version_cache_dir() / "render", max_bytes=size_mb * 1024 * 1024, link_mode=link_mode)
+    except OSError:
+        return None
+
+
+def content_hash(content: bytes) -> str:
+    """Return the hex SHA-256 of ``content``, the key used by the base store and lockfiles."""
+    return hashlib.sha256(content).hexdigest()
+
+
+def _base_path(digest: str) -> Path:
+    return cache_root() / "base" / digest[:2] / digest
+
+
+def store_base(content: bytes) -> str:
+    """Keep ``content`` in the base store (once per distinct content); return its hash.
+
+    Failing to write is not an error: the base is only an optimization for
+    later merges.
+    """
+    digest = content_hash(content)
+    path = _base_path(digest)
+    if not path.exists():
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{digest}.{os.getpid()}.tmp")
+            tmp.write_bytes(content)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+    return digest
+
+
+def load_base(digest: str) -> bytes | None:
+    """Return content previously passed to :func:`store_base`, or ``None`` if it is gone."""
+    try:
+        content = _base_path(digest).read_bytes()
+    except OSError:
+        return None
+    return content if content_hash(content) == digest else None
+
+
+def _dir_stats(name: str, path: Path) -> CacheStats:
+    entries = 0
+    size = 0
+    if path.is_dir():
+        for root, _, files in os.walk(path):
+            for file_name in files:
+                entries += 1
+                size += os.stat(os.path.join(root, file_name)).st_size
+    return CacheStats(name=name, path=path, entries=entries, size_bytes=size)
+
+
+def cache_stats() -> list[CacheStats]:
+    """Return entry counts and sizes for each cache used by the running version."""
+    base = version_cache_dir()
+    render = base / "render"
+    return [
+        _dir_stats("jinja", base / "jinja"),
+        RenderCache(render, max_bytes=0).stats() if render.is_dir() else _dir_stats("render", render),
+        _dir_stats("base", cache_root() / "base"),
+        _dir_stats("drift", cache_root() / "drift"),
+    ]
+
+
+def clear_cache() -> int:
+    """Delete every cache for every version; return the number of bytes freed."""
+    root = cache_root()
+    if not root.is_dir():
+        return 0
+    freed = _dir_stats("all", root).size_bytes
+    shutil.rmtree(root)
+    return freed
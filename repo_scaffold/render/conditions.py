@@ -0,0 +1,71 @@
+"""Per-template conditional paths: skip or move files the post-gen hook would.
+
+Each template's ``cookiecutter.json`` may carry a private ``_conditional_paths``
+list. Every rule names the answers it applies to, the source paths it
+excludes and the source paths it renames::
+
+    "_conditional_paths": [
+      {"exclude": ["_shared"]},
+      {"when": {"use_podman": "no"}, "exclude": [".dockerignore", "container"]},
+      {
+        "when": {"initial_package_type": "ts-lib"},
+        "exclude": ["packages/_vue-app"],
+        "rename": {"packages/_ts-lib": "packages/{{cookiecutter.package_slug}}"}
+      }
+    ]
+
+A rule without ``when`` always applies; otherwise every listed variable must
+equal the resolved answer. ``exclude`` entries are globs over the *unrendered*
+source path relative to the project template directory (so they may contain
+``{{cookiecutter.project_slug}}`` literally); a pattern matching a directory
+excludes everything below it. Excluded entries are never rendered or written.
+``rename`` maps a source file or directory to a new source-style path, which is
+rendered like any other path name, so the entry is written at its final
+location instead of being moved by the hook.
+
+The rules mirror the ``ProjectCleaner`` steps of each template's hook, which
+keep their removals and moves so plain ``cookiecutter`` runs produce the same
+tree.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from collections.abc import Iterator
+from fnmatch import fnmatchcase
+from typing import Any
+
+
+CONDITIONAL_PATHS_KEY = "_conditional_paths"
+
+
+def _active_rules(variables: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    for rule in variables.get(CONDITIONAL_PATHS_KEY) or ():
+        when = rule.get("when") or {}
+        if all(str(variables.get(name)) == str(value) for name, value in when.items()):
+            yield rule
+
+
+def excluded_paths(variables: dict[str, Any]) -> tuple[str, ...]:
+    """Return the exclude globs whose conditions hold for resolved cookiecutter variables."""
+    return tuple(pattern for rule in _active_rules(variables) for pattern in rule.get("exclude", ()))
+
+
+def path_renames(variables: dict[str, Any]) -> dict[str, str]:
+    """Return the ``{source: new source path}`` renames whose conditions hold."""
+    return {source: target for rule in _active_rules(variables) for source, target in rule.get("rename", {}).items()}
+
+
+def renamed_path(path: str, renames: dict[str, str]) -> str:
+    """Apply the rename covering ``path`` or one of its parent directories, if any."""
+    for source, target in renames.items():
+        if path == source:
+            return target
+        if path.startswith(f"{source}/"):
+            return target + path[len(source) :]
+    return path
+
+
+def is_excluded(path: str, patterns: Iterable[str]) -> bool:
+    """Whether a posix source path, or one of its parent directories, matches a pattern."""
+    return any(path == pattern or path.startswith(f"{pattern}/") or fnmatchcase(path, pattern) for pattern in patterns)
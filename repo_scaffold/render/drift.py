@@ -0,0 +1,251 @@
+"""``repo-scaffold drift``: compare many generated projects with the current templates.
+
+Projects are found through their ``.repo-scaffold.json`` lockfiles (see
+:mod:`repo_scaffold.render.lockfile`). For each one the current template is
+rendered with the recorded answers and every rendered file is compared with
+the project's working tree:
+
+1. Rendering is memoized per unique ``(template, answers)`` pair and runs
+   once, up front, keeping only each file's size and SHA-256.
+2. Projects are then compared concurrently in a thread pool. A file whose
+   size differs from the rendered one is reported without being read; a
+   file whose size and mtime match the previous scan reuses that scan's hash;
+   everything else is hashed in a streaming fashion (``hashlib.file_digest``).
+3. The per-project stat cache is kept under the user cache directory
+   (``drift/``), so re-scanning an unchanged fleet hashes almost nothing.
+
+The result is a :class:`DriftReport`, serialized as JSON::
+
+    {"version": "0.24.0", "renders": 2,
+     "summary": {"projects": 120, "clean": 117, "drifted": 2, "error": 1},
+     "projects": [{"path": "...", "template": "template-python", "status": "drifted",
+                   "modified": ["justfile"], "missing": [], "hashed": 3, "skipped": 41, "error": null}, ...]}
+
+``summary`` counts projects per ``status`` (``clean``, ``drifted``, ``error``).
+
+Files that exist only in the project are not reported: generated projects are
+expected to grow.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+
+from .cache import cache_root
+from .cache import content_hash
+from .cache import package_version
+from .engine import RenderEngine
+from .lockfile import LOCKFILE_NAME
+from .lockfile import read_lockfile
+
+
+# Directories never searched for projects: dependency and build trees can be huge.
+_PRUNED_DIRS = {"node_modules", "target", "dist", "build", "__pycache__"}
+# Stat entries younger than this are not cached: a write within the same mtime
+# tick could otherwise leave a stale hash behind a matching (size, mtime).
+_RACY_NS = 2_000_000_000
+
+
+@dataclass
+class ProjectDrift:
+    """Drift of one project from its template."""
+
+    path: Path
+    template: str | None = None
+    modified: list[str] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+    hashed: int = 0  # files read and hashed
+    skipped: int = 0  # files decided from their size or a cached hash without reading
+    error: str | None = None
+
+    @property
+    def status(self) -> str:
+        """``"error"``, ``"drifted"`` or ``"clean"``."""
+        if self.error is not None:
+            return "error"
+        return "drifted" if self.modified or self.missing else "clean"
+
+
+@dataclass
+class DriftReport:
+    """Drift of every scanned project."""
+
+    projects: list[ProjectDrift]
+    renders: int  # unique (template, answers) renders
+    version: str
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the JSON-serializable report."""
+        statuses = [project.status for project in self.projects]
+        return {
+            "version": self.version,
+            "renders": self.renders,
+            "summary": {
+                "projects": len(self.projects),
+                **{status: statuses.count(status) for status in ("clean", "drifted", "error")},
+            },
+            "projects": [
+                {**asdict(project), "path": str(project.path), "status": project.status} for project in self.projects
+            ],
+        }
+
+
+def find_projects(targets: Iterable[Path]) -> list[Path]:
+    """Resolve targets to project directories.
+
+    A target is a project (a directory holding ``.repo-scaffold.json``), a
+    directory searched recursively for projects, or a text file listing one
+    target per line (blank lines and ``#`` comments ignored; relative paths
+    are resolved against the file's directory).
+    """
+    found: dict[Path, None] = {}
+    for target in targets:
+        target = Path(target)
+        if target.is_file():
+            lines = [line.strip() for line in target.read_text(encoding="utf-8").splitlines()]
+            listed = [target.parent / line for line in lines if line and not line.startswith("#")]
+            found.update(dict.fromkeys(find_projects(listed)))
+            continue
+        for root, dirs, files in os.walk(target):
+            if LOCKFILE_NAME in files:
+                found[Path(root).resolve()] = None
+                dirs.clear()  # projects are not nested
+                continue
+            dirs[:] = sorted(name for name in dirs if not name.startswith(".") and name not in _PRUNED_DIRS)
+    return [*found]
+
+
+class _StatCache:
+    """``path -> (size, mtime_ns, sha256)`` from the previous scan of one project."""
+
+    def __init__(self, project_dir: Path):
+        self.path = cache_root() / "drift" / f"{content_hash(str(project_dir).encode())[:32]}.json"
+        try:
+            self.entries: dict[str, list[Any]] = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.entries = {}
+        self._next: dict[str, list[Any]] = {}
+
+    def lookup(self, name: str, st: os.stat_result) -> str | None:
+        entry = self.entries.get(name)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            self._next[name] = entry
+            return entry[2]
+        return None
+
+    def record(self, name: str, st: os.stat_result, digest: str) -> None:
+        if time.time_ns() - st.st_mtime_ns > _RACY_NS:
+            self._next[name] = [st.st_size, st.st_mtime_ns, digest]
+
+    def save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.{id(self)}.tmp")
+            tmp.write_text(json.dumps(self._next), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # the stat cache only saves work
+
+
+def _hash_file(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def compare_project(project_dir: Path, expected: dict[str, tuple[int, str]]) -> ProjectDrift:
+    """Compare a project's working tree with rendered ``{path: (size, sha256)}``."""
+    drift = ProjectDrift(project_dir)
+    stat_cache = _StatCache(project_dir)
+    for name, (size, digest) in sorted(expected.items()):
+        target = project_dir / name
+        try:
+            st = target.stat()
+        except FileNotFoundError:
+            drift.missing.append(name)
+            continue
+        if st.st_size != size:
+            drift.skipped += 1
+            drift.modified.append(name)
+            continue
+        actual = stat_cache.lookup(name, st)
+        if actual is None:
+            actual = _hash_file(target)
+            stat_cache.record(name, st, actual)
+            drift.hashed += 1
+        else:
+            drift.skipped += 1
+        if actual != digest:
+            drift.modified.append(name)
+    stat_cache.save()
+    return drift
+
+
+def scan_drift(targets: Iterable[Path], *, jobs: int = 8, engine: RenderEngine | None = None) -> DriftReport:
+    """Render each unique answer set once and compare every project found under ``targets``.
+
+    Args:
+        targets: Projects, directories to search, or files listing them.
+        jobs: Threads comparing projects concurrently.
+        engine: Engine to render with (a new one by default).
+    """
+    engine = engine or RenderEngine()
+    projects: list[ProjectDrift] = []
+    expected_by_project: dict[Path, dict[str, tuple[int, str]]] = {}
+    renders: dict[tuple[str, str], dict[str, tuple[int, str]]] = {}
+    for project_dir in find_projects(targets):
+        drift = ProjectDrift(project_dir)
+        projects.append(drift)
+        try:
+            lock = read_lockfile(project_dir)
+            renderer = engine.renderer(lock.template)
+            drift.template = renderer.name
+            key = (renderer.name, json.dumps(lock.answers, sort_keys=True))
+            if key not in renders:
+                context = engine.build_context(renderer, output_dir=project_dir.parent, extra_context=lock.answers)
+                renders[key] = {
+                    entry.path: (len(entry.content), content_hash(entry.content))
+                    for entry in renderer.render_files(context)
+                    if not entry.is_dir
+                }
+            expected_by_project[project_dir] = renders[key]
+        except Exception as error:  # one broken project must not stop the scan
+            drift.error = f"{type(error).__name__}: {error}"
+
+    def compare(drift: ProjectDrift) -> ProjectDrift:
+        if drift.error is not None:
+            return drift
+        try:
+            result = compare_project(drift.path, expected_by_project[drift.path])
+        except OSError as error:
+            drift.error = f"{type(error).__name__}: {error}"
+            return drift
+        result.template = drift.template
+        return result
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        compared = [*pool.map(compare, projects)]
+    return DriftReport(projects=compared, renders=len(renders), version=package_version())
+
+
+def format_report(report: DriftReport) -> list[str]:
+    """Render a report as one line per project plus a summary line."""
+    lines = []
+    for project in report.projects:
+        detail = project.error or f"{len(project.modified)} modified, {len(project.missing)} missing"
+        lines.append(f"{project.status:<7}  {project.path}  ({detail})")
+    summary = report.to_dict()["summary"]
+    lines.append(
+        f"{summary['projects']} projects: {summary['clean']} clean, {summary['drifted']} drifted, "
+        f"{summary['error']} errors ({report.renders} renders)"
+    )
+    return lines
@@ -0,0 +1,541 @@
+"""In-process project rendering with per-template state reused across projects.
+
+``cookiecutter.main.cookiecutter`` builds a fresh Jinja environment, re-reads
+``cookiecutter.json`` and re-walks the template directory on every call. The
+engine keeps that per-template state in a ``TemplateRenderer`` (environment,
+compiled templates, scanned source tree), so rendering many projects from one
+template in one process lexes and compiles each file once.
+
+Rendering mirrors ``cookiecutter.generate.generate_files``: path names and file
+contents are rendered with a ``StrictEnvironment``, binary files and
+``_copy_without_render`` matches are copied verbatim, the source file's newline
+style and permission bits are preserved, and the template's pre/post-gen hooks
+run through cookiecutter's own hook runner, or, for hooks the template lists
+under ``_in_process_hooks``, are imported once and called in this process (see
+:mod:`repo_scaffold.render.hooks`). Paths excluded or renamed by the
+template's ``_conditional_paths`` rules (see :mod:`repo_scaffold.render.conditions`)
+are handled before anything is written, so the hook has nothing to delete or move.
+The resolved answers are checked against the template's ``_answer_schema`` (see
+:mod:`repo_scaffold.render.schema`) before any of that, so invalid answers fail
+without rendering a single file.
+
+A new project is rendered completely in memory, written into a hidden staging
+directory next to its final location and published with a single
+``os.rename``: readers never see a half-written project, and a failed render
+leaves nothing behind. The post-gen hook then runs in the published directory,
+since the environments it creates (``uv sync``, ``pnpm install``) record
+absolute paths.
+
+Compiled templates also persist across processes through the on-disk bytecode
+cache in :mod:`repo_scaffold.render.cache`, so a warm ``create`` skips Jinja
+compilation entirely, and whole rendered trees are cached by template contents
+and resolved answers, so repeating a ``create`` with the same answers skips
+rendering too and clones the stored files into the staging directory.
+
+Every generated project also gets a ``.repo-scaffold.json`` lockfile (see
+:mod:`repo_scaffold.render.lockfile`) recording the template, its version, the
+answers and a hash per file, which ``repo-scaffold update`` uses to re-render
+only what changed.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import functools
+import hashlib
+import json
+import os
+import shutil
+import stat
+import uuid
+import warnings
+from collections.abc import Callable
+from collections.abc import Collection
+from collections.abc import Iterable
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from binaryornot.check import is_binary
+from cookiecutter.config import get_user_config
+from cookiecutter.environment import StrictEnvironment
+from cookiecutter.exceptions import OutputDirExistsException
+from cookiecutter.find import find_template
+from cookiecutter.generate import apply_overwrites_to_context
+from cookiecutter.generate import is_copy_only_path
+from cookiecutter.prompt import prompt_for_config
+from jinja2 import BytecodeCache
+from jinja2 import FileSystemLoader
+from jinja2 import Template
+
+from repo_scaffold.registry import get_registry
+from repo_scaffold.trace import span
+
+from .cache import RenderCache
+from .cache import content_hash
+from .cache import open_bytecode_cache
+from .cache import open_render_cache
+from .cache import package_version
+from .cache import store_base
+from .conditions import excluded_paths
+from .conditions import is_excluded
+from .conditions import path_renames
+from .conditions import renamed_path
+from .hooks import HookMain
+from .hooks import load_hook
+from .hooks import run_hook
+from .lockfile import LOCKFILE_NAME
+from .lockfile import LockedFile
+from .lockfile import Lockfile
+from .lockfile import context_answers
+from .schema import validate_answers
+
+
+@dataclass(frozen=True)
+class RenderedFile:
+    """One entry of a rendered project tree, relative to the project root."""
+
+    path: str
+    content: bytes | None  # ``None`` for directories
+    mode: int = 0o644
+    source: str | None = None  # template source path it was rendered from
+
+    @property
+    def is_dir(self) -> bool:
+        """Whether this entry is a directory rather than a file."""
+        return self.content is None
+
+
+@dataclass(frozen=True)
+class _Source:
+    """A template source entry, scanned once per ``TemplateRenderer``."""
+
+    path: str  # posix path relative to the project template directory
+    is_dir: bool
+    mode: int
+    binary: bool = False
+    newline: str | None = None
+
+
+class ProjectOutsideRootError(ValueError):
+    """The project directory resolved from the answers escapes the allowed root."""
+
+
+class TemplateRenderer:
+    """Per-template Jinja state, reused for every project rendered from one template."""
+
+    def __init__(
+        self,
+        repo_dir: Path,
+        config: dict[str, Any],
+        *,
+        bytecode_cache: BytecodeCache | None = None,
+        name: str | None = None,
+    ):
+        """Build the environment and scan the template tree.
+
+        Args:
+            repo_dir: Template directory (the one holding ``cookiecutter.json``).
+            config: The template's parsed ``cookiecutter.json``.
+            bytecode_cache: Optional Jinja bytecode cache shared across runs.
+            name: Registry name recorded in lockfiles (default: ``repo_dir``'s name).
+        """
+        self.repo_dir = repo_dir
+        self.name = name or repo_dir.name
+        self.config = config
+        self.env = StrictEnvironment(
+            context={"cookiecutter": config},
+            keep_trailing_newline=True,
+            bytecode_cache=bytecode_cache,
+            **config.get("_jinja2_env_vars", {}),
+        )
+        self.template_dir = Path(find_template(repo_dir, self.env))
+        # Same search path cookiecutter uses (['.', '../templates'] relative to
+        # the project template dir), so `{% include '_shared/...' %}` resolves.
+        self.env.loader = FileSystemLoader([str(self.template_dir), str(self.template_dir.parent / "templates")])
+        self._markers = (self.env.variable_start_string, self.env.block_start_string, self.env.comment_start_string)
+        self._name_templates: dict[str, Template] = {}
+        self._sources = self._scan()
+        self._source_hashes: dict[str, str] | None = None
+        self._hooks: dict[str, HookMain | None] = {}
+
+    def _scan(self) -> list[_Source]:
+        """Walk the project template directory once, parents before children."""
+        sources: list[_Source] = []
+        for root, dirs, files in os.walk(self.template_dir):
+            dirs.sort()
+            root_path = Path(root)
+            for name in dirs:
+                path = root_path / name
+                rel = path.relative_to(self.template_dir).as_posix()
+                sources.append(_Source(rel, is_dir=True, mode=stat.S_IMODE(path.stat().st_mode)))
+            for name in sorted(files):
+                path = root_path / name
+                rel = path.relative_to(self.template_dir).as_posix()
+                binary = is_binary(str(path))
+                newline = None
+                if not binary:
+                    with open(path, encoding="utf-8") as rd:
+                        rd.readline()
+                    newline = rd.newlines[0] if isinstance(rd.newlines, tuple) else rd.newlines
+                sources.append(
+                    _Source(rel, is_dir=False, mode=stat.S_IMODE(path.stat().st_mode), binary=binary, newline=newline)
+                )
+        return sources
+
+    def source_hashes(self) -> dict[str, str]:
+        """Return the SHA-256 of every source file, keyed by its path (computed once)."""
+        if self._source_hashes is None:
+            self._source_hashes = {
+                source.path: content_hash((self.template_dir / source.path).read_bytes())
+                for source in self._sources
+                if not source.is_dir
+            }
+        return self._source_hashes
+
+    def template_hash(self) -> str:
+        """Hash the template's contents: ``cookiecutter.json`` and every source path, mode and content."""
+        digest = hashlib.sha256(json.dumps(self.config, sort_keys=True).encode("utf-8"))
+        hashes = self.source_hashes()
+        for source in self._sources:
+            digest.update(f"{source.path}\0{source.mode:o}\0{hashes.get(source.path, '')}\0".encode())
+        return digest.hexdigest()
+
+    def dependency_hash(self, context: dict[str, Any]) -> str:
+        """Hash what every file's output depends on besides its own source and the answers.
+
+        That is ``cookiecutter.json`` plus each source excluded for this
+        context: those are never written themselves but may be included by
+        the files that are (``_shared/``).
+        """
+        excluded = excluded_paths(context["cookiecutter"])
+        digest = hashlib.sha256(json.dumps(self.config, sort_keys=True).encode("utf-8"))
+        for path, source_hash in sorted(self.source_hashes().items()):
+            if excluded and is_excluded(path, excluded):
+                digest.update(f"{path}\0{source_hash}\0".encode())
+        return digest.hexdigest()
+
+    def lock(self, context: dict[str, Any], files: Iterable[RenderedFile], *, keep_bases: bool = True) -> Lockfile:
+        """Build the lockfile for a project rendered from ``context``.
+
+        Each file's rendered content is kept in the base store as well (unless
+        ``keep_bases`` is false), so a later update can merge edits against it.
+        """
+        hashes = self.source_hashes()
+        digest = store_base if keep_bases else content_hash
+        return Lockfile(
+            template=self.name,
+            version=package_version(),
+            dependency_hash=self.dependency_hash(context),
+            answers=context_answers(context),
+            files={
+                entry.path: LockedFile(entry.source, hashes[entry.source], digest(entry.content))
+                for entry in files
+                if not entry.is_dir and entry.source is not None
+            },
+        )
+
+    def hook(self, name: str) -> HookMain | None:
+        """Return the in-process ``main`` of hook ``name``, or ``None`` to run it as a script (imported once)."""
+        if name not in self._hooks:
+            self._hooks[name] = load_hook(self.repo_dir, name, self.config)
+        return self._hooks[name]
+
+    def render_name(self, name: str, context: dict[str, Any]) -> str:
+        """Render a path name, compiling each distinct name template only once."""
+        if not any(marker in name for marker in self._markers):
+            return name
+        template = self._name_templates.get(name)
+        if template is None:
+            template = self._name_templates[name] = self.env.from_string(name)
+        return template.render(**context)
+
+    def project_name(self, context: dict[str, Any]) -> str:
+        """Return the rendered name of the project root directory."""
+        return self.render_name(self.template_dir.name, context)
+
+    def _is_copy_only(self, path: str, context: dict[str, Any]) -> bool:
+        """``_copy_without_render`` check for ``path`` or any of its parent directories."""
+        if not context["cookiecutter"].get("_copy_without_render"):
+            return False
+        parts = path.split("/")
+        return any(is_copy_only_path("/".join(parts[:i]), context) for i in range(1, len(parts) + 1))
+
+    def render_files(
+        self, context: dict[str, Any], *, sources: Collection[str] | None = None
+    ) -> Iterator[RenderedFile]:
+        """Yield the rendered project tree for ``context``, directories before their contents.
+
+        Sources excluded by the template's conditional paths are skipped
+        without being rendered, and renamed sources are emitted at their
+        final path. With ``sources``, only those source files are rendered
+        (and no directories).
+        """
+        new_lines = context["cookiecutter"].get("_new_lines")
+        excluded = excluded_paths(context["cookiecutter"])
+        renames = path_renames(context["cookiecutter"])
+        for source in self._sources:
+            if sources is not None and (source.is_dir or source.path not in sources):
+                continue
+            if excluded and is_excluded(source.path, excluded):
+                continue
+            path = self.render_name(renamed_path(source.path, renames) if renames else source.path, context)
+            if source.is_dir:
+                yield RenderedFile(path, None, source.mode, source.path)
+                continue
+            if not path or path.endswith("/"):
+                # A file name that renders empty is skipped, as in cookiecutter.
+                continue
+            if source.binary or self._is_copy_only(source.path, context):
+                content = (self.template_dir / source.path).read_bytes()
+            else:
+                text = self.env.get_template(source.path).render(**context)
+                newline = new_lines or source.newline or os.linesep
+                if newline != "\n":
+                    text = text.replace("\n", newline)
+                content = text.encode("utf-8")
+            yield RenderedFile(path, content, source.mode, source.path)
+
+
+def write_tree(project_dir: Path, files: Iterable[RenderedFile]) -> None:
+    """Write rendered entries under ``project_dir`` (which must already exist)."""
+    for entry in files:
+        target = project_dir / entry.path
+        if entry.is_dir:
+            target.mkdir(exist_ok=True)
+            continue
+        target.write_bytes(entry.content or b"")
+        os.chmod(target, entry.mode)
+
+
+class RenderEngine:
+    """Renders projects in-process, caching one ``TemplateRenderer`` per template."""
+
+    def __init__(self, *, use_bytecode_cache: bool = True, use_render_cache: bool = True) -> None:
+        """Create an engine with an empty renderer cache.
+
+        Args:
+            use_bytecode_cache: Load and store compiled templates in the
+                on-disk cache (see :mod:`repo_scaffold.render.cache`).
+            use_render_cache: Reuse and store complete rendered trees of new
+                projects in the on-disk cache.
+        """
+        self._renderers: dict[str, TemplateRenderer] = {}
+        self._user_config: dict[str, Any] | None = None
+        self.bytecode_cache = open_bytecode_cache() if use_bytecode_cache else None
+        self.render_cache: RenderCache | None = open_render_cache() if use_render_cache else None
+
+    def renderer(self, template: str) -> TemplateRenderer:
+        """Return the cached renderer for a template name, title or path.
+
+        Raises:
+            ValueError: If the template is not in the registry.
+        """
+        registry = get_registry()
+        name = registry.resolve(template)
+        if name is None:
+            raise ValueError(f"Template '{template}' not found")
+        renderer = self._renderers.get(name)
+        if renderer is None:
+            with span("load template", template=name):
+                renderer = TemplateRenderer(
+                    registry.template_dir(name), registry.variables[name], bytecode_cache=self.bytecode_cache, name=name
+                )
+            self._renderers[name] = renderer
+        return renderer
+
+    def build_context(
+        self,
+        renderer: TemplateRenderer,
+        *,
+        output_dir: Path,
+        extra_context: dict[str, Any] | None = None,
+        no_input: bool = True,
+    ) -> dict[str, Any]:
+        """Resolve the cookiecutter context the way ``cookiecutter()`` does.
+
+        Defaults come from the registry's parsed ``cookiecutter.json`` instead
+        of re-reading the file; the user's ``~/.cookiecutterrc`` defaults and
+        ``extra_context`` are applied on top, then the prompts run (or, with
+        ``no_input``, derived values such as ``project_slug`` are rendered).
+        """
+        if self._user_config is None:
+            self._user_config = get_user_config()
+        variables = copy.deepcopy(renderer.config)
+        default_context = self._user_config.get("default_context")
+        if default_context:
+            try:
+                apply_overwrites_to_context(variables, default_context)
+            except ValueError as error:
+                warnings.warn(f"Invalid default received: {error}", stacklevel=2)
+        if extra_context:
+            apply_overwrites_to_context(variables, extra_context)
+
+        context: dict[str, Any] = {"cookiecutter": variables}
+        context["_cookiecutter"] = {k: v for k, v in variables.items() if not k.startswith("_")}
+        context["cookiecutter"] = prompt_for_config(context, no_input)
+        context["cookiecutter"]["_template"] = str(renderer.repo_dir)
+        context["cookiecutter"]["_output_dir"] = os.path.abspath(output_dir)
+        context["cookiecutter"]["_repo_dir"] = str(renderer.repo_dir)
+        context["cookiecutter"]["_checkout"] = None
+        return context
+
+    def check(self, template: str, *, output_dir: Path, extra_context: dict[str, Any] | None = None) -> None:
+        """Resolve answers without prompting and check them against the ``_answer_schema``, rendering nothing.
+
+        Raises:
+            ValueError: If the template is not in the registry.
+            InvalidAnswersError: If the answers break the template's schema.
+        """
+        context = self.build_context(self.renderer(template), output_dir=output_dir, extra_context=extra_context)
+        validate_answers(context["cookiecutter"])
+
+    def stream(
+        self, template: str, *, extra_context: dict[str, Any] | None = None, no_input: bool = True
+    ) -> tuple[str, Iterator[RenderedFile]]:
+        """Resolve and check the answers, then return the project name and a generator of its rendered tree.
+
+        Nothing is written: entries are rendered as the generator is consumed
+        (directories before their contents, the lockfile last), the render
+        cache and the base store are bypassed, and no hook runs, since hooks
+        (``git init``, dependency installation) need a project on disk. The
+        tree is the one :meth:`generate` publishes: the files the post-gen
+        hook would remove are already excluded by ``_conditional_paths``.
+
+        Raises:
+            ValueError: If the template is not in the registry.
+            InvalidAnswersError: If the answers break the template's ``_answer_schema``.
+        """
+        renderer = self.renderer(template)
+        with span("prompt", no_input=no_input):
+            context = self.build_context(
+                renderer, output_dir=Path.cwd(), extra_context=extra_context, no_input=no_input
+            )
+        with span("validate"):
+            validate_answers(context["cookiecutter"])
+
+        def files() -> Iterator[RenderedFile]:
+            rendered = []
+            for entry in renderer.render_files(context):
+                yield entry
+                rendered.append(entry)
+            lockfile = renderer.lock(context, rendered, keep_bases=False)
+            yield RenderedFile(LOCKFILE_NAME, lockfile.dumps().encode("utf-8"))
+
+        return renderer.project_name(context), files()
+
+    def generate(
+        self,
+        template: str,
+        *,
+        output_dir: Path,
+        extra_context: dict[str, Any] | None = None,
+        no_input: bool = True,
+        overwrite_if_exists: bool = False,
+        accept_hooks: bool = True,
+        root: Path | None = None,
+    ) -> Path:
+        """Render one project and run its hooks; return the project directory.
+
+        A project directory created by this call is removed again if rendering
+        or a hook fails, matching cookiecutter's default behaviour. New projects
+        whose template contents and answers were rendered before are cloned from
+        the render cache instead of being rendered again. With
+        ``overwrite_if_exists`` and an existing directory, files are written in
+        place instead of being staged. With ``root``, the resolved project
+        directory must lie inside it (answers such as ``project_slug`` decide
+        its name), which is checked before anything is written.
+
+        Raises:
+            ValueError: If the template is not in the registry.
+            InvalidAnswersError: If the answers break the template's
+                ``_answer_schema``; nothing is rendered or written.
+            OutputDirExistsException: If the project directory already exists
+                and ``overwrite_if_exists`` is false.
+            ProjectOutsideRootError: If ``root`` is given and the project
+                directory resolves outside it; nothing is written.
+        """
+        renderer = self.renderer(template)
+        with span("prompt", no_input=no_input):
+            context = self.build_context(
+                renderer, output_dir=output_dir, extra_context=extra_context, no_input=no_input
+            )
+        with span("validate"):
+            validate_answers(context["cookiecutter"])
+        project_dir = (Path(output_dir) / renderer.project_name(context)).resolve()
+        if root is not None and not project_dir.is_relative_to(Path(root).resolve()):
+            raise ProjectOutsideRootError(f'Error: "{project_dir}" is outside {Path(root).resolve()}')
+        created = not project_dir.exists()
+        if not created and not overwrite_if_exists:
+            raise OutputDirExistsException(f'Error: "{project_dir}" directory already exists')
+
+        cache_key = cached = None
+        if created and self.render_cache is not None:
+            with span("render cache"):
+                cache_key = self.render_cache.key(renderer.template_hash(), context)
+                cached = self.render_cache.lookup(cache_key)
+        if cached is not None:
+            write, count = functools.partial(self.render_cache.materialize, cached), len(cached)
+        else:
+            # Render everything before touching the disk, so a template error writes nothing.
+            with span("render"):
+                files = [*renderer.render_files(context)]
+            with span("lockfile"):
+                files.append(RenderedFile(LOCKFILE_NAME, renderer.lock(context, files).dumps().encode("utf-8")))
+            write, count = functools.partial(write_tree, files=files), len(files)
+
+        if created:
+            self._publish(renderer, context, project_dir, write, count=count, accept_hooks=accept_hooks)
+            if cache_key is not None and cached is None:
+                with contextlib.suppress(OSError):  # a full or read-only cache must not fail the project
+                    self.render_cache.store(cache_key, files)
+        else:
+            if accept_hooks:
+                with span("pre_gen_project"):
+                    hook = renderer.hook("pre_gen_project")
+                    run_hook(renderer.repo_dir, "pre_gen_project", project_dir, context, False, hook=hook)
+            with span("publish", files=count):
+                write(project_dir)
+
+        if accept_hooks:
+            try:
+                hook = renderer.hook("post_gen_project")
+                with span("post_gen_project", in_process=hook is not None):
+                    run_hook(renderer.repo_dir, "post_gen_project", project_dir, context, created, hook=hook)
+            except Exception:
+                if created:
+                    shutil.rmtree(project_dir, ignore_errors=True)
+                raise
+        return project_dir
+
+    @staticmethod
+    def _publish(
+        renderer: TemplateRenderer,
+        context: dict[str, Any],
+        project_dir: Path,
+        write: Callable[[Path], None],
+        *,
+        count: int,
+        accept_hooks: bool,
+    ) -> None:
+        """Fill a sibling staging directory with ``write``, then rename it to ``project_dir``.
+
+        The staging directory lives in the same parent so the rename stays on
+        one filesystem and is atomic; it is removed on any failure.
+        """
+        project_dir.parent.mkdir(parents=True, exist_ok=True)
+        staging = project_dir.with_name(f".{project_dir.name}.{uuid.uuid4().hex[:8]}.tmp")
+        staging.mkdir()
+        try:
+            if accept_hooks:
+                with span("pre_gen_project"):
+                    hook = renderer.hook("pre_gen_project")
+                    run_hook(renderer.repo_dir, "pre_gen_project", staging, context, True, hook=hook)
+            with span("publish", files=count):
+                write(staging)
+                os.rename(staging, project_dir)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
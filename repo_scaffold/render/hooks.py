@@ -0,0 +1,88 @@
+"""In-process template hooks: import a hook module once, call it for every project.
+
+Cookiecutter renders ``hooks/<name>.py`` with Jinja and runs the result in a
+fresh Python interpreter, once per generated project. A template can instead
+list the hooks that support being called in-process in a private
+``_in_process_hooks`` key of its ``cookiecutter.json``::
+
+    "_in_process_hooks": ["post_gen_project"]
+
+Such a hook module must be importable as is (no Jinja outside its
+``if __name__ == "__main__":`` block) and define ``main(context, project_dir)``,
+which receives the resolved ``cookiecutter`` variables and the generated
+project's directory, and works on paths under it (commands run with
+``cwd=project_dir``) rather than in the current directory. The engine imports
+it once per ``TemplateRenderer`` and calls ``main`` without changing the
+process's working directory, so concurrent ``generate`` calls run their hooks
+in parallel; ``sys.exit`` with a non-zero status fails the hook like a
+non-zero exit of the script would. The script keeps
+working for plain ``cookiecutter`` runs, and templates that do not opt in
+(third-party ones included) go through cookiecutter's script runner as before.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import shutil
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from cookiecutter.exceptions import FailedHookException
+from cookiecutter.hooks import run_hook_from_repo_dir
+
+
+IN_PROCESS_HOOKS_KEY = "_in_process_hooks"
+
+HookMain = Callable[[dict[str, Any], Path], None]
+
+
+def load_hook(repo_dir: Path, name: str, config: dict[str, Any]) -> HookMain | None:
+    """Import the template's ``hooks/<name>.py`` and return its ``main``, if it opts into in-process calls.
+
+    Returns ``None`` when ``name`` is not listed under ``_in_process_hooks`` or
+    the file does not exist, so the caller falls back to cookiecutter's runner.
+
+    Raises:
+        AttributeError: If an opted-in hook module has no ``main``.
+    """
+    path = repo_dir / "hooks" / f"{name}.py"
+    if name not in config.get(IN_PROCESS_HOOKS_KEY, ()) or not path.is_file():
+        return None
+    spec = importlib.util.spec_from_file_location(f"repo_scaffold._hooks.{repo_dir.name}.{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.main
+
+
+def run_hook(
+    repo_dir: Path,
+    name: str,
+    project_dir: Path,
+    context: dict[str, Any],
+    delete_project_on_failure: bool,
+    *,
+    hook: HookMain | None = None,
+) -> None:
+    """Run a template hook for one project, in-process when ``hook`` is given, else as cookiecutter does.
+
+    Raises:
+        FailedHookException: If the hook exits with a non-zero status or
+            raises. The project directory is removed first when
+            ``delete_project_on_failure``.
+    """
+    if hook is None:
+        run_hook_from_repo_dir(str(repo_dir), name, str(project_dir), context, delete_project_on_failure)
+        return
+    try:
+        try:
+            hook(context["cookiecutter"], project_dir)
+        except SystemExit as exc:
+            if exc.code not in (None, 0):
+                raise FailedHookException(f"Hook script failed (exit status: {exc.code})") from exc
+        except Exception as exc:  # an uncaught error would have exited the script with status 1
+            raise FailedHookException(f"Hook script failed ({type(exc).__name__}: {exc})") from exc
+    except FailedHookException:
+        if delete_project_on_failure:
+            shutil.rmtree(project_dir, ignore_errors=True)
+        raise
@@ -0,0 +1,92 @@
+"""The ``.repo-scaffold.json`` lockfile written into every generated project.
+
+It records what the project was generated from, so ``repo-scaffold update``
+can re-render it later without prompting and touch only what changed::
+
+    {
+      "template": "template-python",
+      "version": "0.24.0",
+      "dependency_hash": "…",
+      "answers": {"project_name": "billing", "use_podman": "no", ...},
+      "files": {
+        "pyproject.toml": {"source": "pyproject.toml", "source_hash": "…", "hash": "…"},
+        ...
+      }
+    }
+
+- ``answers`` are the resolved (non-private) cookiecutter variables.
+- ``files`` maps every generated file to the template source it was rendered
+  from, the SHA-256 of that source and the SHA-256 of the rendered output.
+  The rendered output itself is kept in the cache's base store
+  (:func:`repo_scaffold.render.cache.store_base`) as the merge base.
+- ``dependency_hash`` covers everything a file's output depends on besides
+  its own source and the answers: ``cookiecutter.json`` and the sources that
+  are never written but may be ``{% include %}``-d (``_shared/``, disabled
+  options). When it changes, every file is re-rendered.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+
+
+LOCKFILE_NAME = ".repo-scaffold.json"
+
+
+@dataclass
+class LockedFile:
+    """How one generated file was produced."""
+
+    source: str
+    source_hash: str
+    hash: str
+
+
+@dataclass
+class Lockfile:
+    """Parsed contents of ``.repo-scaffold.json``."""
+
+    template: str
+    version: str
+    dependency_hash: str
+    answers: dict[str, Any] = field(default_factory=dict)
+    files: dict[str, LockedFile] = field(default_factory=dict)
+
+    def dumps(self) -> str:
+        """Serialize as stable, diff-friendly JSON."""
+        document = asdict(self)
+        document["files"] = {path: document["files"][path] for path in sorted(document["files"])}
+        return json.dumps(document, indent=2, ensure_ascii=False) + "\n"
+
+
+def read_lockfile(project_dir: Path) -> Lockfile:
+    """Load the lockfile of a generated project.
+
+    Raises:
+        FileNotFoundError: If the project has no ``.repo-scaffold.json``.
+        ValueError: If the lockfile is not valid.
+    """
+    path = Path(project_dir) / LOCKFILE_NAME
+    if not path.is_file():
+        raise FileNotFoundError(f"{path} not found; was this project generated by repo-scaffold?")
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return Lockfile(
+            template=data["template"],
+            version=data["version"],
+            dependency_hash=data["dependency_hash"],
+            answers=dict(data.get("answers", {})),
+            files={name: LockedFile(**entry) for name, entry in data.get("files", {}).items()},
+        )
+    except (ValueError, KeyError, TypeError) as error:
+        raise ValueError(f"Invalid {path}: {error}") from error
+
+
+def context_answers(context: dict[str, Any]) -> dict[str, Any]:
+    """Return the answers worth recording from a resolved cookiecutter context."""
+    return {key: value for key, value in context["cookiecutter"].items() if not key.startswith("_")}
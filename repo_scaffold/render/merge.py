@@ -0,0 +1,95 @@
+"""Line-based three-way merge for ``repo-scaffold update``.
+
+``merge3`` combines the user's edits (``ours``) and the new template output
+(``theirs``) relative to the output they both started from (``base``), the
+way ``diff3 -m`` / ``git merge-file`` do: regions changed on one side only
+take that side's lines, identical changes are taken once, and regions changed
+differently on both sides are emitted between conflict markers::
+
+    <<<<<<< project
+    the user's lines
+    =======
+    the template's lines
+    >>>>>>> template
+"""
+
+from __future__ import annotations
+
+from difflib import SequenceMatcher
+
+
+OURS_LABEL = "project"
+THEIRS_LABEL = "template"
+
+
+def _sync_regions(base: list[str], ours: list[str], theirs: list[str]) -> list[tuple[int, int, int, int, int, int]]:
+    """Return ranges of ``base`` that both sides left unchanged, with their positions on each side.
+
+    Each region is ``(base_start, base_end, ours_start, ours_end, theirs_start, theirs_end)``;
+    the list ends with an empty sentinel region at the end of all three.
+    """
+    ours_blocks = SequenceMatcher(None, base, ours, autojunk=False).get_matching_blocks()
+    theirs_blocks = SequenceMatcher(None, base, theirs, autojunk=False).get_matching_blocks()
+    regions = []
+    i = j = 0
+    while i < len(ours_blocks) and j < len(theirs_blocks):
+        ours_base, ours_start, ours_len = ours_blocks[i]
+        theirs_base, theirs_start, theirs_len = theirs_blocks[j]
+        start = max(ours_base, theirs_base)
+        end = min(ours_base + ours_len, theirs_base + theirs_len)
+        if start < end:
+            ours_at = ours_start + start - ours_base
+            theirs_at = theirs_start + start - theirs_base
+            regions.append((start, end, ours_at, ours_at + end - start, theirs_at, theirs_at + end - start))
+        if ours_base + ours_len < theirs_base + theirs_len:
+            i += 1
+        else:
+            j += 1
+    regions.append((len(base), len(base), len(ours), len(ours), len(theirs), len(theirs)))
+    return regions
+
+
+def merge3(base: list[str], ours: list[str], theirs: list[str]) -> tuple[list[str], int]:
+    """Merge two edited versions of ``base``; return the merged lines and the number of conflicts.
+
+    Lines are expected to keep their line endings (``str.splitlines(keepends=True)``).
+    """
+    merged: list[str] = []
+    conflicts = 0
+    base_at = ours_at = theirs_at = 0
+    for base_start, base_end, ours_start, ours_end, theirs_start, theirs_end in _sync_regions(base, ours, theirs):
+        base_chunk = base[base_at:base_start]
+        ours_chunk = ours[ours_at:ours_start]
+        theirs_chunk = theirs[theirs_at:theirs_start]
+        if ours_chunk == theirs_chunk or theirs_chunk == base_chunk:
+            merged.extend(ours_chunk)
+        elif ours_chunk == base_chunk:
+            merged.extend(theirs_chunk)
+        else:
+            conflicts += 1
+            newline = "\r\n" if any(line.endswith("\r\n") for line in ours_chunk) else "\n"
+            merged.append(f"<<<<<<< {OURS_LABEL}{newline}")
+            merged.extend(_terminated(ours_chunk, newline))
+            merged.append(f"======={newline}")
+            merged.extend(_terminated(theirs_chunk, newline))
+            merged.append(f">>>>>>> {THEIRS_LABEL}{newline}")
+        merged.extend(ours[ours_start:ours_end])
+        base_at, ours_at, theirs_at = base_end, ours_end, theirs_end
+    return merged, conflicts
+
+
+def _terminated(lines: list[str], newline: str) -> list[str]:
+    """Make sure a conflict side ends with a newline so the next marker starts its own line."""
+    if lines and not lines[-1].endswith(("\n", "\r")):
+        return [*lines[:-1], lines[-1] + newline]
+    return lines
+
+
+def merge_bytes(base: bytes, ours: bytes, theirs: bytes) -> tuple[bytes, int] | None:
+    """Three-way merge UTF-8 file contents; ``None`` if any of them is not text."""
+    try:
+        texts = [content.decode("utf-8") for content in (base, ours, theirs)]
+    except UnicodeDecodeError:
+        return None
+    merged, conflicts = merge3(*(text.splitlines(keepends=True) for text in texts))
+    return "".join(merged).encode("utf-8"), conflicts
@@ -0,0 +1,53 @@
+"""Per-template answer schema: reject invalid answers before anything is rendered.
+
+Each template's ``cookiecutter.json`` may carry a private ``_answer_schema``
+mapping. Every entry names a variable and the rules its resolved answer must
+satisfy::
+
+    "_answer_schema": {
+      "project_slug": {"pattern": "[a-zA-Z_][a-zA-Z0-9_]*", "description": "a valid Python package name"},
+      "max_python_version": {"at_least": "min_python_version"},
+      "init_git": {"choices": ["yes", "no"]}
+    }
+
+- ``pattern`` — the answer must fully match the regular expression;
+  ``description`` (optional) says what the pattern means in the error message.
+- ``choices`` — the answer must be one of the listed values. Choice variables
+  (list defaults) are already checked by cookiecutter; this covers the free-form
+  ``yes``/``no`` flags set by the CLI and batch manifests.
+- ``at_least`` — the answer is a dotted version number no lower than the
+  answer of the named variable.
+
+``RenderEngine.generate`` checks the resolved answers right after the prompts,
+so an invalid answer (or batch manifest entry) fails before the template is
+rendered, the render cache is consulted or anything is written. The templates'
+post-gen hooks check the same rules with the same code
+(:mod:`repo_scaffold.hooks.answers`), so plain ``cookiecutter`` runs reject
+the same answers with the same messages.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from repo_scaffold.hooks.answers import answer_errors
+
+
+class InvalidAnswersError(ValueError):
+    """Resolved answers that break the template's ``_answer_schema``."""
+
+    def __init__(self, errors: list[str]):
+        """Record every broken rule; the message lists them one per line."""
+        self.errors = errors
+        super().__init__("Invalid answers:\n" + "\n".join(f"  {error}" for error in errors))
+
+
+def validate_answers(variables: dict[str, Any]) -> None:
+    """Check resolved cookiecutter variables against their ``_answer_schema``.
+
+    Raises:
+        InvalidAnswersError: If any rule is broken.
+    """
+    errors = answer_errors(variables)
+    if errors:
+        raise InvalidAnswersError(errors)
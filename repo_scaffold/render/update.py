@@ -0,0 +1,183 @@
+"""``repo-scaffold update``: bring a generated project up to date with its template.
+
+The project's ``.repo-scaffold.json`` (see :mod:`repo_scaffold.render.lockfile`)
+names the template and the answers it was generated with. Updating re-renders
+only the template files whose source hash changed since then (everything if
+``cookiecutter.json`` or an included file changed), without prompting and
+without running hooks, and reconciles each result with the project:
+
+- ``added``: a new template file, written.
+- ``updated``: the project still had the old generated content, so the new
+  content replaces it.
+- ``merged``: the user edited the file; their edits and the template's changes
+  were combined by a three-way merge against the old generated content.
+- ``conflict``: both changed the same lines; the file now holds conflict
+  markers (binary files are left as the user had them).
+- ``skipped``: the user deleted the file, so it stays deleted.
+- ``removed``: the template dropped an unedited file, so it is deleted.
+- ``kept``: the template dropped a file the user edited, so it is kept.
+
+The lockfile is then rewritten with the new version and hashes, making the
+new template output the base for the next update.
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+
+from .cache import content_hash
+from .cache import load_base
+from .cache import package_version
+from .cache import store_base
+from .engine import RenderedFile
+from .engine import RenderEngine
+from .lockfile import LOCKFILE_NAME
+from .lockfile import LockedFile
+from .lockfile import read_lockfile
+from .merge import merge_bytes
+
+
+@dataclass
+class FileChange:
+    """What ``update`` did to one project file."""
+
+    path: str
+    status: str
+    conflicts: int = 0
+
+
+@dataclass
+class UpdateResult:
+    """Outcome of updating one project."""
+
+    project_dir: Path
+    template: str
+    previous_version: str
+    version: str
+    rendered: int  # template files re-rendered
+    changes: list[FileChange] = field(default_factory=list)
+
+    @property
+    def conflicts(self) -> list[FileChange]:
+        """Files left with conflicts to resolve by hand."""
+        return [change for change in self.changes if change.status == "conflict"]
+
+
+def update_project(project_dir: Path, *, engine: RenderEngine | None = None, dry_run: bool = False) -> UpdateResult:
+    """Re-render the changed template files of a generated project and merge them in.
+
+    Args:
+        project_dir: Root of a project holding a ``.repo-scaffold.json``.
+        engine: Engine to render with (a new one by default).
+        dry_run: Report what would change without writing anything.
+
+    Raises:
+        FileNotFoundError: If the project has no lockfile.
+        ValueError: If the lockfile is invalid or its template is not in the registry.
+    """
+    project_dir = Path(project_dir).resolve()
+    lock = read_lockfile(project_dir)
+    engine = engine or RenderEngine()
+    renderer = engine.renderer(lock.template)
+    context = engine.build_context(renderer, output_dir=project_dir.parent, extra_context=lock.answers)
+    hashes = renderer.source_hashes()
+
+    if renderer.dependency_hash(context) != lock.dependency_hash:
+        changed = None  # re-render everything
+    else:
+        locked_hashes = {entry.source: entry.source_hash for entry in lock.files.values()}
+        changed = {source for source, source_hash in hashes.items() if locked_hashes.get(source) != source_hash}
+    rendered = {entry.path: entry for entry in renderer.render_files(context, sources=changed) if not entry.is_dir}
+
+    result = UpdateResult(project_dir, renderer.name, lock.version, package_version(), rendered=len(rendered))
+    files = dict(lock.files)
+    for path, entry in rendered.items():
+        status, conflicts = _apply(project_dir / path, entry, lock.files.get(path), dry_run=dry_run)
+        if status:
+            result.changes.append(FileChange(path, status, conflicts))
+        files[path] = LockedFile(entry.source, hashes[entry.source], content_hash(entry.content))
+        if not dry_run:
+            store_base(entry.content)
+
+    for path, locked in lock.files.items():
+        reconsidered = changed is None or locked.source in changed or locked.source not in hashes
+        if path in rendered or not reconsidered:
+            continue
+        del files[path]
+        target = project_dir / path
+        if not target.is_file():
+            continue
+        if content_hash(target.read_bytes()) == locked.hash:
+            result.changes.append(FileChange(path, "removed"))
+            if not dry_run:
+                target.unlink()
+        else:
+            result.changes.append(FileChange(path, "kept"))
+
+    if not dry_run:
+        lock.version = result.version
+        lock.dependency_hash = renderer.dependency_hash(context)
+        lock.files = files
+        _write(project_dir / LOCKFILE_NAME, lock.dumps().encode("utf-8"), 0o644)
+    return result
+
+
+def _apply(target: Path, entry: RenderedFile, locked: LockedFile | None, *, dry_run: bool) -> tuple[str | None, int]:
+    """Reconcile one re-rendered file with the project; return its status (``None`` if untouched)."""
+    new = entry.content or b""
+    if not target.exists():
+        if locked is not None:
+            return "skipped", 0
+        if not dry_run:
+            _write(target, new, entry.mode)
+        return "added", 0
+
+    ours = target.read_bytes()
+    ours_hash = content_hash(ours)
+    if ours_hash == content_hash(new):
+        return None, 0
+    if locked is not None and ours_hash == locked.hash:
+        if not dry_run:
+            _write(target, new, entry.mode)
+        return "updated", 0
+
+    # Without a stored base (cache cleared, file the template did not manage)
+    # every differing region is a conflict.
+    base = load_base(locked.hash) if locked is not None else None
+    merged = merge_bytes(base or b"", ours, new)
+    if merged is None:
+        return "conflict", 1
+    content, conflicts = merged
+    if not dry_run:
+        _write(target, content, None)
+    return ("conflict" if conflicts else "merged"), conflicts
+
+
+def _write(target: Path, content: bytes, mode: int | None) -> None:
+    """Replace ``target`` rather than writing into it, so a hardlinked file never changes its other links."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if mode is None:
+        mode = stat.S_IMODE(target.stat().st_mode)
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(content)
+    os.chmod(tmp, mode)
+    os.replace(tmp, target)
+
+
+def format_changes(result: UpdateResult) -> list[str]:
+    """Render an update result as ``status  path`` lines plus a summary line."""
+    width = max((len(change.status) for change in result.changes), default=0)
+    lines = [
+        f"{change.status:<{width}}  {change.path}" + (f" ({change.conflicts} conflicts)" if change.conflicts else "")
+        for change in sorted(result.changes, key=lambda change: change.path)
+    ]
+    summary = f"{result.template} {result.previous_version} -> {result.version}: "
+    summary += f"{result.rendered} files re-rendered, {len(result.changes)} changed"
+    if result.conflicts:
+        summary += f", {len(result.conflicts)} with conflicts"
+    lines.append(summary)
+    return lines
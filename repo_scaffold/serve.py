@@ -0,0 +1,455 @@
+"""``repo-scaffold serve``: a long-running HTTP/JSON generation service.
+
+Spawning ``repo-scaffold create`` per request pays the imports, the registry
+load and the Jinja compilation every time. The server pays them once: it keeps
+one :class:`~repo_scaffold.render.RenderEngine` for its lifetime, loads every
+template's renderer up front and renders each template once with its default
+answers, so the compiled templates of every request are already in memory.
+
+Endpoints::
+
+    GET  /healthz    {"status": "ok"}
+    GET  /templates  the registry: {"template-python": {"title": ..., "description": ...}, ...}
+    GET  /metrics    Prometheus text format (see below)
+    POST /generate   {"template": "python", "answers": {...}, "format": "tar.gz"}
+                     -> the project as a tar, tar.gz or zip archive (no hooks run)
+                     {"template": "python", "answers": {...}, "output_dir": "team-a"}
+                     -> {"project_dir": ...}; the project is created under the
+                        server's ``--root`` with its hooks, as ``create`` does
+
+``answers`` are cookiecutter variables (``extra_context``), checked against the
+template's ``_answer_schema`` before anything is rendered. Cookiecutter renders
+answers as Jinja outside any sandbox, so the server only accepts plain values:
+keys starting with ``_`` (the template's private settings such as
+``_answer_schema``) and strings containing Jinja markers (``{{``, ``{%``,
+``{#``) are rejected. Errors are JSON ``{"error": ...}`` with status 400 (bad
+request or rejected answers), 403 (``output_dir`` or the project directory
+outside ``--root``), 404 (unknown template), 409 (project exists), 422 (invalid
+answers, with the broken rules under ``errors``) or 500.
+
+The accept loop hands each connection to a bounded queue served by a fixed
+pool of worker threads; when the queue is full the connection is answered
+``503`` right away instead of piling up. Workers render and run the
+in-process post-gen hooks (dependency installation included) in parallel:
+hooks work on the project directory they are given and never change the
+process's working directory.
+
+``/metrics`` exposes request latency and queue wait histograms, queue depth,
+busy workers, rejected connections and the hit and miss counts (plus the hit
+ratio) of the Jinja bytecode cache and the render cache.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import json
+import queue
+import sys
+import threading
+import time
+from collections.abc import Callable
+from collections.abc import Iterator
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from http.server import HTTPServer
+from pathlib import Path
+from typing import Any
+
+from cookiecutter.exceptions import CookiecutterException
+from cookiecutter.exceptions import OutputDirExistsException
+
+from repo_scaffold.registry import get_registry
+from repo_scaffold.render import ARCHIVE_FORMATS
+from repo_scaffold.render import InvalidAnswersError
+from repo_scaffold.render import ProjectOutsideRootError
+from repo_scaffold.render import RenderEngine
+from repo_scaffold.render import archive_chunks
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8787
+DEFAULT_WORKERS = 4
+DEFAULT_QUEUE_SIZE = 64
+MAX_REQUEST_BYTES = 1 << 20
+# Upper bounds (seconds) of the latency histogram buckets, ``+Inf`` implied.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_CONTENT_TYPES = {"tar": "application/x-tar", "tar.gz": "application/gzip", "zip": "application/zip"}
+_ENDPOINTS = ("/healthz", "/templates", "/metrics", "/generate")
+_JINJA_MARKERS = ("{{", "{%", "{#")
+
+
+def answer_problem(answers: dict[str, Any]) -> str | None:
+    """Return why request ``answers`` can't be used, or ``None`` if they are plain values.
+
+    Private keys would override the template's own settings and Jinja markers
+    would run as template code on the server when cookiecutter renders them.
+    """
+    for key, value in answers.items():
+        if key.startswith("_"):
+            return f"Answer {key!r} is private to the template"
+        values = value if isinstance(value, list) else [value]
+        if not all(value is None or isinstance(value, str | int | float | bool) for value in values):
+            return f"Answer {key!r} must be a string, number, boolean or a list of them"
+        if any(isinstance(value, str) and any(m in value for m in _JINJA_MARKERS) for value in values):
+            return f"Answer {key!r} must not contain Jinja syntax ({', '.join(_JINJA_MARKERS)})"
+    return None
+
+
+class Histogram:
+    """A Prometheus-style histogram of durations in seconds."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        """Create an empty histogram with the given bucket upper bounds."""
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # the last one is ``+Inf``
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one duration."""
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.sum += seconds
+
+    @property
+    def count(self) -> int:
+        """Number of recorded durations."""
+        return sum(self.counts)
+
+    def lines(self, name: str, labels: str = "") -> list[str]:
+        """Return the ``_bucket``/``_sum``/``_count`` samples (``labels`` like ``endpoint="/generate"``)."""
+        prefix = f"{labels}," if labels else ""
+        lines = []
+        cumulative = 0
+        for bound, count in zip((*self.buckets, "+Inf"), self.counts, strict=True):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+        braces = f"{{{labels}}}" if labels else ""
+        lines.append(f"{name}_sum{braces} {self.sum:.6f}")
+        lines.append(f"{name}_count{braces} {cumulative}")
+        return lines
+
+
+class Metrics:
+    """Request counters and histograms shared by the worker threads."""
+
+    def __init__(self) -> None:
+        """Start with no recorded requests."""
+        self._lock = threading.Lock()
+        self.latency: dict[tuple[str, int], Histogram] = {}
+        self.queue_wait = Histogram()
+        self.rejected = 0
+        self.busy = 0
+
+    def observe_request(self, endpoint: str, status: int, seconds: float) -> None:
+        """Record a handled request's latency under its endpoint and response status."""
+        with self._lock:
+            self.latency.setdefault((endpoint, status), Histogram()).observe(seconds)
+
+    def observe_queue_wait(self, seconds: float) -> None:
+        """Record how long a connection waited for a worker."""
+        with self._lock:
+            self.queue_wait.observe(seconds)
+
+    def reject(self) -> None:
+        """Count a connection turned away because the queue was full."""
+        with self._lock:
+            self.rejected += 1
+
+    @contextlib.contextmanager
+    def working(self) -> Iterator[None]:
+        """Count a worker as busy for the duration of the block."""
+        with self._lock:
+            self.busy += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.busy -= 1
+
+    def render(self, server: GenerationServer) -> str:
+        """Format every metric in the Prometheus text exposition format."""
+        with self._lock:
+            lines = [
+                "# HELP repo_scaffold_request_duration_seconds Time to handle a request, queue wait excluded.",
+                "# TYPE repo_scaffold_request_duration_seconds histogram",
+            ]
+            for (endpoint, status), histogram in sorted(self.latency.items()):
+                labels = f'endpoint="{endpoint}",status="{status}"'
+                lines.extend(histogram.lines("repo_scaffold_request_duration_seconds", labels))
+            lines += [
+                "# HELP repo_scaffold_queue_wait_seconds Time a connection waited for a free worker.",
+                "# TYPE repo_scaffold_queue_wait_seconds histogram",
+                *self.queue_wait.lines("repo_scaffold_queue_wait_seconds"),
+                "# HELP repo_scaffold_requests_rejected_total Connections answered 503 because the queue was full.",
+                "# TYPE repo_scaffold_requests_rejected_total counter",
+                f"repo_scaffold_requests_rejected_total {self.rejected}",
+                "# TYPE repo_scaffold_workers_busy gauge",
+                f"repo_scaffold_workers_busy {self.busy}",
+            ]
+        lines += [
+            "# TYPE repo_scaffold_workers gauge",
+            f"repo_scaffold_workers {server.workers}",
+            "# TYPE repo_scaffold_queue_depth gauge",
+            f"repo_scaffold_queue_depth {server.queue_depth()}",
+            "# TYPE repo_scaffold_queue_capacity gauge",
+            f"repo_scaffold_queue_capacity {server.queue_size}",
+            "# TYPE repo_scaffold_templates_warm gauge",
+            f"repo_scaffold_templates_warm {len(server.warm_templates)}",
+        ]
+        caches = {"bytecode": server.engine.bytecode_cache, "render": server.engine.render_cache}
+        lookups = ["# TYPE repo_scaffold_cache_lookups_total counter"]
+        ratios = ["# TYPE repo_scaffold_cache_hit_ratio gauge"]
+        for name, cache in caches.items():
+            if cache is None:
+                continue
+            hits, misses = cache.hits, cache.misses
+            lookups.append(f'repo_scaffold_cache_lookups_total{{cache="{name}",result="hit"}} {hits}')
+            lookups.append(f'repo_scaffold_cache_lookups_total{{cache="{name}",result="miss"}} {misses}')
+            ratio = hits / (hits + misses) if hits + misses else 0.0
+            ratios.append(f'repo_scaffold_cache_hit_ratio{{cache="{name}"}} {ratio:.4f}')
+        return "\n".join(lines + lookups + ratios) + "\n"
+
+
+class GenerationRequestHandler(BaseHTTPRequestHandler):
+    """Routes one HTTP request; runs on a worker thread of :class:`GenerationServer`."""
+
+    server: GenerationServer
+    server_version = "repo-scaffold"
+
+    def do_GET(self) -> None:
+        """Serve ``/healthz``, ``/templates`` and ``/metrics``."""
+        self._timed(self._get)
+
+    def do_POST(self) -> None:
+        """Serve ``/generate``."""
+        self._timed(self._post)
+
+    def send_response(self, code: int, message: str | None = None) -> None:
+        """Send the status line, remembering the status for the latency metrics."""
+        self._status = code
+        super().send_response(code, message)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Write the access log line unless the server is quiet."""
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def _timed(self, handle: Callable[[], None]) -> None:
+        self._status = 0
+        started = time.perf_counter()
+        try:
+            handle()
+        except Exception as error:
+            if self._status:  # the response already started (a streamed archive): just drop the connection
+                raise
+            self.log_error("%s failed: %r", self.path, error)
+            self._send_error(HTTPStatus.INTERNAL_SERVER_ERROR, f"{type(error).__name__}: {error}")
+        finally:
+            endpoint = self.path.split("?", 1)[0]
+            endpoint = endpoint if endpoint in _ENDPOINTS else "other"
+            self.server.metrics.observe_request(endpoint, self._status, time.perf_counter() - started)
+
+    def _get(self) -> None:
+        path = self.path.split("?", 1)[0]
+        if path == "/healthz":
+            self._send_json(HTTPStatus.OK, {"status": "ok"})
+        elif path == "/templates":
+            templates = {
+                name: {"title": info["title"], "description": info["description"]}
+                for name, info in get_registry().templates.items()
+            }
+            self._send_json(HTTPStatus.OK, templates)
+        elif path == "/metrics":
+            self._send(HTTPStatus.OK, self.server.metrics.render(self.server).encode(), "text/plain; version=0.0.4")
+        else:
+            self._send_error(HTTPStatus.NOT_FOUND, f"No such endpoint: {path}")
+
+    def _post(self) -> None:
+        path = self.path.split("?", 1)[0]
+        if path != "/generate":
+            self._send_error(HTTPStatus.NOT_FOUND, f"No such endpoint: {path}")
+            return
+        try:
+            request = self._read_json()
+        except ValueError as error:
+            self._send_error(HTTPStatus.BAD_REQUEST, str(error))
+            return
+        template = request.get("template")
+        answers = request.get("answers", {})
+        if not isinstance(template, str) or not isinstance(answers, dict):
+            self._send_error(HTTPStatus.BAD_REQUEST, '"template" must be a string and "answers" an object')
+            return
+        problem = answer_problem(answers)
+        if problem is not None:
+            self._send_error(HTTPStatus.BAD_REQUEST, problem)
+            return
+        try:
+            if "output_dir" in request:
+                self._generate_to_path(template, answers, request["output_dir"])
+            else:
+                self._generate_archive(template, answers, request.get("format", "tar"))
+        except InvalidAnswersError as error:
+            self._send_json(HTTPStatus.UNPROCESSABLE_ENTITY, {"error": "Invalid answers", "errors": error.errors})
+        except OutputDirExistsException as error:
+            self._send_error(HTTPStatus.CONFLICT, str(error))
+        except ProjectOutsideRootError as error:
+            self._send_error(HTTPStatus.FORBIDDEN, str(error))
+        except ValueError as error:  # unknown template
+            self._send_error(HTTPStatus.NOT_FOUND, str(error))
+        except (CookiecutterException, OSError) as error:  # failed hook, unwritable root, ...
+            self._send_error(HTTPStatus.INTERNAL_SERVER_ERROR, str(error))
+
+    def _generate_archive(self, template: str, answers: dict[str, Any], archive_format: str) -> None:
+        if archive_format not in ARCHIVE_FORMATS:
+            self._send_error(HTTPStatus.BAD_REQUEST, f'"format" must be one of {", ".join(ARCHIVE_FORMATS)}')
+            return
+        # Answers are checked here, so every error is reported before the 200 goes out.
+        name, files = self.server.engine.stream(template, extra_context=answers)
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", _CONTENT_TYPES[archive_format])
+        self.send_header("Content-Disposition", f'attachment; filename="{name}.{archive_format}"')
+        self.end_headers()
+        try:
+            for chunk in archive_chunks(files, root=name, archive_format=archive_format):
+                self.wfile.write(chunk)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True  # the client went away; nothing left to report
+
+    def _generate_to_path(self, template: str, answers: dict[str, Any], output_dir: Any) -> None:
+        root = self.server.root
+        if root is None:
+            self._send_error(HTTPStatus.FORBIDDEN, 'Writing projects needs the server\'s --root; omit "output_dir"')
+            return
+        target = (root / str(output_dir)).resolve()
+        if not target.is_relative_to(root):
+            self._send_error(HTTPStatus.FORBIDDEN, f"output_dir must be inside {root}")
+            return
+        project_dir = self.server.engine.generate(template, output_dir=target, extra_context=answers, root=root)
+        self._send_json(HTTPStatus.CREATED, {"project_dir": str(project_dir)})
+
+    def _read_json(self) -> dict[str, Any]:
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            raise ValueError("Content-Length is required") from None
+        if not 0 <= length <= MAX_REQUEST_BYTES:
+            raise ValueError(f"Request body must be at most {MAX_REQUEST_BYTES} bytes")
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError as error:
+            raise ValueError(f"Request body is not valid JSON: {error}") from error
+        if not isinstance(request, dict):
+            raise ValueError("Request body must be a JSON object")
+        return request
+
+    def _send(self, status: HTTPStatus, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: HTTPStatus, body: Any) -> None:
+        self._send(status, json.dumps(body).encode("utf-8") + b"\n", "application/json")
+
+    def _send_error(self, status: HTTPStatus, message: str) -> None:
+        self._send_json(status, {"error": message})
+
+
+class GenerationServer(HTTPServer):
+    """``HTTPServer`` whose connections are handled by a fixed worker pool behind a bounded queue."""
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        *,
+        engine: RenderEngine | None = None,
+        workers: int = DEFAULT_WORKERS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        root: Path | None = None,
+        quiet: bool = False,
+    ):
+        """Bind to ``address`` and start the worker threads.
+
+        Args:
+            address: ``(host, port)``; port 0 picks a free port (see ``server_address``).
+            engine: Engine kept for the server's lifetime (default: a new one with the on-disk caches).
+            workers: Number of requests handled concurrently.
+            queue_size: Connections allowed to wait for a worker before new ones get ``503``.
+            root: Directory ``output_dir`` requests write under; ``None`` serves archives only.
+            quiet: Don't write an access log line per request to stderr.
+        """
+        super().__init__(address, GenerationRequestHandler)
+        self.engine = engine or RenderEngine()
+        self.workers = workers
+        self.queue_size = queue_size
+        self.root = root.resolve() if root is not None else None
+        self.quiet = quiet
+        self.metrics = Metrics()
+        self.warm_templates: list[str] = []
+        self._queue: queue.Queue[tuple[Any, Any, float] | None] = queue.Queue(maxsize=queue_size)
+        self._threads = [
+            threading.Thread(target=self._work, name=f"serve-worker-{index}", daemon=True) for index in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def warm(self, templates: list[str] | None = None) -> list[str]:
+        """Load the renderers of ``templates`` (default: all) and compile them by rendering their defaults.
+
+        A template whose defaults cannot be rendered is still served; it just
+        compiles on its first request. Returns the templates warmed.
+        """
+        for name in templates if templates is not None else sorted(get_registry().templates):
+            try:
+                _, files = self.engine.stream(name)
+                for _ in files:
+                    pass
+            except Exception as error:  # a template whose defaults fail must not stop the server
+                print(f"Warning: could not warm {name}: {error}", file=sys.stderr)
+                continue
+            self.warm_templates.append(name)
+        return self.warm_templates
+
+    def queue_depth(self) -> int:
+        """Connections currently waiting for a worker."""
+        return self._queue.qsize()
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        """Queue the connection for a worker, or answer ``503`` if the queue is full."""
+        try:
+            self._queue.put_nowait((request, client_address, time.perf_counter()))
+        except queue.Full:
+            self.metrics.reject()
+            body = json.dumps({"error": "Server busy, try again later"}).encode("utf-8") + b"\n"
+            with contextlib.suppress(OSError):  # the client may already be gone
+                request.sendall(
+                    b"HTTP/1.0 503 Service Unavailable\r\nContent-Type: application/json\r\nRetry-After: 1\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+            self.shutdown_request(request)
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            request, client_address, queued = item
+            self.metrics.observe_queue_wait(time.perf_counter() - queued)
+            try:
+                with self.metrics.working():
+                    self.finish_request(request, client_address)
+            except Exception:  # one broken connection must not kill the worker
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        """Stop accepting, let the workers finish the queued connections, then close the socket."""
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        super().server_close()
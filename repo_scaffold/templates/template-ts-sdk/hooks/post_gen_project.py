@@ -1,64 +1,61 @@
 """Post-generation project setup and cleanup script for TypeScript SDK library projects."""
 
-import re
-import shutil
-import subprocess
+import json
 import sys
 from pathlib import Path
-from typing import List, Union
+from typing import Any, Dict, List
+
+try:
+    import repo_scaffold.hooks  # noqa: F401
+except ImportError:  # plain cookiecutter from another environment: load only the runtime shipped with the templates
+    import importlib.util
+
+    _package = Path(r"{{ cookiecutter._repo_dir }}").resolve().parents[1]
+    if not (_package / "hooks" / "__init__.py").is_file():
+        sys.exit(f"ERROR: repo_scaffold hook runtime not found in {_package}; install repo-scaffold to run this hook")
+    _spec = importlib.util.spec_from_file_location(
+        "repo_scaffold", _package / "__init__.py", submodule_search_locations=[str(_package)]
+    )
+    sys.modules["repo_scaffold"] = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(sys.modules["repo_scaffold"])
+
+from repo_scaffold.hooks import InstallStep, answer_errors, check_answers, initialize, init_git_repo
+from repo_scaffold.hooks import install_dependencies, remove_paths
+from repo_scaffold.trace import span
+
+INSTALL = InstallStep(
+    command=("pnpm", "install"),
+    manifest="package.json",
+    starting="Installing project dependencies with pnpm...",
+    not_found="pnpm not found. Please install pnpm first: https://pnpm.io/installation",
+)
 
 
 class ProjectValidator:
-    """Validates rendered Cookiecutter values before cleanup and initialization."""
+    """Validates rendered Cookiecutter values against the template's ``_answer_schema``.
 
-    def __init__(self):
-        self.project_slug = "{{cookiecutter.project_slug}}"
+    repo-scaffold checks the same schema (``cookiecutter.json``) before it
+    renders anything; the hook applies it again for plain ``cookiecutter`` runs.
+    """
+
+    def __init__(self, context: Dict[str, Any]):
+        self.context = context
+
+    def errors(self) -> List[str]:
+        """Return one message per schema rule the rendered values break."""
+        return answer_errors(self.context)
 
     def validate(self) -> None:
-        """Validate generated project slug format."""
-        if not re.fullmatch(r"[a-z0-9][a-z0-9-]*", self.project_slug):
-            print(
-                "Error: project_slug must be a lowercase repository slug using letters, "
-                f"numbers, and hyphens (got {self.project_slug!r})"
-            )
-            sys.exit(1)
+        """Print every broken rule and exit with status 1 if there is any."""
+        check_answers(self.context)
 
 
 class ProjectCleaner:
     """Handles removal of unnecessary files and directories based on cookiecutter choices."""
 
-    def __init__(self):
-        self.use_github_actions = "{{cookiecutter.use_github_actions}}" == "yes"
-
-    def _safe_remove(self, path: Union[str, Path]) -> bool:
-        """Safely remove a file or directory.
-
-        Args:
-            path: Path to remove
-
-        Returns:
-            bool: True if removed successfully, False otherwise
-        """
-        try:
-            path = Path(path)
-            if not path.exists():
-                return False
-
-            if path.is_file():
-                path.unlink()
-                print(f"Removed file: {path}")
-            elif path.is_dir():
-                shutil.rmtree(path)
-                print(f"Removed directory: {path}")
-            return True
-        except Exception as e:
-            print(f"Warning: Failed to remove {path}: {e}")
-            return False
-
-    def _remove_files(self, files: List[Union[str, Path]]) -> None:
-        """Remove multiple files or directories."""
-        for file_path in files:
-            self._safe_remove(file_path)
+    def __init__(self, context: Dict[str, Any], project_dir: Path):
+        self.project_dir = project_dir
+        self.use_github_actions = context["use_github_actions"] == "yes"
 
     def clean_github_actions_files(self) -> None:
         """Remove GitHub Actions files if not needed."""
@@ -70,95 +67,60 @@ class ProjectCleaner:
             "cog.toml",
         ]
         print("Removing GitHub Actions files...")
-        self._remove_files(github_files)
+        remove_paths(github_files, root=self.project_dir)
 
     def clean_shared_fragments(self) -> None:
         """Remove the _shared/ directory used for workflow fragment includes."""
-        shared_dir = Path("_shared")
-        if shared_dir.is_dir():
-            print("Removing shared workflow fragments...")
-            self._safe_remove(shared_dir)
+        remove_paths(["_shared"], root=self.project_dir)
 
 
 class ProjectInitializer:
     """Handles project initialization tasks."""
 
-    def __init__(self):
-        self.install_after_generate = "{{cookiecutter.install_after_generate}}" == "yes"
-        self.init_git = "{{cookiecutter.init_git}}" == "yes"
+    def __init__(self, context: Dict[str, Any], project_dir: Path):
+        self.project_dir = project_dir
+        self.install_after_generate = context["install_after_generate"] == "yes"
+        self.init_git = context["init_git"] == "yes"
 
     def init_git_repo(self) -> None:
         """Initialize a git repository on branch ``master`` (best effort)."""
-        if not self.init_git:
-            print("Skipping git init (--no-git selected).")
-            return
-
-        if (Path.cwd() / ".git").exists():
-            print("Git repository already initialized, skipping git init.")
-            return
-
-        try:
-            print("Initializing git repository (branch: master)...")
-            try:
-                subprocess.run(["git", "init", "-b", "master"], check=True, capture_output=True)
-            except subprocess.CalledProcessError:
-                # Older git without `-b`: init, then point HEAD at master.
-                subprocess.run(["git", "init"], check=True, capture_output=True)
-                subprocess.run(
-                    ["git", "symbolic-ref", "HEAD", "refs/heads/master"],
-                    check=True,
-                    capture_output=True,
-                )
-            print("✅ Initialized empty git repository on branch 'master'")
-        except FileNotFoundError:
-            print("⚠️  git not found; skipped git init. Install git to enable version control.")
-        except subprocess.CalledProcessError as e:
-            print(f"⚠️  Skipped git init: {e}")
+        init_git_repo(self.init_git, root=self.project_dir)
 
     def setup_environment(self) -> None:
         """Initialize project dependencies with pnpm."""
-        if not self.install_after_generate:
-            print("Skipping dependency installation (--no-install selected).")
-            return
+        install_dependencies(INSTALL, self.install_after_generate, root=self.project_dir)
+
+    def run(self) -> None:
+        """Run git init and dependency installation concurrently, keeping their output in this order."""
+        initialize(INSTALL, init_git=self.init_git, install=self.install_after_generate, root=self.project_dir)
+
+
+def main(context: Dict[str, Any], project_dir: Path) -> None:
+    """Run the post-generation steps in ``project_dir`` for a resolved cookiecutter context.
 
-        project_dir = Path.cwd()
-        if not (project_dir / "package.json").exists():
-            print(f"Error: Project package.json not found in {project_dir}")
-            sys.exit(1)
-
-        try:
-            print("Installing project dependencies with pnpm...")
-            subprocess.run(["pnpm", "install"], check=True)
-            print("✅ Dependencies installed successfully")
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to install dependencies: {e}")
-            sys.exit(1)
-        except FileNotFoundError:
-            print("❌ pnpm not found. Please install pnpm first: https://pnpm.io/installation")
-            sys.exit(1)
-
-
-def main() -> None:
-    """Main execution function."""
+    repo-scaffold imports this module once per template and calls ``main`` in-process
+    for every project; cookiecutter renders the file and runs it as a script.
+    """
     print("🚀 Starting TypeScript SDK library project post-generation setup...")
 
-    validator = ProjectValidator()
-    validator.validate()
+    validator = ProjectValidator(context)
+    with span("validate"):
+        validator.validate()
 
-    cleaner = ProjectCleaner()
+    with span("cleanup"):
+        cleaner = ProjectCleaner(context, project_dir)
 
-    print("\n📁 Cleaning up unnecessary files...")
-    cleaner.clean_shared_fragments()
-    cleaner.clean_github_actions_files()
+        print("\n📁 Cleaning up unnecessary files...")
+        cleaner.clean_shared_fragments()
+        cleaner.clean_github_actions_files()
 
     print("\n🔧 Initializing project...")
-    initializer = ProjectInitializer()
-    initializer.init_git_repo()
-    initializer.setup_environment()
+    initializer = ProjectInitializer(context, project_dir)
+    initializer.run()
 
     print("\n✨ Project setup completed successfully!")
-    print(f"📂 Your project is ready at: {{cookiecutter.project_slug}}")
+    print(f"📂 Your project is ready at: {context['project_slug']}")
 
 
 if __name__ == "__main__":
-    main()
+    main(json.loads(r"""{{ cookiecutter | jsonify }}"""), Path.cwd())
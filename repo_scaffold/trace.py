@@ -0,0 +1,162 @@
+"""Per-phase timing for ``repo-scaffold create`` and ``gh-init``.
+
+``create --profile`` / ``gh-init --profile`` (or setting
+``REPO_SCAFFOLD_TRACE=path``) record one span per phase and write them as a
+Chrome trace (``chrome://tracing``, Perfetto), which is also plain JSON for
+dashboards::
+
+    {"traceEvents": [{"name": "render", "ph": "X", "ts": ..., "dur": ..., "pid": ..., "tid": ...}, ...],
+     "displayTimeUnit": "ms"}
+
+``create`` records ``create``, ``registry`` (first load only), ``import``,
+``load template``, ``prompt``, ``render cache``, ``render``, ``lockfile``,
+``publish``, ``pre_gen_project`` and ``post_gen_project``. The bundled
+templates' post-gen hooks run in-process (see
+:func:`repo_scaffold.render.hooks.run_hook`), so their spans (``validate``,
+``cleanup``, the ``git``/``install`` tasks and the ``git init`` / ``uv sync``
+/ ``pnpm install`` / ``cargo build`` subprocess calls inside them) nest under
+``post_gen_project`` in the same trace.
+
+``gh-init`` records ``gh-init``, ``login``, ``create repo``, ``secrets and
+variables``, ``push``, ``docs build`` (on its background thread), ``docs build
+wait``, ``docs publish`` (or ``docs deploy``), ``enable pages`` and ``protect
+branch``; :func:`timeline` prints them with their start offsets so overlapping
+phases show as overlapping bars.
+
+Tracing is off unless enabled, and :func:`span` is then a no-op, so the
+instrumentation costs nothing in normal runs.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager
+from contextlib import contextmanager
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any
+
+
+TRACE_ENV_VAR = "REPO_SCAFFOLD_TRACE"
+DEFAULT_TRACE_PATH = Path("repo-scaffold-trace.json")
+
+
+class Tracer:
+    """Collects complete-duration ("X") trace events."""
+
+    def __init__(self):
+        """Create a tracer with no events."""
+        self.events: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[None]:
+        """Record the duration of the block as an event called ``name``."""
+        start = time.time_ns()
+        try:
+            yield
+        except BaseException as exc:
+            args["error"] = type(exc).__name__
+            raise
+        finally:
+            event = {
+                "name": name,
+                "cat": "repo-scaffold",
+                "ph": "X",
+                "ts": start / 1000,
+                "dur": (time.time_ns() - start) / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_native_id(),
+            }
+            if args:
+                event["args"] = {key: str(value) for key, value in args.items()}
+            self._record(event)
+
+    def _record(self, event: dict[str, Any]) -> None:
+        with self._lock:
+            self.events.append(event)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Return the Chrome trace document, naming this process."""
+        events = sorted(self.events, key=lambda event: event["ts"])
+        metadata = {"name": "process_name", "ph": "M", "pid": os.getpid(), "tid": 0, "args": {"name": "repo-scaffold"}}
+        return {"traceEvents": [metadata, *events], "displayTimeUnit": "ms"}
+
+
+_active: Tracer | None = None
+
+
+def span(name: str, **args: Any) -> AbstractContextManager[None]:
+    """Time the block as phase ``name`` if tracing is on; otherwise do nothing."""
+    if _active is None:
+        return nullcontext()
+    return _active.span(name, **args)
+
+
+def trace_path(profile: bool) -> Path | None:
+    """Return where to write the trace: ``$REPO_SCAFFOLD_TRACE``, else the default with ``--profile``."""
+    configured = os.environ.get(TRACE_ENV_VAR, "").strip()
+    if configured:
+        return Path(configured).expanduser()
+    return DEFAULT_TRACE_PATH if profile else None
+
+
+def summarize(events: list[dict[str, Any]]) -> list[str]:
+    """Render complete events as ``name  duration`` lines in start order."""
+    spans = sorted((event for event in events if event.get("ph") == "X"), key=lambda event: event["ts"])
+    if not spans:
+        return []
+    width = max(len(event["name"]) for event in spans)
+    return [f"{event['name']:<{width}}  {event['dur'] / 1000:>9.1f} ms" for event in spans]
+
+
+def timeline(events: list[dict[str, Any]], width: int = 40) -> list[str]:
+    """Render complete events as ``name  +start  duration  |bar|`` lines in start order.
+
+    Offsets are from the first span's start, and each bar covers the span's
+    share of the whole run, so phases that ran concurrently overlap.
+    """
+    spans = sorted((event for event in events if event.get("ph") == "X"), key=lambda event: event["ts"])
+    if not spans:
+        return []
+    origin = spans[0]["ts"]
+    total = max(event["ts"] + event["dur"] for event in spans) - origin or 1.0
+    name_width = max(len(event["name"]) for event in spans)
+    lines = []
+    for event in spans:
+        start = min(width - 1, round((event["ts"] - origin) / total * width))
+        end = max(start + 1, round((event["ts"] + event["dur"] - origin) / total * width))
+        bar = " " * start + "#" * (min(end, width) - start)
+        lines.append(
+            f"{event['name']:<{name_width}}  +{(event['ts'] - origin) / 1000:>8.1f} ms"
+            f"  {event['dur'] / 1000:>9.1f} ms  |{bar:<{width}}|"
+        )
+    return lines
+
+
+@contextmanager
+def tracing(path: Path | None) -> Iterator[Tracer | None]:
+    """Enable tracing for the block and write the trace to ``path`` afterwards.
+
+    ``None`` disables tracing. The trace is written when the block exits,
+    including when it raises.
+    """
+    global _active
+    if path is None:
+        yield None
+        return
+
+    tracer = Tracer()
+    previous = _active
+    _active = tracer
+    try:
+        yield tracer
+    finally:
+        _active = previous
+        document = tracer.to_chrome_trace()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(document), encoding="utf-8")
@@ -0,0 +1,368 @@
+"""In-process stand-in for the GitHub REST API, for gh-init integration and load tests.
+
+``FakeGitHub`` serves the endpoints ``gh-init`` uses from a
+``ThreadingHTTPServer`` on a local port, keeping state in memory, and backs
+every repository it creates with a bare git repository whose path is the
+``clone_url``, so ``git push`` works too. Both clients can point at it::
+
+    with FakeGitHub(tmp_path / "remotes") as github:
+        client = GhInitClient("token", base_url=github.url, seconds_between_writes=None)
+        init_repository(config, client)
+        assert github.calls["PUT /repos/{owner}/{repo}/actions/secrets/{name}"] == 2
+
+Every request is counted under its route (``github.calls``, a ``Counter``),
+and ``latency`` delays responses (seconds for every route, or per route), so
+request counts and latency behaviour can be asserted on and benchmarked.
+Secrets are decrypted with the server's private key, so tests can check the
+values that arrived.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import re
+import subprocess
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from dataclasses import field
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote
+
+from nacl.public import PrivateKey
+from nacl.public import SealedBox
+
+
+@dataclass
+class FakeRepo:
+    """Server-side state of one repository."""
+
+    owner: str
+    name: str
+    description: str = ""
+    private: bool = False
+    homepage: str | None = None
+    secrets: dict[str, str] = field(default_factory=dict)  # decrypted values
+    variables: dict[str, str] = field(default_factory=dict)
+    pages: dict[str, Any] | None = None
+    protection: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    @property
+    def full_name(self) -> str:
+        """``owner/name``."""
+        return f"{self.owner}/{self.name}"
+
+
+class _Error(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+_Handler = Callable[["FakeGitHub", dict[str, str], dict[str, Any]], tuple[int, Any]]
+
+
+class FakeGitHub:
+    """A local GitHub REST API with per-route call counts and injectable latency."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        login: str = "me",
+        orgs: tuple[str, ...] = (),
+        latency: float | dict[str, float] = 0.0,
+    ):
+        """Serve from ``root`` (bare remotes live under it) as user ``login``, member of ``orgs``."""
+        self.root = Path(root)
+        self.login = login
+        self.orgs = set(orgs)
+        self.latency = latency
+        self.repos: dict[str, FakeRepo] = {}
+        self.calls: Counter[str] = Counter()
+        self.private_key = PrivateKey.generate()
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    # -- lifecycle ---------------------------------------------------------
+
+    @property
+    def url(self) -> str:
+        """Base URL of the API (what ``base_url`` should be set to)."""
+        assert self._server is not None, "server not started"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> FakeGitHub:
+        """Start serving on a free local port."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-github", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Shut the server down."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> FakeGitHub:
+        """Start the server."""
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop the server."""
+        self.stop()
+
+    # -- helpers for tests -------------------------------------------------
+
+    @property
+    def total_calls(self) -> int:
+        """Requests served so far, over all routes."""
+        return sum(self.calls.values())
+
+    def remote(self, full_name: str) -> Path:
+        """Path of the bare git repository behind ``full_name``."""
+        return self.root / f"{full_name}.git"
+
+    def add_repo(self, owner: str, name: str, **attributes: Any) -> FakeRepo:
+        """Create a repository (and its bare remote) as if it already existed."""
+        repo = FakeRepo(owner, name, **attributes)
+        self.remote(repo.full_name).parent.mkdir(parents=True, exist_ok=True)
+        subprocess.run(
+            ["git", "init", "--bare", "-q", str(self.remote(repo.full_name))], check=True, capture_output=True
+        )
+        self.repos[repo.full_name] = repo
+        return repo
+
+    def branches(self, full_name: str) -> list[str]:
+        """Branches pushed to the repository's remote."""
+        result = subprocess.run(
+            [
+                "git",
+                "--git-dir",
+                str(self.remote(full_name)),
+                "for-each-ref",
+                "--format=%(refname:short)",
+                "refs/heads",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        return result.stdout.split()
+
+    # -- JSON representations ---------------------------------------------
+
+    def repo_json(self, repo: FakeRepo) -> dict[str, Any]:
+        """The API's representation of ``repo``."""
+        api = f"{self.url}/repos/{repo.full_name}"
+        return {
+            "id": abs(hash(repo.full_name)) % 10**8,
+            "name": repo.name,
+            "full_name": repo.full_name,
+            "owner": {"login": repo.owner, "type": "Organization" if repo.owner in self.orgs else "User"},
+            "private": repo.private,
+            "description": repo.description,
+            "homepage": repo.homepage,
+            "url": api,
+            "html_url": f"https://github.com/{repo.full_name}",
+            "clone_url": str(self.remote(repo.full_name)),
+            "default_branch": "main",
+        }
+
+    def _repo(self, params: dict[str, str]) -> FakeRepo:
+        repo = self.repos.get(f"{params['owner']}/{params['repo']}")
+        if repo is None:
+            raise _Error(404, "Not Found")
+        return repo
+
+    # -- request dispatch --------------------------------------------------
+
+    def handle(self, method: str, path: str, body: dict[str, Any]) -> tuple[int, Any]:
+        """Dispatch one request; return its status and JSON body."""
+        for route_method, template, pattern, handler in _ROUTES:
+            match = pattern.fullmatch(path)
+            if route_method == method and match:
+                route = f"{method} {template}"
+                with self._lock:
+                    self.calls[route] += 1
+                delay = self.latency.get(route, 0.0) if isinstance(self.latency, dict) else self.latency
+                if delay:
+                    time.sleep(delay)
+                try:
+                    with self._lock:
+                        params = {key: unquote(value) for key, value in match.groupdict().items()}
+                        return handler(self, params, body)
+                except _Error as error:
+                    return error.status, {"message": str(error)}
+        with self._lock:
+            self.calls[f"{method} {path}"] += 1
+        return 404, {"message": "Not Found"}
+
+    # -- endpoints ---------------------------------------------------------
+
+    def _get_user(self, params: dict[str, str], body: dict[str, Any]) -> tuple[int, Any]:
+        return 200, {"login": self.login, "type": "User", "url": f"{self.url}/users/{self.login}"}
+
+    def _get_org(self, params: dict[str, str], body: dict[str, Any]) -> tuple[int, Any]:
+        if params["org"] not in self.orgs:
+            raise _Error(404, "Not Found")
+        return 200, {"login": params["org"], "type": "Organization", "url": f"{self.url}/orgs/{params['org']}"}
+
+    def _create_repo(self, params: dict[str, str], body: dict[str, Any]) -> tuple[int, Any]:
+        owner = params.get("org") or self.login
+        if owner != self.login and owner not in self.orgs:
+            raise _Error(404, "Not Found")
+        if f"{owner}/{body['name']}" in self.repos:
+            raise _Error(422, "Repository creation failed: name already exists on this account")
+        repo = self.add_repo(
+            owner,
+            body["name"],
+            description=body.get("description") or "",
+            private=bool(body.get("private")),
+            homepage=body.get("homepage"),
+        )
+        return 201, self.repo_json(repo)
+
+    def _get_repo(self, params: dict[str, str], body: dict[str, Any]) -> tuple[int, Any]:
+        return 200, self.repo_json(self._repo(params))
+
+    def _edit_repo(self, params: dict[str, str], body: dict[str, Any]) -> tuple[int, Any]:
+        repo = self._repo(params)
+        for key in ("description", "homepage", "private"):
+            if key in body:
+                setattr(repo, key, body[key])
+        return 200, self.repo_json(repo)
+
+    def _public_key(self, params: dict[str, str], body: dict[str, Any]) -> tuple[int, Any]:
+        self._repo(params)
+        return 200, {"key_id": "fake-key", "key": base64.b64encode(bytes(self.private_key.public_key)).decode()}
+
+    def _put_secret(self, params: dict[str, str], body: dict[str, Any]) -> tuple[int, Any]:
+        repo = self._repo(params)
+        if body.get("key_id") != "fake-key":
+            raise _Error(422, "Bad key_id")
+        sealed = base64.b64decode(body["encrypted_value"])
+        created = params["name"] not in repo.secrets
+        repo.secrets[params["name"]] = SealedBox(self.private_key).decrypt(sealed).decode()
+        return (201 if created else 204), None
+
+    def _list_variables(self, params: dict[str, str], body: dict[str, Any]) -> tuple[int, Any]:
+        variables = [{"name": name, "value": value} for name, value in self._repo(params).variables.items()]
+        return 200, {"total_count": len(variables), "variables": variables}
+
+    def _create_variable(self, params: dict[str, str], body: dict[str, Any]) -> tuple[int, Any]:
+        repo = self._repo(params)
+        if body["name"] in repo.variables:
+            raise _Error(409, "Already exists - Variable already exists")
+        repo.variables[body["name"]] = body["value"]
+        return 201, {}
+
+    def _get_variable(self, params: dict[str, str], body: dict[str, Any]) -> tuple[int, Any]:
+        repo = self._repo(params)
+        if params["name"] not in repo.variables:
+            raise _Error(404, "Not Found")
+        url = f"{self.url}/repos/{repo.full_name}/actions/variables/{params['name']}"
+        return 200, {"name": params["name"], "value": repo.variables[params["name"]], "url": url}
+
+    def _edit_variable(self, params: dict[str, str], body: dict[str, Any]) -> tuple[int, Any]:
+        repo = self._repo(params)
+        if params["name"] not in repo.variables:
+            raise _Error(404, "Not Found")
+        repo.variables[params["name"]] = body["value"]
+        return 204, None
+
+    def _create_pages(self, params: dict[str, str], body: dict[str, Any]) -> tuple[int, Any]:
+        repo = self._repo(params)
+        if repo.pages is not None:
+            raise _Error(409, "GitHub Pages is already enabled.")
+        repo.pages = dict(body["source"])
+        return 201, {"url": f"{self.url}/repos/{repo.full_name}/pages", "source": repo.pages}
+
+    def _update_pages(self, params: dict[str, str], body: dict[str, Any]) -> tuple[int, Any]:
+        repo = self._repo(params)
+        if repo.pages is None:
+            raise _Error(404, "Not Found")
+        repo.pages = dict(body["source"])
+        return 204, None
+
+    def _get_branch(self, params: dict[str, str], body: dict[str, Any]) -> tuple[int, Any]:
+        repo = self._repo(params)
+        if params["branch"] not in self.branches(repo.full_name):
+            raise _Error(404, "Branch not found")
+        url = f"{self.url}/repos/{repo.full_name}/branches/{params['branch']}"
+        return 200, {
+            "name": params["branch"],
+            "protected": params["branch"] in repo.protection,
+            "protection_url": f"{url}/protection",
+        }
+
+    def _protect_branch(self, params: dict[str, str], body: dict[str, Any]) -> tuple[int, Any]:
+        repo = self._repo(params)
+        if params["branch"] not in self.branches(repo.full_name):
+            raise _Error(404, "Branch not found")
+        repo.protection[params["branch"]] = body
+        return 200, {"url": f"{self.url}/repos/{repo.full_name}/branches/{params['branch']}/protection"}
+
+
+def _route(method: str, template: str, handler: _Handler) -> tuple[str, str, re.Pattern[str], _Handler]:
+    pattern = re.compile(re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", template))
+    return method, template, pattern, handler
+
+
+_REPO = "/repos/{owner}/{repo}"
+_ROUTES = [
+    _route("GET", "/user", FakeGitHub._get_user),
+    _route("GET", "/orgs/{org}", FakeGitHub._get_org),
+    _route("POST", "/user/repos", FakeGitHub._create_repo),
+    _route("POST", "/orgs/{org}/repos", FakeGitHub._create_repo),
+    _route("GET", _REPO, FakeGitHub._get_repo),
+    _route("PATCH", _REPO, FakeGitHub._edit_repo),
+    _route("GET", f"{_REPO}/actions/secrets/public-key", FakeGitHub._public_key),
+    _route("PUT", f"{_REPO}/actions/secrets/{{name}}", FakeGitHub._put_secret),
+    _route("GET", f"{_REPO}/actions/variables", FakeGitHub._list_variables),
+    _route("POST", f"{_REPO}/actions/variables", FakeGitHub._create_variable),
+    _route("GET", f"{_REPO}/actions/variables/{{name}}", FakeGitHub._get_variable),
+    _route("PATCH", f"{_REPO}/actions/variables/{{name}}", FakeGitHub._edit_variable),
+    _route("POST", f"{_REPO}/pages", FakeGitHub._create_pages),
+    _route("PUT", f"{_REPO}/pages", FakeGitHub._update_pages),
+    _route("GET", f"{_REPO}/branches/{{branch}}", FakeGitHub._get_branch),
+    _route("PUT", f"{_REPO}/branches/{{branch}}/protection", FakeGitHub._protect_branch),
+]
+
+
+def _make_handler(github: FakeGitHub) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, as both clients pool connections
+
+        def _dispatch(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            body = json.loads(raw) if raw else {}
+            path = self.path.split("?", 1)[0]
+            status, payload = github.handle(self.command, path, body)
+            data = json.dumps(payload).encode() if payload is not None else b""
+            self.send_response(status)
+            if data:
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return Handler
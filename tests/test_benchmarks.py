@@ -0,0 +1,84 @@
+"""Benchmark suite helper tests (the benchmarks themselves are run with ``just bench``)."""
+
+import importlib.util
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from repo_scaffold.registry import get_registry
+
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "benchmarks" / "bench_render.py"
+_spec = importlib.util.spec_from_file_location("bench_render", _SCRIPT)
+bench_render = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(bench_render)
+
+
+def _result(template, case, wall_seconds, peak_rss_kib):
+    return {"template": template, "case": case, "wall_seconds": wall_seconds, "peak_rss_kib": peak_rss_kib}
+
+
+def test_cases_cover_defaults_minimal_and_every_variant():
+    """Every template gets a default case; multi-choice options get one case per extra choice."""
+    registry = get_registry()
+    for name in registry.templates:
+        cases = dict(bench_render.template_cases(registry.variables[name]))
+        assert cases["default"] == {}
+        for answers in cases.values():
+            assert not set(answers) & set(bench_render.FLAGS)
+
+    pnpm = dict(bench_render.template_cases(registry.variables["template-pnpm-workspace"]))
+    choices = registry.variables["template-pnpm-workspace"]["initial_package_type"]
+    assert {f"initial_package_type={choice}" for choice in choices[1:]} <= set(pnpm)
+    assert set(pnpm["minimal"].values()) == {"no"}
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    """Wall time or RSS growth above the threshold is reported; new or removed cases are not."""
+    baseline = {"results": [_result("t", "default", 1.0, 1000), _result("t", "removed", 1.0, 1000)]}
+    current = {
+        "results": [
+            _result("t", "default", 1.2, 1300),
+            _result("t", "added", 9.0, 9000),
+        ]
+    }
+
+    regressions = bench_render.compare(current, baseline, threshold=0.25)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("t [default] peak_rss_kib: 1000 -> 1300")
+    assert bench_render.compare(current, baseline, threshold=0.5) == []
+
+
+def test_missing_baseline_fails_before_running(tmp_path, monkeypatch, capsys):
+    """A missing ``--compare`` file is a usage error naming the recipe that records one, not a traceback."""
+    monkeypatch.setattr(bench_render, "run_suite", lambda *args, **kwargs: pytest.fail("suite ran"))
+
+    with pytest.raises(SystemExit) as exited:
+        bench_render.main(["--compare", str(tmp_path / "baseline.json")])
+
+    assert exited.value.code == 2
+    assert "just bench-baseline" in capsys.readouterr().err
+
+
+def test_run_case_uses_private_cold_or_warm_caches(monkeypatch):
+    """Cold rounds each get an empty cache; warm rounds share one primed by an unmeasured run."""
+    cache_dirs = []
+
+    def fake_run(command, **kwargs):
+        cache_dirs.append(kwargs["env"]["REPO_SCAFFOLD_CACHE_DIR"])
+        sample = {"seconds": 0.1, "files": 1, "bytes": 1, "peak_rss_kib": 1}
+        return subprocess.CompletedProcess(command, 0, stdout=json.dumps(sample))
+
+    monkeypatch.setattr(bench_render.subprocess, "run", fake_run)
+
+    cold = bench_render.run_case("template-rust", {}, rounds=3, cache="cold")
+    assert len(set(cache_dirs)) == 3
+    cache_dirs.clear()
+    warm = bench_render.run_case("template-rust", {}, rounds=3, cache="warm")
+
+    assert len(cache_dirs) == 4 and len(set(cache_dirs)) == 1
+    assert (cold["cache"], warm["cache"]) == ("cold", "warm")
+    assert not any(Path(cache_dir).exists() for cache_dir in cache_dirs)
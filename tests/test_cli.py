@@ -0,0 +1,46 @@
+"""CLI entry point tests."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+# Top-level packages that cheap commands must never import. ``repo_scaffold.github_init``
+# is listed on its own because it is the in-repo module that pulls in PyGithub.
+_HEAVY_MODULES = ("github", "cookiecutter", "jinja2", "repo_scaffold.github_init")
+
+
+def _modules_loaded_by(args: list[str]) -> list[str]:
+    """Invoke the CLI in a fresh interpreter and return the heavy modules it imported."""
+    code = (
+        "import sys\n"
+        "from click.testing import CliRunner\n"
+        "from repo_scaffold.cli import cli\n"
+        f"result = CliRunner().invoke(cli, {args!r})\n"
+        "assert result.exit_code == 0, result.output\n"
+        f"heavy = {_HEAVY_MODULES!r}\n"
+        "print('\\n'.join(m for m in sys.modules if m in heavy or m.startswith(tuple(h + '.' for h in heavy))))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], check=False, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    return [line for line in result.stdout.splitlines() if line]
+
+
+@pytest.mark.parametrize(
+    "args", [["list"], ["--help"], ["create", "--help"], ["serve", "--help"], ["gh-init", "--help"]]
+)
+def test_cheap_commands_do_not_import_heavy_dependencies(args):
+    """``list`` and ``--help`` must not import cookiecutter, Jinja2 or PyGithub."""
+    assert _modules_loaded_by(args) == []
+
+
+def test_lazy_attributes_resolve_on_access():
+    """Lazily imported names are still reachable as ``repo_scaffold.cli`` attributes."""
+    from repo_scaffold import cli as cli_module
+
+    assert callable(cli_module.RenderEngine)
+    assert callable(cli_module.init_repository)
+
+    with pytest.raises(AttributeError):
+        _ = cli_module.does_not_exist
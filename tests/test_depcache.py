@@ -0,0 +1,108 @@
+"""Shared dependency cache tests."""
+
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+from click.testing import CliRunner
+
+from repo_scaffold.cli import cli
+from repo_scaffold.depcache import dep_cache_env
+from repo_scaffold.depcache import dep_cache_environment
+from repo_scaffold.depcache import prewarm
+
+
+def test_dep_cache_env_points_tools_at_cache_dir(monkeypatch, tmp_path):
+    """uv, pnpm and cargo all resolve their caches under the shared directory."""
+    monkeypatch.setattr("repo_scaffold.depcache.shutil.which", lambda name: None)
+
+    env = dep_cache_env(tmp_path)
+
+    assert env == {
+        "UV_CACHE_DIR": str(tmp_path / "uv"),
+        "UV_LINK_MODE": "hardlink",
+        "npm_config_store_dir": str(tmp_path / "pnpm-store"),
+        "CARGO_TARGET_DIR": str(tmp_path / "cargo-target"),
+    }
+
+
+def test_dep_cache_env_enables_sccache_when_available(monkeypatch, tmp_path):
+    """The rustc wrapper is sccache only if it is installed and no wrapper is set."""
+    monkeypatch.setattr("repo_scaffold.depcache.shutil.which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.delenv("RUSTC_WRAPPER", raising=False)
+
+    assert dep_cache_env(tmp_path)["RUSTC_WRAPPER"] == "sccache"
+
+    monkeypatch.setenv("RUSTC_WRAPPER", "custom-wrapper")
+    assert "RUSTC_WRAPPER" not in dep_cache_env(tmp_path)
+
+
+def test_dep_cache_environment_restores_previous_values(monkeypatch, tmp_path):
+    """Variables are set inside the block and restored (or removed) afterwards."""
+    monkeypatch.setenv("UV_CACHE_DIR", "/original/uv")
+    monkeypatch.delenv("CARGO_TARGET_DIR", raising=False)
+
+    with dep_cache_environment(tmp_path / "deps"):
+        assert os.environ["UV_CACHE_DIR"] == str(tmp_path / "deps" / "uv")
+        assert os.environ["CARGO_TARGET_DIR"] == str(tmp_path / "deps" / "cargo-target")
+
+    assert (tmp_path / "deps").is_dir()
+    assert os.environ["UV_CACHE_DIR"] == "/original/uv"
+    assert "CARGO_TARGET_DIR" not in os.environ
+
+
+def test_dep_cache_environment_none_is_a_no_op(monkeypatch):
+    """Without a cache directory the environment is left alone."""
+    monkeypatch.delenv("UV_CACHE_DIR", raising=False)
+
+    with dep_cache_environment(None) as env:
+        assert env == {}
+        assert "UV_CACHE_DIR" not in os.environ
+
+
+def test_prewarm_installs_defaults_into_a_throwaway_dir(tmp_path):
+    """Prewarm runs the install against the cache and discards the project."""
+    seen = {}
+
+    def generate(template, *, output_dir, extra_context, no_input):
+        seen.update(template=template, output_dir=output_dir, extra_context=extra_context, no_input=no_input)
+        seen["uv_cache"] = os.environ["UV_CACHE_DIR"]
+        (output_dir / "project").mkdir()
+
+    engine = Mock()
+    engine.generate.side_effect = generate
+
+    prewarm("template-python", tmp_path / "deps", engine=engine)
+
+    assert seen["template"] == "template-python"
+    assert seen["extra_context"] == {"install_after_generate": "yes", "init_git": "no"}
+    assert seen["no_input"] is True
+    assert seen["uv_cache"] == str(tmp_path / "deps" / "uv")
+    assert not Path(seen["output_dir"]).exists()
+
+
+def test_cli_create_applies_dep_cache_during_generation(monkeypatch, tmp_path):
+    """``create --dep-cache`` exposes the cache to the hooks while generating."""
+    seen = []
+    engine = Mock()
+    engine.return_value.generate.side_effect = lambda template, **kwargs: seen.append(os.environ.get("UV_CACHE_DIR"))
+    monkeypatch.setattr("repo_scaffold.cli.RenderEngine", engine)
+    monkeypatch.delenv("UV_CACHE_DIR", raising=False)
+
+    result = CliRunner().invoke(
+        cli, ["create", "python", "--no-input", "-o", str(tmp_path), "--dep-cache", str(tmp_path / "deps")]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert seen == [str(tmp_path / "deps" / "uv")]
+    assert "UV_CACHE_DIR" not in os.environ
+
+
+def test_cli_prewarm_requires_a_cache_dir(monkeypatch):
+    """``prewarm`` refuses to run without ``--dep-cache`` or the environment variable."""
+    monkeypatch.delenv("REPO_SCAFFOLD_DEP_CACHE", raising=False)
+
+    result = CliRunner().invoke(cli, ["prewarm", "python"])
+
+    assert result.exit_code != 0
+    assert "--dep-cache" in result.output
@@ -0,0 +1,91 @@
+"""Fleet drift scanner tests."""
+
+import json
+import os
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from repo_scaffold.cli import cli
+from repo_scaffold.render import RenderEngine
+from repo_scaffold.render import scan_drift
+from repo_scaffold.render.drift import find_projects
+
+
+def _age(project_dir):
+    """Backdate every file so the stat cache may trust it (files younger than 2s are re-hashed)."""
+    past = time.time() - 60
+    for root, _, files in os.walk(project_dir):
+        for name in files:
+            os.utime(os.path.join(root, name), (past, past))
+
+
+@pytest.fixture
+def fleet(monkeypatch, tmp_path):
+    """Two python projects with identical answers and one with different answers."""
+    monkeypatch.setenv("REPO_SCAFFOLD_CACHE_DIR", str(tmp_path / "cache"))
+    engine = RenderEngine()
+    projects = [
+        engine.generate("python", output_dir=tmp_path / "fleet" / "a", accept_hooks=False),
+        engine.generate("python", output_dir=tmp_path / "fleet" / "b", accept_hooks=False),
+        engine.generate(
+            "python", output_dir=tmp_path / "fleet" / "c", extra_context={"include_cli": "no"}, accept_hooks=False
+        ),
+    ]
+    for project in projects:
+        _age(project)
+    return projects
+
+
+def test_drift_renders_once_per_answer_set_and_reports_changes(fleet, tmp_path):
+    """Identical answers share one render; edited and deleted files are reported per project."""
+    clean, edited, other = fleet
+    (edited / "justfile").write_text("# mine\n")
+    (edited / "mkdocs.yml").unlink()
+
+    report = scan_drift([tmp_path / "fleet"], jobs=2)
+    by_path = {project.path: project for project in report.projects}
+
+    assert report.renders == 2
+    assert by_path[clean].status == "clean"
+    assert by_path[other].status == "clean"
+    assert by_path[edited].status == "drifted"
+    assert by_path[edited].modified == ["justfile"]
+    assert by_path[edited].missing == ["mkdocs.yml"]
+    assert report.to_dict()["summary"] == {"projects": 3, "clean": 2, "drifted": 1, "error": 0}
+
+
+def test_drift_rescan_skips_unchanged_files_by_stat(fleet, tmp_path):
+    """A second scan trusts cached hashes for files whose size and mtime did not change."""
+    first = scan_drift([tmp_path / "fleet"])
+    second = scan_drift([tmp_path / "fleet"])
+
+    assert sum(project.hashed for project in first.projects) > 0
+    assert sum(project.hashed for project in second.projects) == 0
+    assert all(project.status == "clean" for project in second.projects)
+
+
+def test_find_projects_reads_lists_and_prunes(fleet, tmp_path):
+    """List files name targets relative to themselves; dependency directories are not searched."""
+    vendored = tmp_path / "fleet" / "node_modules" / "some-package"
+    vendored.mkdir(parents=True)
+    (vendored / ".repo-scaffold.json").write_text("{}")
+    listing = tmp_path / "fleet.txt"
+    listing.write_text(f"# services\n{fleet[0].relative_to(tmp_path)}\n\n{fleet[2]}\n")
+
+    assert find_projects([listing]) == [fleet[0], fleet[2]]
+    assert len(find_projects([tmp_path / "fleet"])) == 3
+
+
+def test_cli_drift_writes_json_report(fleet, tmp_path):
+    """The CLI emits the JSON report and exits non-zero on drift or errors."""
+    (fleet[1] / ".repo-scaffold.json").write_text("not json")
+    report_path = tmp_path / "drift.json"
+
+    result = CliRunner().invoke(cli, ["drift", str(tmp_path / "fleet"), "-o", str(report_path)])
+    report = json.loads(report_path.read_text())
+
+    assert result.exit_code == 1
+    assert report["summary"] == {"projects": 3, "clean": 2, "drifted": 0, "error": 1}
+    assert next(project for project in report["projects"] if project["status"] == "error")["path"] == str(fleet[1])
@@ -2,24 +2,46 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import json
 import subprocess
+import sys
+import time
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock
 
+import click
+import httpx
 import pytest
 from click.testing import CliRunner
 from github import GithubException
+from nacl.public import PrivateKey
+from nacl.public import SealedBox
 
 from repo_scaffold import github_init
 from repo_scaffold.cli import cli
+from repo_scaffold.github_init import BRANCH_PROTECTION
+from repo_scaffold.github_init import DOCS_BUILD_COMMAND
+from repo_scaffold.github_init import ConcurrentGhInitClient
+from repo_scaffold.github_init import DocsBuild
 from repo_scaffold.github_init import GhInitClient
 from repo_scaffold.github_init import GhInitConfig
+from repo_scaffold.github_init import RateLimitTransport
 from repo_scaffold.github_init import build_config
+from repo_scaffold.github_init import format_batch_results
 from repo_scaffold.github_init import git_push
 from repo_scaffold.github_init import init_repository
+from repo_scaffold.github_init import load_targets
 from repo_scaffold.github_init import parse_dotenv
+from repo_scaffold.github_init import publish_docs
+from repo_scaffold.github_init import run_gh_init_batch
+from repo_scaffold.github_init import start_docs_build
+from repo_scaffold.github_init import track_requests
+from repo_scaffold.github_init.async_client import RepoRef
+from repo_scaffold.trace import tracing
+from tests.fake_github import FakeGitHub
 
 
 def _write_pyproject(path: Path, *, name: str, description: str = "") -> None:
@@ -215,7 +237,7 @@ def test_init_repository_calls_client_in_order(tmp_path):
 
     client.authenticated_login.assert_called_once_with()
     client.get_or_create_repo.assert_called_once_with(
-        None, "demo", description="demo project", private=False, allow_existing=False
+        None, "demo", description="demo project", private=False, allow_existing=False, homepage=None
     )
     # Both secrets are set, in iteration order of the dict.
     assert client.set_secret.call_args_list == [
@@ -304,23 +326,51 @@ def test_get_or_create_repo_reraises_without_allow_existing(tmp_path):
         client.get_or_create_repo(None, "demo", description="", private=False, allow_existing=False)
 
 
+def test_set_variable_lists_existing_variables_once():
+    """Existing variables are listed once, then each one is a single create or edit request."""
+    client = GhInitClient("t")
+    repo = MagicMock()
+    repo.url = "https://api.github.com/repos/me/demo"
+    existing = MagicMock()
+    existing.name = "PUBLISH_TO_PUBLIC_PYPI"
+    repo.get_variables.return_value = [existing]
+
+    client.set_variable(repo, "PUBLISH_TO_PUBLIC_PYPI", "true")
+    client.set_variable(repo, "NEW_VARIABLE", "1")
+
+    repo.get_variables.assert_called_once_with()
+    repo.create_variable.assert_called_once_with("NEW_VARIABLE", "1")
+    repo.get_variable.assert_not_called()
+    repo.requester.requestJsonAndCheck.assert_called_once_with(
+        "PATCH",
+        "https://api.github.com/repos/me/demo/actions/variables/PUBLISH_TO_PUBLIC_PYPI",
+        input={"name": "PUBLISH_TO_PUBLIC_PYPI", "value": "true"},
+    )
+
+
 def test_set_variable_falls_back_to_edit_on_conflict():
-    """A 422/409 from create_variable triggers an edit on the existing variable."""
-    client = GhInitClient.__new__(GhInitClient)
+    """A 422/409 from create_variable (created since the listing) edits the variable instead."""
+    client = GhInitClient("t")
     repo = MagicMock()
+    repo.url = "https://api.github.com/repos/me/demo"
+    repo.get_variables.return_value = []
     repo.create_variable.side_effect = GithubException(status=422, data={"message": "exists"})
 
     client.set_variable(repo, "PUBLISH_TO_PUBLIC_PYPI", "true")
 
     repo.create_variable.assert_called_once_with("PUBLISH_TO_PUBLIC_PYPI", "true")
-    repo.get_variable.assert_called_once_with("PUBLISH_TO_PUBLIC_PYPI")
-    repo.get_variable.return_value.edit.assert_called_once_with(value="true")
+    repo.requester.requestJsonAndCheck.assert_called_once_with(
+        "PATCH",
+        "https://api.github.com/repos/me/demo/actions/variables/PUBLISH_TO_PUBLIC_PYPI",
+        input={"name": "PUBLISH_TO_PUBLIC_PYPI", "value": "true"},
+    )
 
 
 def test_set_variable_reraises_on_other_errors():
     """Any non-conflict GitHub error propagates instead of being swallowed."""
-    client = GhInitClient.__new__(GhInitClient)
+    client = GhInitClient("t")
     repo = MagicMock()
+    repo.get_variables.return_value = []
     repo.create_variable.side_effect = GithubException(status=500, data={"message": "boom"})
 
     with pytest.raises(GithubException):
@@ -402,35 +452,35 @@ def test_deploy_docs_omits_env_without_token(tmp_path, monkeypatch):
     assert captured["env"] is None
 
 
-def test_enable_pages_creates_site():
-    """enable_pages POSTs the source config to the Pages endpoint."""
-    client = GhInitClient.__new__(GhInitClient)
+def test_enable_pages_updates_existing_repo_site():
+    """On a repo the client did not create, enable_pages PUTs the source config to the Pages endpoint."""
+    client = GhInitClient("t")
     repo = MagicMock()
     repo.url = "https://api.github.com/repos/me/demo"
 
     client.enable_pages(repo, "gh-pages")
 
     repo.requester.requestJsonAndCheck.assert_called_once_with(
-        "POST",
+        "PUT",
         "https://api.github.com/repos/me/demo/pages",
         input={"source": {"branch": "gh-pages", "path": "/"}},
     )
 
 
-def test_enable_pages_updates_on_conflict():
-    """When a Pages site already exists, enable_pages falls back to a PUT update."""
-    client = GhInitClient.__new__(GhInitClient)
+def test_enable_pages_creates_site_when_missing():
+    """When the repo has no Pages site yet, enable_pages falls back to creating it with POST."""
+    client = GhInitClient("t")
     repo = MagicMock()
     repo.url = "https://api.github.com/repos/me/demo"
     repo.requester.requestJsonAndCheck.side_effect = [
-        GithubException(status=409, data={"message": "exists"}),
+        GithubException(status=404, data={"message": "Not Found"}),
         (None, None),
     ]
 
     client.enable_pages(repo, "gh-pages")
 
     assert repo.requester.requestJsonAndCheck.call_count == 2
-    assert repo.requester.requestJsonAndCheck.call_args_list[1][0][0] == "PUT"
+    assert repo.requester.requestJsonAndCheck.call_args_list[1][0][0] == "POST"
 
 
 def test_init_repository_configures_pages_after_push(tmp_path, monkeypatch):
@@ -529,21 +579,20 @@ def test_init_repository_records_pages_error_without_aborting(tmp_path, monkeypa
     client.enable_pages.assert_not_called()
 
 
-def test_protect_branch_calls_edit_protection():
-    """protect_branch applies release-compatible rules (enforce_admins off)."""
+def test_protect_branch_puts_protection_rules():
+    """protect_branch applies release-compatible rules (enforce_admins off) without fetching the branch."""
     client = GhInitClient.__new__(GhInitClient)
     repo = MagicMock()
-    branch = repo.get_branch.return_value
+    repo.url = "https://api.github.com/repos/me/demo"
 
     client.protect_branch(repo, "master")
 
-    repo.get_branch.assert_called_once_with("master")
-    branch.edit_protection.assert_called_once_with(
-        required_approving_review_count=1,
-        enforce_admins=False,
-        allow_force_pushes=False,
-        allow_deletions=False,
+    repo.get_branch.assert_not_called()
+    repo.requester.requestJsonAndCheck.assert_called_once_with(
+        "PUT", "https://api.github.com/repos/me/demo/branches/master/protection", input=BRANCH_PROTECTION
     )
+    assert BRANCH_PROTECTION["enforce_admins"] is False
+    assert BRANCH_PROTECTION["required_pull_request_reviews"] == {"required_approving_review_count": 1}
 
 
 def test_init_repository_protects_branch_when_enabled(tmp_path, monkeypatch):
@@ -607,6 +656,632 @@ def test_init_repository_records_protection_error_without_aborting(tmp_path, mon
     assert "Upgrade" in result.protection_error
 
 
+class _FakeGitHubApi:
+    """Minimal REST API behind ``httpx.MockTransport``: records calls and in-flight requests."""
+
+    def __init__(self, *, existing_variables: tuple[str, ...] = (), taken: tuple[str, ...] = ()):
+        self.calls: list[tuple[str, str]] = []
+        self.bodies: dict[tuple[str, str], Any] = {}
+        self.existing_variables = set(existing_variables)
+        self.taken = set(taken)
+        self.private_key = PrivateKey.generate()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        method, path = request.method, request.url.path
+        self.calls.append((method, path))
+        self.bodies[(method, path)] = json.loads(request.content) if request.content else None
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        if path == "/user":
+            return httpx.Response(200, json={"login": "me"})
+        if path == "/user/repos":
+            name = json.loads(request.content)["name"]
+            if name in self.taken:
+                return httpx.Response(422, json={"message": "name already exists on this account"})
+            return httpx.Response(201, json=_repo_json(name))
+        if path.endswith("/actions/secrets/public-key"):
+            key = base64.b64encode(bytes(self.private_key.public_key)).decode()
+            return httpx.Response(200, json={"key_id": "kid", "key": key})
+        if method == "GET" and path.endswith("/actions/variables"):
+            variables = [{"name": name, "value": ""} for name in sorted(self.existing_variables)]
+            return httpx.Response(200, json={"total_count": len(variables), "variables": variables})
+        if method == "POST" and path.endswith("/actions/variables"):
+            name = json.loads(request.content)["name"]
+            if name in self.existing_variables:
+                return httpx.Response(409, json={"message": "Already exists"})
+            return httpx.Response(201, json={})
+        return httpx.Response(204)
+
+    def count(self, method: str, suffix: str) -> int:
+        return sum(1 for call in self.calls if call[0] == method and call[1].endswith(suffix))
+
+
+def _repo_json(name: str = "demo") -> dict[str, Any]:
+    return {
+        "full_name": f"me/{name}",
+        "name": name,
+        "owner": {"login": "me"},
+        "url": f"https://api.github.com/repos/me/{name}",
+        "html_url": f"https://github.com/me/{name}",
+        "clone_url": f"https://github.com/me/{name}.git",
+    }
+
+
+def test_concurrent_client_fetches_public_key_once_and_bounds_writes():
+    """All secrets share one public-key fetch; writes overlap but never exceed the concurrency."""
+    api = _FakeGitHubApi()
+    secrets = {f"SECRET_{i}": f"value-{i}" for i in range(6)}
+    with ConcurrentGhInitClient("t", concurrency=3, transport=httpx.MockTransport(api)) as client:
+        repo = client.get_or_create_repo(None, "demo", description="", private=False, allow_existing=False)
+        client.set_actions_settings(repo, secrets, {"PUBLISH_TO_PUBLIC_PYPI": "true"})
+
+    assert api.count("GET", "/actions/secrets/public-key") == 1
+    assert api.count("PUT", "/actions/secrets/SECRET_0") == 1
+    assert len([call for call in api.calls if "/actions/secrets/SECRET_" in call[1]]) == 6
+    body = api.bodies[("PUT", "/repos/me/demo/actions/secrets/SECRET_5")]
+    assert body["key_id"] == "kid"
+    assert SealedBox(api.private_key).decrypt(base64.b64decode(body["encrypted_value"])) == b"value-5"
+    assert api.count("POST", "/actions/variables") == 1
+    assert 1 < api.max_in_flight <= 3
+
+
+def test_concurrent_client_updates_existing_variable():
+    """An existing variable (from one listing per repo) is updated in place with a single PATCH."""
+    api = _FakeGitHubApi(existing_variables=("PUBLISH_TO_PUBLIC_PYPI",))
+    with ConcurrentGhInitClient("t", transport=httpx.MockTransport(api)) as client:
+        repo = RepoRef.from_json(_repo_json())
+        client.set_actions_settings(repo, {}, {"PUBLISH_TO_PUBLIC_PYPI": "false", "OTHER": "1"})
+
+    assert api.count("GET", "/actions/variables") == 1
+    assert api.count("POST", "/actions/variables") == 1
+    patch = ("PATCH", "/repos/me/demo/actions/variables/PUBLISH_TO_PUBLIC_PYPI")
+    assert api.calls.count(patch) == 1
+    assert api.bodies[patch] == {"name": "PUBLISH_TO_PUBLIC_PYPI", "value": "false"}
+
+
+def test_concurrent_client_raises_github_exception():
+    """Error responses surface as GithubException, as PyGithub's do."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(403, json={"message": "Upgrade to GitHub Pro"})
+
+    client = ConcurrentGhInitClient("t", transport=httpx.MockTransport(handler))
+    with client, pytest.raises(GithubException) as excinfo:
+        client.protect_branch(RepoRef.from_json(_repo_json()), "master")
+
+    assert excinfo.value.status == 403
+
+
+def test_init_repository_with_concurrent_client(tmp_path):
+    """The concurrent client drops into init_repository in place of GhInitClient."""
+    api = _FakeGitHubApi()
+    config = _make_config(tmp_path)
+
+    with ConcurrentGhInitClient("t", transport=httpx.MockTransport(api)) as client:
+        result = init_repository(config, client)
+
+    assert result.html_url == "https://github.com/me/demo"
+    assert result.pages_url == "https://me.github.io/demo"
+    assert api.count("GET", "/user") == 1
+    assert api.count("GET", "/actions/secrets/public-key") == 1
+    assert api.count("PUT", "/actions/secrets/PYPI_TOKEN") == 1
+    assert api.count("PUT", "/actions/secrets/PERSONAL_ACCESS_TOKEN") == 1
+    assert api.count("POST", "/actions/variables") == 1
+    assert result.requests == len(api.calls)
+    assert result.retries == 0
+
+
+class _VirtualClock:
+    """Clock and sleep for the scheduler that advance time instantly."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _scheduled(responses: list[httpx.Response], **kwargs: Any) -> tuple[RateLimitTransport, list[str], _VirtualClock]:
+    clock = _VirtualClock()
+    sent: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(f"{request.method} {request.url.path}")
+        return responses.pop(0)
+
+    transport = RateLimitTransport(
+        httpx.MockTransport(handler), clock=clock, wall_clock=clock, sleep=clock.sleep, **kwargs
+    )
+    return transport, sent, clock
+
+
+def _send(transport: RateLimitTransport, *requests: tuple[str, str]) -> list[int]:
+    async def send() -> list[int]:
+        async with httpx.AsyncClient(transport=transport, base_url="https://api.github.com") as http:
+            return [(await http.request(method, path)).status_code for method, path in requests]
+
+    return asyncio.run(send())
+
+
+def test_scheduler_waits_out_retry_after_and_retries():
+    """A secondary-rate-limit 403 is retried after Retry-After, and the wait is counted."""
+    limited = httpx.Response(403, headers={"Retry-After": "30"}, json={"message": "secondary rate limit"})
+    transport, sent, _ = _scheduled([limited, httpx.Response(201)])
+
+    with track_requests() as stats:
+        statuses = _send(transport, ("POST", "/user/repos"))
+
+    assert statuses == [201]
+    assert sent == ["POST /user/repos", "POST /user/repos"]
+    assert (stats.requests, stats.retries) == (2, 1)
+    assert stats.wait_seconds == pytest.approx(30)
+    assert transport.stats == stats
+
+
+def test_scheduler_retries_server_errors_only_for_idempotent_methods():
+    """A 502 is retried with backoff for a PUT but handed back for a POST."""
+    transport, sent, _ = _scheduled([httpx.Response(502), httpx.Response(204), httpx.Response(502)], backoff=0.5)
+
+    statuses = _send(transport, ("PUT", "/repos/me/demo/pages"), ("POST", "/repos/me/demo/actions/variables"))
+
+    assert statuses == [204, 502]
+    assert sent == ["PUT /repos/me/demo/pages", "PUT /repos/me/demo/pages", "POST /repos/me/demo/actions/variables"]
+    assert transport.stats.retries == 1
+    assert transport.stats.wait_seconds <= 0.5
+
+
+def test_scheduler_paces_with_token_bucket_and_exhausted_quota():
+    """Requests beyond the burst wait for tokens; an exhausted quota pauses until its reset."""
+    exhausted = httpx.Response(200, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1010"})
+    transport, _, clock = _scheduled([httpx.Response(200), exhausted, httpx.Response(200)], rate=2.0, burst=1)
+
+    _send(transport, ("GET", "/user"), ("GET", "/user"), ("GET", "/user"))
+
+    # The second request waits 0.5s for a token; the third waits for the reset at t=1010.
+    assert clock.now == pytest.approx(1010)
+    assert transport.stats.requests == 3
+    assert transport.stats.retries == 0
+
+
+def test_load_targets_merges_manifest_defaults_flags_and_entries(tmp_path):
+    """Flags override manifest defaults, entries override flags; paths resolve and repeat only once."""
+    for name in ("billing", "gateway"):
+        (tmp_path / "services" / name).mkdir(parents=True)
+    manifest = tmp_path / "fleet.toml"
+    manifest.write_text(
+        '[defaults]\nowner = "org"\nprivate = true\n\n'
+        '[[projects]]\npath = "services/billing"\n\n'
+        '[[projects]]\npath = "services/gateway"\nname = "edge"\nprotect_branch = false\n',
+        encoding="utf-8",
+    )
+
+    entries = load_targets([manifest, tmp_path / "services" / "billing"], {"protect_branch": True, "private": False})
+
+    assert [entry.project_path for entry in entries] == [
+        (tmp_path / "services" / "billing").resolve(),
+        (tmp_path / "services" / "gateway").resolve(),
+    ]
+    assert entries[0].options == {"owner": "org", "private": False, "protect_branch": True}
+    assert entries[1].options == {"owner": "org", "private": False, "protect_branch": False, "name": "edge"}
+
+
+def test_load_targets_rejects_unknown_manifest_options(tmp_path):
+    """A typo in a manifest fails up front instead of being ignored."""
+    (tmp_path / "svc").mkdir()
+    manifest = tmp_path / "fleet.json"
+    manifest.write_text(json.dumps({"projects": [{"path": "svc", "privat": True}]}), encoding="utf-8")
+
+    with pytest.raises(click.ClickException, match="privat"):
+        load_targets([manifest])
+
+
+@pytest.mark.parametrize("project", ["svc", ["svc"], 3])
+def test_load_targets_rejects_manifest_entries_that_are_not_tables(tmp_path, project):
+    """A bare string or list where a project table belongs is a manifest error, not a traceback."""
+    (tmp_path / "svc").mkdir()
+    manifest = tmp_path / "fleet.json"
+    manifest.write_text(json.dumps({"projects": [project]}), encoding="utf-8")
+
+    with pytest.raises(click.ClickException, match=r"project #1 must be a table with a 'path'"):
+        load_targets([manifest])
+
+
+def test_run_gh_init_batch_shares_one_client(tmp_path):
+    """One login serves every project; a failing project is reported without stopping the others."""
+    api = _FakeGitHubApi(taken=("beta",))
+    configs = [_make_config(tmp_path / name, name=name) for name in ("alpha", "beta", "gamma")]
+
+    with ConcurrentGhInitClient("t", transport=httpx.MockTransport(api)) as client:
+        results = run_gh_init_batch(configs, client, jobs=3)
+
+    assert [result.config.name for result in results] == ["alpha", "beta", "gamma"]
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[1].error == "name already exists on this account"
+    assert results[2].result.html_url == "https://github.com/me/gamma"
+    # Counted per project, not per client: 5 requests each, plus the shared login for whichever fetched it.
+    assert sorted(r.result.requests for r in results if r.ok) in ([5, 5], [5, 6])
+    assert api.count("GET", "/user") == 1
+    assert api.count("GET", "/actions/secrets/public-key") == 2
+    lines = format_batch_results(results, wall_seconds=1.0)
+    assert lines[0].split() == ["Project", "Repository", "Pushed", "Pages", "Protected", "Requests", "Time", "Status"]
+    assert "FAILED: name already exists" in lines[2]
+    assert lines[-1].startswith("3 projects, 1 failed")
+
+
+def test_cli_gh_init_batch_prints_summary_table(tmp_path, monkeypatch):
+    """gh-init-batch bootstraps every target through one client and exits non-zero on failures."""
+    for name in ("alpha", "beta"):
+        (tmp_path / name).mkdir()
+        _write_pyproject(tmp_path / name / "pyproject.toml", name=name)
+    monkeypatch.setenv("GITHUB_TOKEN", "stub")
+    api = _FakeGitHubApi(taken=("beta",))
+    clients = []
+
+    def make_client(token, **kwargs):
+        clients.append(kwargs)
+        return ConcurrentGhInitClient(token, **kwargs, transport=httpx.MockTransport(api))
+
+    monkeypatch.setattr("repo_scaffold.cli.ConcurrentGhInitClient", make_client)
+
+    result = CliRunner().invoke(
+        cli,
+        ["gh-init-batch", str(tmp_path / "alpha"), str(tmp_path / "beta"), "--no-push", "--no-input", "-j", "2"],
+    )
+
+    assert result.exit_code == 1
+    assert clients == [{"concurrency": 8, "rate": 10.0}]
+    assert "https://github.com/me/alpha" in result.output
+    assert "2 projects, 1 failed" in result.output
+    assert "1 of 2 projects failed" in result.output
+
+
+@pytest.fixture
+def fake_github(tmp_path):
+    """A local fake GitHub API whose repositories are bare git remotes."""
+    with FakeGitHub(tmp_path / "remotes") as server:
+        yield server
+
+
+def _fake_client(fake_github: FakeGitHub) -> GhInitClient:
+    return GhInitClient("t", base_url=fake_github.url, seconds_between_requests=None, seconds_between_writes=None)
+
+
+def _project(tmp_path: Path) -> Path:
+    project = tmp_path / "demo"
+    project.mkdir()
+    (project / "README.md").write_text("# demo\n")
+    return project
+
+
+def _with_docs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    project = _project(tmp_path)
+    (project / "mkdocs.yml").write_text("site_name: demo\n")
+    monkeypatch.setattr(github_init, "deploy_docs", MagicMock())
+    return project
+
+
+def test_init_repository_end_to_end_against_fake_github(tmp_path, fake_github):
+    """The real PyGithub path creates the repo, writes settings, pushes and protects the branch."""
+    config = _make_config(_project(tmp_path), push=True, protect_branch=True)
+
+    result = init_repository(config, _fake_client(fake_github))
+
+    repo = fake_github.repos["me/demo"]
+    assert result.pushed and result.branch_protected
+    assert result.html_url == "https://github.com/me/demo"
+    assert fake_github.branches("me/demo") == ["master"]
+    assert repo.secrets == {"PYPI_TOKEN": "token-value", "PERSONAL_ACCESS_TOKEN": "pat-value"}
+    assert repo.variables == {"PUBLISH_TO_PUBLIC_PYPI": "true"}
+    assert repo.protection["master"]["required_pull_request_reviews"]["required_approving_review_count"] == 1
+    assert fake_github.calls == {
+        "GET /user": 1,
+        "POST /user/repos": 1,
+        "GET /repos/{owner}/{repo}/actions/secrets/public-key": 1,
+        "PUT /repos/{owner}/{repo}/actions/secrets/{name}": 2,
+        "POST /repos/{owner}/{repo}/actions/variables": 1,
+        "PUT /repos/{owner}/{repo}/branches/{branch}/protection": 1,
+    }
+
+
+def test_init_repository_rerun_against_fake_github_updates_in_place(tmp_path, fake_github):
+    """With allow_existing, an existing repo is looked up and its variables are edited."""
+    fake_github.add_repo("me", "demo", variables={"PUBLISH_TO_PUBLIC_PYPI": "false"})
+    config = _make_config(_project(tmp_path), allow_existing=True)
+
+    init_repository(config, _fake_client(fake_github))
+
+    assert fake_github.repos["me/demo"].variables == {"PUBLISH_TO_PUBLIC_PYPI": "true"}
+    assert fake_github.calls["GET /repos/{owner}/{repo}"] == 1
+    assert fake_github.calls["PATCH /repos/{owner}/{repo}/actions/variables/{name}"] == 1
+
+
+def test_init_repository_configures_pages_against_fake_github(tmp_path, fake_github, monkeypatch):
+    """Pages is enabled on gh-pages and the homepage points at the docs URL."""
+    config = _make_config(_with_docs(tmp_path, monkeypatch), push=True, setup_pages=True)
+
+    result = init_repository(config, _fake_client(fake_github))
+
+    repo = fake_github.repos["me/demo"]
+    assert result.pages_configured and result.homepage_set
+    assert repo.pages == {"branch": "gh-pages", "path": "/"}
+    assert repo.homepage == "https://me.github.io/demo"
+
+
+@pytest.mark.parametrize("concurrent", [False, True], ids=["pygithub", "httpx"])
+def test_init_repository_request_count_stays_within_budget(tmp_path, fake_github, monkeypatch, concurrent):
+    """A full bootstrap is login, create, public key, then one request per write, and reports the count."""
+    config = _make_config(_with_docs(tmp_path, monkeypatch), push=True, setup_pages=True, protect_branch=True)
+    client = ConcurrentGhInitClient("t", base_url=fake_github.url) if concurrent else _fake_client(fake_github)
+
+    result = init_repository(config, client)
+    if concurrent:
+        client.close()
+
+    # login + create + public key, one per secret and variable, Pages, protection
+    budget = 3 + len(config.secrets) + len(config.variables) + 2
+    assert result.requests == fake_github.total_calls <= budget
+    assert result.homepage_set
+    assert "PATCH /repos/{owner}/{repo}" not in fake_github.calls  # the homepage went with the create
+
+
+@pytest.mark.parametrize("concurrent", [False, True], ids=["pygithub", "httpx"])
+def test_init_repository_protects_branch_with_slash(tmp_path, fake_github, concurrent):
+    """Branch names are quoted as one path segment, so ``release/1.0`` is protected by both clients."""
+    config = _make_config(_project(tmp_path), push=True, default_branch="release/1.0", protect_branch=True)
+    client = ConcurrentGhInitClient("t", base_url=fake_github.url) if concurrent else _fake_client(fake_github)
+
+    result = init_repository(config, client)
+    if concurrent:
+        client.close()
+
+    assert result.protection_error is None
+    assert fake_github.branches("me/demo") == ["release/1.0"]
+    assert set(fake_github.repos["me/demo"].protection) == {"release/1.0"}
+
+
+@pytest.mark.parametrize("concurrent", [False, True], ids=["pygithub", "httpx"])
+def test_init_repository_rerun_request_count_stays_within_budget(tmp_path, fake_github, monkeypatch, concurrent):
+    """Re-running on an existing repo adds only the lookup, one variable listing and the homepage edit."""
+    fake_github.add_repo("me", "demo", variables={"PUBLISH_TO_PUBLIC_PYPI": "false"}, pages={"branch": "gh-pages"})
+    config = _make_config(_with_docs(tmp_path, monkeypatch), push=True, allow_existing=True, protect_branch=True)
+    client = ConcurrentGhInitClient("t", base_url=fake_github.url) if concurrent else _fake_client(fake_github)
+
+    result = init_repository(config, client)
+    if concurrent:
+        client.close()
+
+    # login + rejected create + lookup + public key + variable listing, one per write, Pages, homepage, protection
+    budget = 5 + len(config.secrets) + len(config.variables) + 3
+    assert result.requests == fake_github.total_calls <= budget
+    assert fake_github.calls["PUT /repos/{owner}/{repo}/pages"] == 1
+    assert "POST /repos/{owner}/{repo}/pages" not in fake_github.calls
+    assert fake_github.repos["me/demo"].homepage == "https://me.github.io/demo"
+
+
+_BUILD_SITE = (
+    "import pathlib, sys, time; time.sleep(float(sys.argv[1])); "
+    "site = pathlib.Path('site'); site.mkdir(); (site / 'index.html').write_text('<h1>demo</h1>')"
+)
+
+
+def _show(remote: Path, spec: str) -> str:
+    return subprocess.run(
+        ["git", "--git-dir", str(remote), "show", spec], check=True, capture_output=True, text=True
+    ).stdout
+
+
+def test_start_docs_build_needs_recipe_and_ignored_site(tmp_path):
+    """Only projects with a docs-build recipe that git-ignore site/ are built ahead of the push."""
+    assert start_docs_build(tmp_path) is None
+    (tmp_path / "justfile").write_text("docs-build:\n    uv run mkdocs build\n")
+    assert start_docs_build(tmp_path) is None
+    (tmp_path / ".gitignore").write_text("/site/\n")
+
+    build = start_docs_build(tmp_path)
+
+    assert isinstance(build, DocsBuild)
+    assert build.command == list(DOCS_BUILD_COMMAND)
+    build.cancel()
+
+
+def test_docs_build_wait_raises_on_failure(tmp_path):
+    """A failed build surfaces its output tail as a RuntimeError."""
+    build = DocsBuild(tmp_path, [sys.executable, "-c", "import sys; print('theme missing'); sys.exit(3)"]).start()
+
+    with pytest.raises(RuntimeError, match="theme missing"):
+        build.wait()
+    assert build.seconds is not None
+
+
+def test_docs_build_cancel_stops_the_build(tmp_path):
+    """Cancelling terminates a running build; waiting on it then fails."""
+    build = DocsBuild(tmp_path, [sys.executable, "-c", "import time; time.sleep(30)"]).start()
+    time.sleep(0.1)
+
+    start = time.monotonic()
+    build.cancel()
+
+    assert time.monotonic() - start < 5
+    with pytest.raises(RuntimeError, match="cancelled"):
+        build.wait()
+
+
+def test_publish_docs_pushes_site_without_touching_the_project(tmp_path):
+    """The built site becomes the whole gh-pages branch; the project's index and branch stay as they were."""
+    remote = tmp_path / "remote.git"
+    subprocess.run(["git", "init", "--bare", "-q", str(remote)], check=True)
+    project = _project(tmp_path)
+    (project / ".gitignore").write_text("/site/\n")
+    git_push(project, str(remote), "master", force=False)
+    (project / "site").mkdir()
+    (project / "site" / "index.html").write_text("<h1>demo</h1>")
+
+    publish_docs(project, project / "site")
+
+    listing = subprocess.run(
+        ["git", "--git-dir", str(remote), "ls-tree", "--name-only", "gh-pages"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    assert listing == [".nojekyll", "index.html"]
+    assert _show(remote, "gh-pages:index.html") == "<h1>demo</h1>"
+    status = subprocess.run(["git", "-C", str(project), "status", "--porcelain"], capture_output=True, text=True)
+    assert status.stdout == ""
+    head = subprocess.run(["git", "-C", str(project), "branch", "--show-current"], capture_output=True, text=True)
+    assert head.stdout.strip() == "master"
+
+
+def test_init_repository_overlaps_docs_build_with_push(tmp_path, fake_github, monkeypatch):
+    """The docs build runs alongside repo setup and the push; only publishing waits for it."""
+    project = _project(tmp_path)
+    (project / "mkdocs.yml").write_text("site_name: demo\n")
+    (project / ".gitignore").write_text("/site/\n")
+    fake_github.latency = {"POST /user/repos": 0.3}
+    monkeypatch.setattr(
+        github_init,
+        "start_docs_build",
+        lambda path: DocsBuild(path, [sys.executable, "-c", _BUILD_SITE, "0.2"]).start(),
+    )
+    monkeypatch.setattr(github_init, "deploy_docs", MagicMock(side_effect=AssertionError("built ahead")))
+    config = _make_config(project, push=True, setup_pages=True)
+
+    with tracing(tmp_path / "trace.json") as tracer:
+        result = init_repository(config, _fake_client(fake_github))
+
+    assert result.pages_configured, result.pages_error
+    assert fake_github.repos["me/demo"].pages == {"branch": "gh-pages", "path": "/"}
+    assert _show(fake_github.remote("me/demo"), "gh-pages:index.html") == "<h1>demo</h1>"
+    spans = {event["name"]: event for event in tracer.events}
+    build, create = spans["docs build"], spans["create repo"]
+    assert build["ts"] < create["ts"] + create["dur"]  # started before the repo even existed
+    assert spans["docs build wait"]["dur"] < build["dur"]
+    assert spans["docs publish"]["ts"] >= spans["push"]["ts"] + spans["push"]["dur"]
+
+
+_UV_RUN_BUILD = (
+    "import pathlib; pathlib.Path('uv.lock').write_text('version = 1'); "
+    "pathlib.Path('.venv').mkdir(); pathlib.Path('.venv', 'pyvenv.cfg').write_text('home = /usr'); " + _BUILD_SITE
+)
+
+
+def _pushed_files(remote: Path) -> list[str]:
+    return subprocess.run(
+        ["git", "--git-dir", str(remote), "ls-tree", "-r", "--name-only", "master"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+
+
+def test_init_repository_pushes_the_same_tree_with_or_without_docs_build(tmp_path, fake_github, monkeypatch):
+    """What ``uv run`` writes while the docs build runs (uv.lock, .venv/) never reaches the initial commit."""
+    fake_github.latency = {"POST /user/repos": 0.3}
+    monkeypatch.setattr(
+        github_init,
+        "start_docs_build",
+        lambda path: DocsBuild(path, [sys.executable, "-c", _UV_RUN_BUILD, "0"]).start(),
+    )
+    monkeypatch.setattr(github_init, "deploy_docs", MagicMock(side_effect=AssertionError("built ahead")))
+    for name, setup_pages in (("built", True), ("plain", False)):
+        (tmp_path / name).mkdir()
+        project = _project(tmp_path / name)
+        (project / "mkdocs.yml").write_text("site_name: demo\n")
+        (project / ".gitignore").write_text("/site/\n")
+        result = init_repository(
+            _make_config(project, name=name, push=True, setup_pages=setup_pages), _fake_client(fake_github)
+        )
+        assert result.pushed
+
+    assert (tmp_path / "built" / "demo" / "uv.lock").is_file()  # the build did write them
+    assert _show(fake_github.remote("me/built"), "gh-pages:index.html") == "<h1>demo</h1>"
+    assert _pushed_files(fake_github.remote("me/built")) == _pushed_files(fake_github.remote("me/plain"))
+    assert _pushed_files(fake_github.remote("me/plain")) == [".gitignore", "README.md", "mkdocs.yml"]
+
+
+@pytest.mark.parametrize("concurrent", [False, True], ids=["pygithub", "httpx"])
+@pytest.mark.parametrize("existing", [False, True], ids=["created", "existing"])
+def test_init_repository_clears_homepage_when_pages_fail(tmp_path, fake_github, monkeypatch, concurrent, existing):
+    """A failed docs build undoes the Website set on creation; an existing repo's Website is left alone."""
+    pages_url = "https://me.github.io/demo"
+    if existing:
+        fake_github.add_repo("me", "demo", homepage=pages_url)
+    project = _project(tmp_path)
+    (project / "mkdocs.yml").write_text("site_name: demo\n")
+    (project / ".gitignore").write_text("/site/\n")
+    failing = [sys.executable, "-c", "import sys; print('theme missing'); sys.exit(1)"]
+    monkeypatch.setattr(github_init, "start_docs_build", lambda path: DocsBuild(path, failing).start())
+    config = _make_config(project, push=True, setup_pages=True, allow_existing=existing)
+    client = ConcurrentGhInitClient("t", base_url=fake_github.url) if concurrent else _fake_client(fake_github)
+
+    result = init_repository(config, client)
+    if concurrent:
+        client.close()
+
+    assert "theme missing" in result.pages_error
+    assert not result.pages_configured
+    assert not result.homepage_set
+    assert fake_github.repos["me/demo"].homepage == (pages_url if existing else "")
+
+
+def test_cli_gh_init_profile_prints_timeline(tmp_path, monkeypatch):
+    """``gh-init --profile`` prints the step timeline and writes the trace."""
+    _write_pyproject(tmp_path / "pyproject.toml", name="demo")
+    monkeypatch.setenv("GITHUB_TOKEN", "stub")
+    monkeypatch.setenv("REPO_SCAFFOLD_TRACE", str(tmp_path / "trace.json"))
+    api = _FakeGitHubApi()
+    monkeypatch.setattr(
+        "repo_scaffold.cli.ConcurrentGhInitClient",
+        lambda token, **kwargs: ConcurrentGhInitClient(token, **kwargs, transport=httpx.MockTransport(api)),
+    )
+
+    result = CliRunner().invoke(
+        cli, ["gh-init", str(tmp_path), "--no-input", "--no-push", "--concurrency", "2", "--profile"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Timings" in result.output
+    assert "create repo" in result.output
+    assert (tmp_path / "trace.json").is_file()
+
+
+def test_fake_github_injects_per_route_latency(tmp_path, fake_github):
+    """Latency is applied only to the routes it is configured for."""
+    fake_github.latency = {"GET /user": 0.2}
+    client = _fake_client(fake_github)
+
+    start = time.monotonic()
+    assert client.authenticated_login() == "me"
+    assert time.monotonic() - start >= 0.2
+
+    fake_github.add_repo("me", "demo")
+    start = time.monotonic()
+    client.get_or_create_repo(None, "demo", description="", private=False, allow_existing=True)
+    assert time.monotonic() - start < 0.2
+
+
+def test_concurrent_client_end_to_end_against_fake_github(tmp_path, fake_github):
+    """The httpx client reaches the same end state with one public-key fetch."""
+    config = _make_config(_project(tmp_path), push=True)
+
+    with ConcurrentGhInitClient("t", base_url=fake_github.url) as client:
+        result = init_repository(config, client)
+
+    assert fake_github.repos["me/demo"].secrets == {"PYPI_TOKEN": "token-value", "PERSONAL_ACCESS_TOKEN": "pat-value"}
+    assert fake_github.branches("me/demo") == ["master"]
+    assert fake_github.calls["GET /repos/{owner}/{repo}/actions/secrets/public-key"] == 1
+    assert result.requests == fake_github.total_calls
+
+
 def test_cli_gh_init_requires_token(tmp_path, monkeypatch):
     """gh-init exits non-zero with a clear message when GITHUB_TOKEN is missing."""
     _write_pyproject(tmp_path / "pyproject.toml", name="x")
@@ -721,6 +1396,43 @@ def test_cli_gh_init_protect_branch_flag(tmp_path, monkeypatch):
     assert "Protected branch" in result.output
 
 
+def test_cli_gh_init_concurrency_uses_concurrent_client(tmp_path, monkeypatch):
+    """``--concurrency`` above 1 runs gh-init with the pooled client and closes it afterwards."""
+    _write_pyproject(tmp_path / "pyproject.toml", name="demo")
+    monkeypatch.setenv("GITHUB_TOKEN", "stub")
+    captured = {}
+
+    class StubClient:
+        def __init__(self, token: str, *, concurrency: int):
+            captured["concurrency"] = concurrency
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            captured["closed"] = True
+
+    def fake_init(config, client):
+        captured["client"] = client
+        return github_init.GhInitResult(
+            html_url="https://github.com/me/demo",
+            actions_url="https://github.com/me/demo/actions",
+            pages_url="https://me.github.io/demo",
+            skipped_secrets=[],
+            pushed=False,
+        )
+
+    monkeypatch.setattr("repo_scaffold.cli.ConcurrentGhInitClient", StubClient)
+    monkeypatch.setattr("repo_scaffold.cli.init_repository", fake_init)
+
+    result = CliRunner().invoke(cli, ["gh-init", str(tmp_path), "--no-input", "--no-push", "--concurrency", "4"])
+
+    assert result.exit_code == 0, result.output
+    assert isinstance(captured["client"], StubClient)
+    assert captured["concurrency"] == 4
+    assert captured["closed"] is True
+
+
 def _record_calls(monkeypatch, *, head_exists: bool = False):
     calls: list[list[str]] = []
 
@@ -0,0 +1,274 @@
+"""Post-generation hook runtime tests."""
+
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from repo_scaffold.cli import get_package_path
+from repo_scaffold.hooks import InstallStep
+from repo_scaffold.hooks import TaskGraph
+from repo_scaffold.hooks import initialize
+from repo_scaffold.hooks import install_dependencies
+from repo_scaffold.hooks import remove_paths
+
+
+def test_task_graph_runs_independent_tasks_concurrently():
+    """Independent tasks overlap: the first can wait on something only the second does."""
+    second_started = threading.Event()
+    overlapped = []
+    graph = TaskGraph()
+    graph.add("first", lambda: overlapped.append(second_started.wait(timeout=5)))
+    graph.add("second", second_started.set)
+
+    graph.run()
+
+    assert overlapped == [True]
+
+
+def test_task_graph_keeps_output_in_registration_order(capsys):
+    """A later task that finishes first still prints after the earlier one."""
+    later_done = threading.Event()
+
+    def slow():
+        print("slow: start")
+        later_done.wait(timeout=5)
+        print("slow: end")
+
+    def fast():
+        print("fast: start")
+        print("fast: end")
+        later_done.set()
+
+    graph = TaskGraph()
+    graph.add("slow", slow)
+    graph.add("fast", fast)
+    graph.run()
+
+    assert capsys.readouterr().out.splitlines() == ["slow: start", "slow: end", "fast: start", "fast: end"]
+
+
+def test_task_graph_respects_declared_dependencies():
+    """A task starts only after the tasks it depends on have finished."""
+    order = []
+    graph = TaskGraph()
+    graph.add("init", lambda: order.append("init"))
+    graph.add("stage", lambda: order.append("stage"), after=("init",))
+
+    graph.run()
+
+    assert order == ["init", "stage"]
+
+
+def test_task_graph_failure_skips_dependents_and_reraises(capsys):
+    """A failing task skips its dependents, lets others finish, and re-raises."""
+    ran = []
+
+    def fail():
+        print("failing")
+        raise SystemExit(1)
+
+    graph = TaskGraph()
+    graph.add("fail", fail)
+    graph.add("dependent", lambda: ran.append("dependent"), after=("fail",))
+    graph.add("independent", lambda: ran.append("independent"))
+
+    with pytest.raises(SystemExit) as exc_info:
+        graph.run()
+
+    assert exc_info.value.code == 1
+    assert ran == ["independent"]
+    assert [task.skipped for task in graph.tasks] == [False, True, False]
+    assert capsys.readouterr().out == "failing\n"
+
+
+def test_task_graph_rejects_unknown_or_duplicate_tasks():
+    """Dependencies must already be registered and names must be unique."""
+    graph = TaskGraph()
+    graph.add("git", lambda: None)
+
+    with pytest.raises(ValueError, match="unknown"):
+        graph.add("install", lambda: None, after=("missing",))
+    with pytest.raises(ValueError, match="Duplicate"):
+        graph.add("git", lambda: None)
+
+
+def test_python_post_gen_hook_runs_git_and_install_through_task_graph(monkeypatch, tmp_path, capsys):
+    """The hook's initializer runs both steps and prints git output first."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "pyproject.toml").write_text("[project]\nname = 'demo'\n", encoding="utf-8")
+    hook_path = Path(get_package_path("templates/template-python/hooks/post_gen_project.py"))
+    source = hook_path.read_text(encoding="utf-8")
+    context = {"install_after_generate": "yes", "init_git": "yes"}
+
+    calls = []
+    real_popen = subprocess.Popen
+
+    def fake_run(command, check, **kwargs):
+        calls.append(command[:2])
+        return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+    def fake_popen(command, **kwargs):
+        calls.append(command[:2])
+        script = "import sys; print('Resolved 1 package'); print('warning: cached', file=sys.stderr)"
+        return real_popen([sys.executable, "-c", script], **kwargs)
+
+    namespace = {"__name__": "hook_under_test"}
+    exec(compile(source, str(hook_path), "exec"), namespace)
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(subprocess, "Popen", fake_popen)
+
+    namespace["ProjectInitializer"](context, tmp_path).run()
+
+    assert namespace["initialize"] is initialize
+    assert sorted(calls) == [["git", "init"], ["uv", "sync"]]
+    output = capsys.readouterr().out
+    assert output.index("Initializing git repository") < output.index("Installing project dependencies")
+    assert output.index("Installing project dependencies") < output.index("Resolved 1 package")
+    assert output.index("warning: cached") < output.index("Dependencies installed successfully")
+
+
+def test_install_dependencies_fails_the_hook_after_printing_the_output(monkeypatch, tmp_path, capsys):
+    """A failing install prints what the tool wrote before the failure message."""
+    (tmp_path / "Cargo.toml").write_text("[package]\n", encoding="utf-8")
+    step = InstallStep(command=("cargo", "build"), manifest="Cargo.toml", starting="Building...", not_found="no cargo")
+    real_popen = subprocess.Popen
+    monkeypatch.setattr(
+        subprocess,
+        "Popen",
+        lambda command, **kwargs: real_popen(
+            [sys.executable, "-c", "print('error[E0425]'); raise SystemExit(101)"], **kwargs
+        ),
+    )
+
+    with pytest.raises(SystemExit):
+        install_dependencies(step, root=tmp_path)
+
+    output = capsys.readouterr().out
+    assert output.startswith("Building...\nerror[E0425]\n❌ Failed to install dependencies:")
+    assert "101" in output
+
+
+def test_task_graph_leaves_other_threads_output_alone(capsys):
+    """Threads outside the graph write straight through while a later task is buffered."""
+    started = threading.Event()
+    release = threading.Event()
+    stdout = sys.stdout
+    graph = TaskGraph()
+
+    def first():
+        started.set()
+        release.wait(timeout=10)
+        print("first")
+
+    graph.add("first", first)
+    graph.add("second", lambda: print("second"))
+    runner = threading.Thread(target=graph.run)
+    runner.start()
+    started.wait(timeout=10)
+    print("outsider")
+    assert capsys.readouterr().out == "outsider\n"
+    release.set()
+    runner.join(timeout=10)
+
+    assert capsys.readouterr().out == "first\nsecond\n"
+    assert sys.stdout is stdout
+
+
+def test_remove_paths_removes_existing_files_and_directories(tmp_path, capsys):
+    """Files, directories and nested paths are removed in one call; missing ones are skipped silently."""
+    (tmp_path / "Dockerfile").write_text("FROM scratch\n", encoding="utf-8")
+    (tmp_path / ".github" / "workflows").mkdir(parents=True)
+    (tmp_path / ".github" / "workflows" / "ci.yaml").write_text("on: push\n", encoding="utf-8")
+    (tmp_path / "src" / "demo").mkdir(parents=True)
+    (tmp_path / "src" / "demo" / "cli.py").write_text("", encoding="utf-8")
+    (tmp_path / "src" / "demo" / "core.py").write_text("", encoding="utf-8")
+
+    removed = remove_paths(
+        ["Dockerfile", ".github", "src/demo/cli.py", "missing.txt", "absent/dir/file"], root=tmp_path
+    )
+
+    assert sorted(removed) == sorted([Path("Dockerfile"), Path(".github"), Path("src/demo/cli.py")])
+    assert sorted(p.name for p in tmp_path.rglob("*")) == ["core.py", "demo", "src"]
+    output = capsys.readouterr().out
+    assert "Removed file: Dockerfile" in output
+    assert "Removed directory: .github" in output
+    assert "missing.txt" not in output
+
+
+def test_remove_paths_unlinks_large_trees_in_parallel(tmp_path):
+    """Directories at or above the threshold are emptied by the parallel path and removed completely."""
+    for group in range(3):
+        directory = tmp_path / "node_modules" / f"pkg{group}" / "lib"
+        directory.mkdir(parents=True)
+        for index in range(10):
+            (directory / f"file{index}.js").write_text("", encoding="utf-8")
+
+    assert remove_paths(["node_modules"], root=tmp_path, parallel_threshold=8) == [Path("node_modules")]
+    assert not (tmp_path / "node_modules").exists()
+
+
+def test_remove_paths_does_not_follow_symlinks(tmp_path):
+    """A symlink to a directory is unlinked; the directory it points to is left alone."""
+    target = tmp_path / "outside"
+    target.mkdir()
+    (target / "keep.txt").write_text("", encoding="utf-8")
+    project = tmp_path / "project"
+    (project / "tree").mkdir(parents=True)
+    (project / "link").symlink_to(target, target_is_directory=True)
+    (project / "tree" / "inner").symlink_to(target, target_is_directory=True)
+
+    remove_paths(["link", "tree"], root=project, parallel_threshold=1)
+
+    assert not (project / "link").is_symlink()
+    assert not (project / "tree").exists()
+    assert (target / "keep.txt").is_file()
+
+
+def test_install_dependencies_reports_the_step_messages(monkeypatch, tmp_path, capsys):
+    """A missing tool prints the step's own message and fails the hook."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "Cargo.toml").write_text("[package]\n", encoding="utf-8")
+    step = InstallStep(
+        command=("cargo", "build"),
+        manifest="Cargo.toml",
+        starting="Building project with cargo...",
+        not_found="cargo not found. Install Rust first: https://rustup.rs/",
+    )
+
+    def missing_tool(command, **kwargs):
+        raise FileNotFoundError(command[0])
+
+    monkeypatch.setattr(subprocess, "Popen", missing_tool)
+
+    with pytest.raises(SystemExit) as exc_info:
+        install_dependencies(step, root=tmp_path)
+
+    assert exc_info.value.code == 1
+    assert (
+        capsys.readouterr().out
+        == "Building project with cargo...\n❌ cargo not found. Install Rust first: https://rustup.rs/\n"
+    )
+
+
+def test_hook_fallback_loads_only_the_shipped_runtime(tmp_path):
+    """Without repo_scaffold importable, the hook loads the package by location and leaves sys.path alone."""
+    template_dir = Path(get_package_path("templates/template-python"))
+    source = (template_dir / "hooks" / "post_gen_project.py").read_text(encoding="utf-8")
+    hook = tmp_path / "hook.py"
+    hook.write_text(source.replace("{{ cookiecutter._repo_dir }}", str(template_dir)), encoding="utf-8")
+    code = (
+        "import runpy, sys\n"
+        "before = list(sys.path)\n"
+        f"namespace = runpy.run_path({str(hook)!r}, run_name='hook_under_test')\n"
+        "print(sys.path == before, namespace['initialize'].__module__, sys.modules['repo_scaffold'].__file__)\n"
+    )
+
+    # -I: no PYTHONPATH, user site or script directory; -S: no site-packages, so only the fallback can find the package.
+    result = subprocess.run(
+        [sys.executable, "-I", "-S", "-c", code], cwd=tmp_path, capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.split() == ["True", "repo_scaffold.hooks.steps", str(template_dir.parents[1] / "__init__.py")]
@@ -0,0 +1,69 @@
+"""Template registry index tests."""
+
+import json
+from pathlib import Path
+
+from repo_scaffold.registry import build
+from repo_scaffold.registry import builtin_templates_dir
+from repo_scaffold.registry import get_registry
+
+
+def _write_overlay(tmp_path: Path) -> Path:
+    template_dir = tmp_path / "template-internal"
+    template_dir.mkdir()
+    (template_dir / "cookiecutter.json").write_text(json.dumps({"repo_name": "svc"}), encoding="utf-8")
+    overlay = tmp_path / "templates.json"
+    overlay.write_text(
+        json.dumps(
+            {
+                "templates": {
+                    "template-internal": {
+                        "path": "template-internal",
+                        "title": "internal",
+                        "description": "in-house service template",
+                    }
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+    return overlay
+
+
+def test_index_is_up_to_date():
+    """The committed _index.py matches the template JSON files (run `just registry`)."""
+    assert build.main(["--check"]) == 0
+
+
+def test_registry_resolves_name_title_and_path(monkeypatch, tmp_path):
+    """Templates resolve by registry key, title, and path in one lookup."""
+    monkeypatch.setenv("REPO_SCAFFOLD_TEMPLATES", str(tmp_path / "missing.json"))
+    registry = get_registry()
+
+    assert registry.resolve("template-python") == "template-python"
+    assert registry.resolve("python") == "template-python"
+    assert registry.resolve("uv-workspace") == "template-uv-workspace"
+    assert registry.resolve("nope") is None
+    assert registry.template_dir("template-python") == builtin_templates_dir() / "template-python"
+
+
+def test_registry_variables_match_template_json(monkeypatch, tmp_path):
+    """The precompiled variable schema is the template's parsed cookiecutter.json."""
+    monkeypatch.setenv("REPO_SCAFFOLD_TEMPLATES", str(tmp_path / "missing.json"))
+    registry = get_registry()
+
+    for name, info in registry.templates.items():
+        config_path = builtin_templates_dir() / info["path"] / "cookiecutter.json"
+        assert registry.variables[name] == json.loads(config_path.read_text(encoding="utf-8"))
+
+
+def test_overlay_registry_merges_over_builtin(monkeypatch, tmp_path):
+    """A user overlay falls back to JSON parsing and adds its templates."""
+    overlay = _write_overlay(tmp_path)
+    monkeypatch.setenv("REPO_SCAFFOLD_TEMPLATES", str(overlay))
+    registry = get_registry()
+
+    assert registry.resolve("internal") == "template-internal"
+    assert registry.resolve("python") == "template-python"
+    assert registry.template_dir("template-internal") == tmp_path / "template-internal"
+    assert registry.variables["template-internal"] == {"repo_name": "svc"}
@@ -0,0 +1,610 @@
+"""In-process render engine and batch generation tests."""
+
+import io
+import json
+import sys
+import tarfile
+import threading
+import zipfile
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from click.testing import CliRunner
+from cookiecutter.exceptions import FailedHookException
+from cookiecutter.main import cookiecutter
+
+from repo_scaffold.cli import cli
+from repo_scaffold.registry import get_registry
+from repo_scaffold.render import LOCKFILE_NAME
+from repo_scaffold.render import BatchEntry
+from repo_scaffold.render import BatchResult
+from repo_scaffold.render import InvalidAnswersError
+from repo_scaffold.render import RenderedFile
+from repo_scaffold.render import RenderEngine
+from repo_scaffold.render import answer_errors
+from repo_scaffold.render import archive_chunks
+from repo_scaffold.render import excluded_paths
+from repo_scaffold.render import format_results
+from repo_scaffold.render import is_excluded
+from repo_scaffold.render import load_manifest
+from repo_scaffold.render import run_batch
+from repo_scaffold.render import write_archive
+from repo_scaffold.render.cache import RenderCache
+from repo_scaffold.render.hooks import load_hook
+from repo_scaffold.render.hooks import run_hook
+
+
+def _tree(project_dir: Path) -> dict[str, bytes]:
+    return {
+        path.relative_to(project_dir).as_posix(): path.read_bytes()
+        for path in sorted(project_dir.rglob("*"))
+        if path.is_file()
+    }
+
+
+@pytest.mark.parametrize(
+    ("template", "answers"),
+    [
+        ("template-python", {}),
+        ("template-python", {"use_podman": "no", "include_cli": "no", "use_github_actions": "no"}),
+        ("template-pnpm-workspace", {"initial_package_type": "ts-cli"}),
+        ("template-ts-sdk", {"use_github_actions": "no"}),
+    ],
+)
+def test_engine_output_matches_cookiecutter(tmp_path, template, answers):
+    """After the post-gen hook, the engine's tree is byte-identical to cookiecutter's.
+
+    The engine never renders conditionally excluded paths while cookiecutter
+    renders them and lets the hook delete them; the results must agree.
+    """
+    extra_context = {**answers, "install_after_generate": "no", "init_git": "no"}
+    expected = cookiecutter(
+        str(get_registry().template_dir(template)),
+        output_dir=str(tmp_path / "cookiecutter"),
+        no_input=True,
+        extra_context=extra_context,
+    )
+    actual = RenderEngine().generate(template, output_dir=tmp_path / "engine", extra_context=extra_context)
+    actual_tree = _tree(actual)
+
+    assert actual.name == Path(expected).name
+    assert actual_tree.pop(LOCKFILE_NAME)  # the only file cookiecutter does not write
+    assert actual_tree == _tree(Path(expected))
+
+
+def test_conditional_paths_skip_excluded_sources(tmp_path):
+    """Excluded sources are not written and renames apply, even with the hook disabled."""
+    project_dir = RenderEngine().generate(
+        "pnpm-workspace",
+        output_dir=tmp_path,
+        extra_context={"initial_package_type": "ts-lib", "use_github_actions": "no"},
+        accept_hooks=False,
+    )
+
+    assert sorted(path.name for path in (project_dir / "packages").iterdir()) == ["my-pnpm-workspace-core"]
+    assert not (project_dir / "_shared").exists()
+    assert not (project_dir / ".github").exists()
+    assert not (project_dir / "cog.toml").exists()
+
+
+@pytest.mark.parametrize("template", sorted(get_registry().templates))
+def test_conditional_paths_reference_real_choices_and_sources(template):
+    """Every rule names an existing variable value and each path matches at least one source."""
+    registry = get_registry()
+    variables = registry.variables[template]
+    renderer = RenderEngine(use_bytecode_cache=False).renderer(template)
+    sources = [path.relative_to(renderer.template_dir).as_posix() for path in renderer.template_dir.rglob("*")]
+
+    for rule in variables.get("_conditional_paths", []):
+        for name, value in rule.get("when", {}).items():
+            choices = variables[name] if isinstance(variables[name], list) else [variables[name]]
+            assert value in choices, f"{template}: {name}={value!r} is not a choice"
+        for pattern in [*rule.get("exclude", []), *rule.get("rename", {})]:
+            assert any(is_excluded(path, [pattern]) for path in sources), f"{template}: {pattern!r} matches nothing"
+
+
+def test_excluded_paths_match_rules_and_parents():
+    """Unconditional rules always apply; directory patterns cover their contents."""
+    variables = {
+        "use_podman": "no",
+        "use_github_actions": "yes",
+        "_conditional_paths": [
+            {"exclude": ["_shared"]},
+            {"when": {"use_podman": "no"}, "exclude": ["container", "*.dockerignore"]},
+            {"when": {"use_github_actions": "no"}, "exclude": [".github"]},
+        ],
+    }
+
+    patterns = excluded_paths(variables)
+
+    assert patterns == ("_shared", "container", "*.dockerignore")
+    assert is_excluded("container/Containerfile", patterns)
+    assert is_excluded("app.dockerignore", patterns)
+    assert not is_excluded(".github/workflows/ci.yaml", patterns)
+    assert not is_excluded("containers.md", patterns)
+
+
+def test_engine_reuses_renderer_per_template(tmp_path):
+    """Projects from the same template share one renderer (and Jinja environment)."""
+    engine = RenderEngine()
+    first = engine.generate("python", output_dir=tmp_path, extra_context={"repo_name": "one"}, accept_hooks=False)
+    second = engine.generate(
+        "template-python", output_dir=tmp_path, extra_context={"repo_name": "two"}, accept_hooks=False
+    )
+
+    assert engine.renderer("python") is engine.renderer("template-python")
+    assert first.name == "one"
+    assert second.name == "two"
+
+
+def test_engine_rejects_existing_project_dir(tmp_path):
+    """An existing project directory is left alone unless overwriting is requested."""
+    engine = RenderEngine()
+    engine.generate("python", output_dir=tmp_path, accept_hooks=False)
+
+    with pytest.raises(Exception, match="already exists"):
+        engine.generate("python", output_dir=tmp_path, accept_hooks=False)
+
+
+def test_failed_render_leaves_no_project_behind(monkeypatch, tmp_path):
+    """A render error raised part-way through the tree writes nothing to output_dir."""
+    engine = RenderEngine(use_render_cache=False)
+    renderer = engine.renderer("python")
+
+    def broken_render(context):
+        yield RenderedFile("README.md", b"partial")
+        raise RuntimeError("template error")
+
+    monkeypatch.setattr(renderer, "render_files", broken_render)
+
+    with pytest.raises(RuntimeError, match="template error"):
+        engine.generate("python", output_dir=tmp_path, accept_hooks=False)
+    assert [*tmp_path.iterdir()] == []
+
+
+def test_failed_write_removes_staging_dir(monkeypatch, tmp_path):
+    """A write error discards the staging directory and never publishes the project."""
+
+    def failing_write(project_dir, files):
+        (project_dir / "README.md").write_text("partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr("repo_scaffold.render.engine.write_tree", failing_write)
+
+    with pytest.raises(OSError, match="disk full"):
+        RenderEngine(use_render_cache=False).generate("python", output_dir=tmp_path, accept_hooks=False)
+    assert [*tmp_path.iterdir()] == []
+
+
+def test_answer_errors_reports_every_broken_rule():
+    """Patterns, choices and version ordering are all checked, one message per broken rule."""
+    variables = {
+        "project_slug": "Bad Slug",
+        "init_git": "maybe",
+        "min_python_version": "3.14",
+        "max_python_version": "3.12",
+        "_answer_schema": {
+            "project_slug": {"pattern": "[a-z0-9][a-z0-9-]*", "description": "a lowercase slug"},
+            "init_git": {"choices": ["yes", "no"]},
+            "max_python_version": {"at_least": "min_python_version"},
+        },
+    }
+
+    assert answer_errors(variables) == [
+        "project_slug must be a lowercase slug (got 'Bad Slug')",
+        "init_git must be one of yes, no (got 'maybe')",
+        "min_python_version must be less than or equal to max_python_version (3.14 > 3.12)",
+    ]
+    assert answer_errors({**variables, "project_slug": "ok", "init_git": "no", "min_python_version": "3.9"}) == []
+
+
+def test_invalid_answers_fail_before_rendering(monkeypatch, tmp_path):
+    """A schema violation raises before the template is rendered or anything is written."""
+    engine = RenderEngine()
+    monkeypatch.setattr(engine.renderer("python"), "render_files", MagicMock(side_effect=AssertionError))
+
+    with pytest.raises(InvalidAnswersError, match="project_slug must be a valid Python package name"):
+        engine.generate("python", output_dir=tmp_path, extra_context={"repo_name": "1st-project"})
+    assert [*tmp_path.iterdir()] == []
+
+
+def test_run_batch_parallel_rejects_invalid_entries_up_front(monkeypatch, tmp_path):
+    """Entries breaking the answer schema fail in the parent without being sent to a worker."""
+    submitted = []
+    monkeypatch.setattr("repo_scaffold.render.batch._run_in_worker", lambda entry, flags: submitted.append(entry))
+    entries = [
+        BatchEntry("rust", tmp_path, {"project_slug": "Not_A_Slug"}),
+        BatchEntry("uv-workspace", tmp_path, {"min_python_version": "3.14", "max_python_version": "3.12"}),
+    ]
+
+    results = run_batch(entries, jobs=2)
+
+    assert submitted == []
+    assert [result.ok for result in results] == [False, False]
+    assert "project_slug must be a lowercase repository slug" in results[0].error
+    assert "min_python_version must be less than or equal to max_python_version" in results[1].error
+
+
+def _invalid_answers(schema: dict) -> dict[str, str]:
+    """Answers breaking every rule of an answer schema."""
+    answers = {}
+    for name, rule in schema.items():
+        if "pattern" in rule:
+            answers[name] = "-Not Valid-"
+        if "choices" in rule:
+            answers[name] = "maybe"
+        if "at_least" in rule:
+            answers.update({rule["at_least"]: "3.14", name: "3.12"})
+    return answers
+
+
+@pytest.mark.parametrize("template", sorted(get_registry().templates))
+def test_hook_validator_matches_answer_schema(tmp_path, template):
+    """Each post-gen hook's validator reports exactly what the pre-render check reports."""
+    engine = RenderEngine(use_bytecode_cache=False)
+    renderer = engine.renderer(template)
+    schema = renderer.config["_answer_schema"]
+    validator = renderer.hook("post_gen_project").__globals__["ProjectValidator"]
+
+    for extra_context in ({}, _invalid_answers(schema)):
+        context = engine.build_context(renderer, output_dir=tmp_path, extra_context=extra_context)
+
+        assert validator(context["cookiecutter"]).errors() == answer_errors(context["cookiecutter"])
+    assert len(answer_errors(context["cookiecutter"])) == len(schema)
+
+
+def test_post_gen_hook_runs_in_process_and_is_imported_once(monkeypatch, tmp_path, capsys):
+    """Opted-in hooks are imported once per template and never spawn an interpreter."""
+    monkeypatch.setattr("cookiecutter.hooks.run_script", MagicMock(side_effect=AssertionError("spawned")))
+    loads = []
+    monkeypatch.setattr("repo_scaffold.render.engine.load_hook", lambda *args: loads.append(args) or load_hook(*args))
+    engine = RenderEngine(use_render_cache=False)
+    flags = {"install_after_generate": "no", "init_git": "no"}
+
+    first = engine.generate("python", output_dir=tmp_path, extra_context={"repo_name": "one", **flags})
+    second = engine.generate("python", output_dir=tmp_path, extra_context={"repo_name": "two", **flags})
+
+    assert [args[1] for args in loads] == ["pre_gen_project", "post_gen_project"]
+    assert capsys.readouterr().out.count("Project setup completed successfully") == 2
+    assert (first / "pyproject.toml").is_file() and (second / "pyproject.toml").is_file()
+
+
+def test_load_hook_falls_back_to_the_script_unless_opted_in(tmp_path):
+    """Templates that do not list a hook under _in_process_hooks keep cookiecutter's script runner."""
+    (tmp_path / "hooks").mkdir()
+    (tmp_path / "hooks" / "post_gen_project.py").write_text(
+        "def main(context, project_dir):\n    pass\n", encoding="utf-8"
+    )
+
+    assert load_hook(tmp_path, "post_gen_project", {}) is None
+    assert load_hook(tmp_path, "pre_gen_project", {"_in_process_hooks": ["pre_gen_project"]}) is None
+    assert callable(load_hook(tmp_path, "post_gen_project", {"_in_process_hooks": ["post_gen_project"]}))
+
+
+def test_in_process_hook_exit_status_fails_the_hook(tmp_path):
+    """A non-zero ``sys.exit`` fails like the script would and removes a new project directory."""
+    project_dir = tmp_path / "demo"
+    project_dir.mkdir()
+
+    def hook(context, project):
+        assert project == project_dir
+        sys.exit(3)
+
+    with pytest.raises(FailedHookException, match="exit status: 3"):
+        run_hook(tmp_path, "post_gen_project", project_dir, {"cookiecutter": {}}, True, hook=hook)
+    assert not project_dir.exists()
+
+
+def test_in_process_hooks_run_concurrently_without_changing_directory(tmp_path):
+    """Hooks get their project directory explicitly, so concurrent hooks overlap and the cwd never moves."""
+    cwd = Path.cwd()
+    both_running = threading.Barrier(2, timeout=10)
+    seen = {}
+
+    def hook(context, project):
+        both_running.wait()  # times out if hooks were serialized
+        seen[project.name] = Path.cwd()
+
+    threads = [
+        threading.Thread(
+            target=run_hook,
+            args=(tmp_path, "post_gen_project", tmp_path / name, {"cookiecutter": {}}, False),
+            kwargs={"hook": hook},
+        )
+        for name in ("a", "b")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert seen == {"a": cwd, "b": cwd}
+
+
+@pytest.mark.parametrize("template", sorted(get_registry().templates))
+def test_streamed_archive_matches_generated_project(tmp_path, template):
+    """The archive holds exactly the tree ``generate`` leaves behind after the post-gen hook."""
+    extra_context = {"install_after_generate": "no", "init_git": "no"}
+    engine = RenderEngine(use_render_cache=False)
+    project_dir = engine.generate(template, output_dir=tmp_path, extra_context=extra_context)
+
+    name, files = engine.stream(template, extra_context=extra_context)
+    with tarfile.open(fileobj=io.BytesIO(b"".join(archive_chunks(files, root=name, archive_format="tar")))) as tar:
+        members = tar.getmembers()
+        archived = {m.name: tar.extractfile(m).read() for m in members if m.isfile()}
+
+    assert name == project_dir.name
+    assert archived == {f"{name}/{path}": content for path, content in _tree(project_dir).items()}
+    modes = {m.name: m.mode for m in members}
+    assert all(modes[f"{name}/{path}"] == (project_dir / path).stat().st_mode & 0o7777 for path in _tree(project_dir))
+
+
+def test_stream_writes_nothing_and_runs_no_hooks(monkeypatch, tmp_path):
+    """Streaming renders lazily: no hook, no project directory, no base store entries."""
+    monkeypatch.setenv("REPO_SCAFFOLD_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.chdir(tmp_path)
+    engine = RenderEngine(use_bytecode_cache=False, use_render_cache=False)
+    monkeypatch.setattr(engine.renderer("python"), "hook", MagicMock(side_effect=AssertionError))
+
+    buffer = io.BytesIO()
+    name, files = engine.stream("python", extra_context={"repo_name": "zipped"})
+    size = write_archive(files, buffer, root=name, archive_format="zip", mtime=0)
+
+    assert size == len(buffer.getvalue())
+    with zipfile.ZipFile(buffer) as archive:
+        assert archive.testzip() is None
+        names = archive.namelist()
+        info = archive.getinfo("zipped/zipped/__init__.py")
+    assert "zipped/" + LOCKFILE_NAME in names
+    assert "zipped/zipped/" in names
+    assert info.date_time == (1980, 1, 1, 0, 0, 0)
+    assert [*tmp_path.iterdir()] == []
+
+
+def test_stream_rejects_invalid_answers_before_rendering(monkeypatch):
+    """Answers are checked when ``stream`` is called, not when the archive is consumed."""
+    engine = RenderEngine()
+    monkeypatch.setattr(engine.renderer("python"), "render_files", MagicMock(side_effect=AssertionError))
+
+    with pytest.raises(InvalidAnswersError):
+        engine.stream("python", extra_context={"repo_name": "1st-project"})
+
+
+def test_cli_create_streams_archive_to_stdout(monkeypatch, tmp_path):
+    """``create --format tar.gz --output -`` writes only the archive to stdout and nothing to disk."""
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["create", "rust", "--no-input", "--format", "tar.gz", "--output", "-"])
+
+    assert result.exit_code == 0, result.stderr
+    with tarfile.open(fileobj=io.BytesIO(result.stdout_bytes), mode="r:gz") as tar:
+        assert "my-rust-project/Cargo.toml" in tar.getnames()
+    assert "Skipping post-generation hooks" in result.stderr
+    assert [*tmp_path.iterdir()] == []
+
+    result = runner.invoke(cli, ["create", "rust", "--no-input", "--format", "zip", "-o", "out"])
+    assert result.exit_code == 0, result.stderr
+    assert zipfile.is_zipfile(tmp_path / "out" / "my-rust-project.zip")
+    assert [*(tmp_path / "out").iterdir()] == [tmp_path / "out" / "my-rust-project.zip"]
+
+    result = runner.invoke(cli, ["create", "rust", "--format", "zip", "--output", "-"])
+    assert result.exit_code == 2
+    assert "--output - requires --no-input" in result.output
+
+
+def test_load_manifest_applies_defaults_and_resolves_paths(tmp_path):
+    """Defaults merge into each entry and output_dir is relative to the manifest."""
+    manifest = tmp_path / "batch.toml"
+    manifest.write_text(
+        """
+[defaults]
+output_dir = "services"
+extra_context = { full_name = "Platform Team" }
+
+[[projects]]
+template = "python"
+extra_context = { repo_name = "billing" }
+
+[[projects]]
+template = "rust"
+output_dir = "/abs/edge"
+extra_context = { repo_name = "gateway", full_name = "Edge Team" }
+""",
+        encoding="utf-8",
+    )
+
+    entries = load_manifest(manifest)
+
+    assert entries == [
+        BatchEntry("python", tmp_path / "services", {"full_name": "Platform Team", "repo_name": "billing"}),
+        BatchEntry("rust", Path("/abs/edge"), {"full_name": "Edge Team", "repo_name": "gateway"}),
+    ]
+
+
+def test_load_manifest_accepts_json(tmp_path):
+    """JSON manifests share the TOML shape."""
+    manifest = tmp_path / "batch.json"
+    manifest.write_text(json.dumps({"projects": [{"template": "python"}]}), encoding="utf-8")
+
+    assert load_manifest(manifest) == [BatchEntry("python", tmp_path, {})]
+
+
+def test_run_batch_isolates_failures_and_keeps_order(tmp_path):
+    """A failing entry is recorded without stopping the remaining entries."""
+    engine = MagicMock(spec=RenderEngine)
+    engine.generate.side_effect = [tmp_path / "a", RuntimeError("boom"), tmp_path / "c"]
+    entries = [BatchEntry("python", tmp_path, {"repo_name": name}) for name in ("a", "b", "c")]
+
+    results = run_batch(entries, no_install=True, engine=engine)
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[1].error == "boom"
+    assert engine.generate.call_args.kwargs["extra_context"] == {
+        "repo_name": "c",
+        "install_after_generate": "no",
+        "init_git": "yes",
+    }
+
+
+def test_run_batch_parallel_keeps_order_and_captures_logs(tmp_path):
+    """Pool workers return results in manifest order with each project's output captured."""
+    entries = [BatchEntry("python", tmp_path, {"repo_name": name}) for name in ("alpha", "beta")]
+    entries.append(BatchEntry("no-such-template", tmp_path, {}))
+    replayed = []
+
+    results = run_batch(entries, no_install=True, no_git=True, jobs=2, on_result=replayed.append)
+
+    assert [result.entry for result in results] == entries
+    assert replayed == results
+    assert [result.ok for result in results] == [True, True, False]
+    assert results[0].project_dir == tmp_path / "alpha"
+    assert (tmp_path / "beta" / "pyproject.toml").is_file()
+    assert "post-generation" in results[0].log
+    assert "not found" in results[2].error
+
+
+def test_format_results_lists_each_project():
+    """The timing table has a header, one row per project and a summary line."""
+    results = [
+        BatchResult(BatchEntry("python", Path("out"), {}), 1.5, project_dir=Path("out/billing")),
+        BatchResult(BatchEntry("rust", Path("out"), {}), 0.25, error="bad answer"),
+    ]
+
+    lines = format_results(results)
+
+    assert lines[0].split() == ["Template", "Project", "Time", "Status"]
+    assert "out/billing" in lines[1] and lines[1].endswith("ok")
+    assert lines[2].endswith("FAILED: bad answer")
+    assert lines[-1] == "2 projects, 1 failed, 1.75s total"
+    assert format_results(results, wall_seconds=1.5)[-1] == "2 projects, 1 failed, 1.75s total (1.50s wall)"
+
+
+def test_cli_create_batch_exits_non_zero_on_failure(monkeypatch, tmp_path):
+    """create-batch prints the table and fails when any entry failed."""
+    manifest = tmp_path / "batch.json"
+    manifest.write_text(json.dumps({"projects": [{"template": "python"}]}), encoding="utf-8")
+    failed = [BatchResult(BatchEntry("python", tmp_path, {}), 0.1, error="boom")]
+    monkeypatch.setattr("repo_scaffold.render.run_batch", MagicMock(return_value=failed))
+
+    result = CliRunner().invoke(cli, ["create-batch", str(manifest)])
+
+    assert result.exit_code == 1
+    assert "FAILED: boom" in result.output
+    assert "1 of 1 projects failed" in result.output
+
+
+def test_bytecode_cache_is_warm_for_second_engine(monkeypatch, tmp_path):
+    """A second engine (i.e. a later run) loads compiled templates from disk."""
+    monkeypatch.setenv("REPO_SCAFFOLD_CACHE_DIR", str(tmp_path / "cache"))
+
+    cold = RenderEngine(use_render_cache=False)
+    cold.generate("python", output_dir=tmp_path / "cold", accept_hooks=False)
+    warm = RenderEngine(use_render_cache=False)
+    warm.generate("python", output_dir=tmp_path / "warm", accept_hooks=False)
+
+    assert cold.bytecode_cache.misses > 0
+    assert warm.bytecode_cache.misses == 0
+    assert warm.bytecode_cache.hits == cold.bytecode_cache.misses
+    assert _tree(tmp_path / "cold" / "my_python_project") == _tree(tmp_path / "warm" / "my_python_project")
+
+
+def test_render_cache_reuses_trees_for_identical_answers(monkeypatch, tmp_path):
+    """Same template contents and answers: the tree is cloned from the cache, not rendered."""
+    monkeypatch.setenv("REPO_SCAFFOLD_CACHE_DIR", str(tmp_path / "cache"))
+    RenderEngine().generate("python", output_dir=tmp_path / "first", accept_hooks=False)
+    engine = RenderEngine()
+
+    project_dir = engine.generate("python", output_dir=tmp_path / "second", accept_hooks=False)
+    loaded = engine.bytecode_cache.hits + engine.bytecode_cache.misses
+    engine.generate("python", output_dir=tmp_path / "third", extra_context={"include_cli": "no"}, accept_hooks=False)
+
+    assert loaded == 0
+    assert _tree(project_dir) == _tree(tmp_path / "first" / "my_python_project")
+    assert (project_dir / "justfile").stat().st_nlink == 1  # cloned or copied, never shared
+    stats = engine.render_cache.stats()
+    assert (stats.entries, stats.hits, stats.misses) == (2, 1, 2)
+    assert (engine.render_cache.hits, engine.render_cache.misses) == (1, 1)  # this process only
+
+
+def test_render_cache_hardlinks_and_detects_writes_through_them(monkeypatch, tmp_path):
+    """In hardlink mode an object modified through a project is detected and the tree re-rendered."""
+    monkeypatch.setenv("REPO_SCAFFOLD_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("REPO_SCAFFOLD_LINK_MODE", "hardlink")
+    first = RenderEngine().generate("python", output_dir=tmp_path / "first", accept_hooks=False)
+    second = RenderEngine().generate("python", output_dir=tmp_path / "second", accept_hooks=False)
+    expected = _tree(first)
+
+    assert (second / "justfile").stat().st_nlink > 1
+    with open(second / "justfile", "ab") as f:  # an editor writing in place
+        f.write(b"# local edit\n")
+    third = RenderEngine().generate("python", output_dir=tmp_path / "third", accept_hooks=False)
+
+    assert _tree(third) == expected
+
+
+def test_render_cache_evicts_least_recently_used_trees(monkeypatch, tmp_path):
+    """Beyond the size bound, the oldest trees and their unshared objects are dropped."""
+    monkeypatch.setenv("REPO_SCAFFOLD_CACHE_DIR", str(tmp_path / "cache"))
+    engine = RenderEngine()
+    engine.render_cache.max_bytes = 1
+    for name in ("a", "b"):
+        engine.generate("python", output_dir=tmp_path / name, extra_context={"repo_name": name}, accept_hooks=False)
+
+    stats = engine.render_cache.stats()
+    assert stats.entries == 0
+    assert stats.size_bytes < 100  # only the hit/miss counters remain
+
+
+def test_render_cache_counters_stay_fixed_size_and_out_of_the_budget(tmp_path):
+    """Lookups update a fixed-size counters file, which never makes real trees get evicted."""
+    cache = RenderCache(tmp_path / "render", max_bytes=10**6)
+    cache.store("tree", [RenderedFile("README.md", b"# demo\n")])
+    for _ in range(100):
+        cache.lookup("tree")
+        cache.lookup("other")
+
+    cache.max_bytes = cache.stats().size_bytes - cache.counters.stat().st_size
+    cache.evict()
+
+    assert cache.counters.stat().st_size == 24
+    stats = cache.stats()
+    assert (stats.entries, stats.hits, stats.misses) == (1, 100, 100)
+
+
+def test_render_cache_store_walks_only_past_the_bound(tmp_path, monkeypatch):
+    """Stores add to a running size total; the cache is walked only when it crosses ``max_bytes``."""
+    cache = RenderCache(tmp_path / "render", max_bytes=10**6)
+    cache.store("first", [RenderedFile("a.txt", b"a" * 1000)])
+    walks = []
+    stored_bytes = cache._stored_bytes
+    monkeypatch.setattr(cache, "_stored_bytes", lambda: walks.append(1) or stored_bytes())
+
+    cache.store("second", [RenderedFile("b.txt", b"b" * 1000)])
+    assert walks == []
+    cache.max_bytes = 1500
+    cache.store("third", [RenderedFile("c.txt", b"c" * 1000)])
+
+    assert walks == [1]
+    assert cache.stats().entries == 1  # only the newest tree fits
+    assert cache.lookup("third") is not None
+
+
+def test_cli_cache_stats_and_clear(monkeypatch, tmp_path):
+    """`cache stats` reports the bytecode cache and `cache clear` removes it."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("REPO_SCAFFOLD_CACHE_DIR", str(cache_dir))
+    RenderEngine().generate("python", output_dir=tmp_path / "out", accept_hooks=False)
+    runner = CliRunner()
+
+    stats = runner.invoke(cli, ["cache", "stats"])
+    cleared = runner.invoke(cli, ["cache", "clear"])
+
+    assert stats.exit_code == 0
+    assert stats.output.startswith("jinja: ")
+    assert "render: 1 entries" in stats.output
+    assert "0 hits, 1 misses" in stats.output
+    assert not stats.output.startswith("jinja: 0 entries")
+    assert cleared.exit_code == 0
+    assert not cache_dir.exists()
@@ -0,0 +1,214 @@
+"""Generation server (``repo-scaffold serve``) tests."""
+
+import io
+import json
+import tarfile
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from repo_scaffold.render import RenderEngine
+from repo_scaffold.serve import GenerationServer
+from repo_scaffold.serve import Histogram
+
+
+@pytest.fixture
+def serve(monkeypatch, tmp_path):
+    """Start servers on free ports; yield a factory returning ``(server, base_url)``."""
+    monkeypatch.setenv("REPO_SCAFFOLD_CACHE_DIR", str(tmp_path / "cache"))
+    servers = []
+
+    def start(**options):
+        server = GenerationServer(("127.0.0.1", 0), engine=RenderEngine(), quiet=True, **options)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _request(url, body=None):
+    """Send a GET (or a POST of ``body``); return the status, headers and body."""
+    data = body if body is None or isinstance(body, bytes) else json.dumps(body).encode("utf-8")
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, data=data)) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as error:
+        return error.code, error.headers, error.read()
+
+
+def test_generate_returns_archive(serve):
+    """A generate request without ``output_dir`` streams the project as an archive."""
+    _, url = serve()
+
+    status, headers, body = _request(f"{url}/generate", {"template": "rust", "answers": {"repo_name": "ledger"}})
+
+    assert status == 200
+    assert headers["Content-Type"] == "application/x-tar"
+    assert headers["Content-Disposition"] == 'attachment; filename="ledger.tar"'
+    with tarfile.open(fileobj=io.BytesIO(body)) as tar:
+        assert "ledger/Cargo.toml" in tar.getnames()
+
+
+@pytest.mark.parametrize(
+    ("body", "status", "error"),
+    [
+        (b"not json", 400, "not valid JSON"),
+        ({"answers": {}}, 400, '"template" must be a string'),
+        ({"template": "python", "format": "rar"}, 400, '"format" must be one of tar, tar.gz, zip'),
+        ({"template": "cobol"}, 404, "Template 'cobol' not found"),
+        ({"template": "python", "output_dir": "team"}, 403, "--root"),
+    ],
+)
+def test_generate_rejects_bad_requests(serve, body, status, error):
+    """Malformed requests get a JSON error with a 4xx status."""
+    _, url = serve()
+
+    actual_status, _, actual_body = _request(f"{url}/generate", body)
+
+    assert actual_status == status
+    assert error in json.loads(actual_body)["error"]
+
+
+def test_generate_reports_invalid_answers(serve):
+    """Answers breaking the template's schema get 422 with every broken rule."""
+    _, url = serve()
+
+    status, _, body = _request(f"{url}/generate", {"template": "python", "answers": {"repo_name": "1st"}})
+
+    assert status == 422
+    assert json.loads(body)["errors"] == ["project_slug must be a valid Python package name (got '1st')"]
+
+
+def test_generate_writes_projects_under_root_only(serve, tmp_path):
+    """With ``output_dir``, the project is created under ``--root``; paths escaping it are refused."""
+    _, url = serve(root=tmp_path / "projects")
+    answers = {"repo_name": "billing", "install_after_generate": "no", "init_git": "no"}
+
+    status, _, body = _request(f"{url}/generate", {"template": "python", "answers": answers, "output_dir": "team-a"})
+    assert status == 201
+    assert json.loads(body) == {"project_dir": str(tmp_path / "projects" / "team-a" / "billing")}
+    assert (tmp_path / "projects" / "team-a" / "billing" / "pyproject.toml").is_file()
+
+    status, _, _ = _request(f"{url}/generate", {"template": "python", "answers": answers, "output_dir": "team-a"})
+    assert status == 409
+
+    status, _, _ = _request(f"{url}/generate", {"template": "python", "answers": answers, "output_dir": "../out"})
+    assert status == 403
+    assert not (tmp_path / "out").exists()
+
+
+def test_full_queue_answers_503(serve, monkeypatch):
+    """Connections beyond the busy workers and the queue are turned away immediately."""
+    server, url = serve(workers=1, queue_size=1)
+    started, release = threading.Event(), threading.Event()
+    stream = server.engine.stream
+
+    def blocking_stream(*args, **kwargs):
+        started.set()
+        release.wait(10)
+        return stream(*args, **kwargs)
+
+    monkeypatch.setattr(server.engine, "stream", blocking_stream)
+    results = []
+    busy = threading.Thread(target=lambda: results.append(_request(f"{url}/generate", {"template": "rust"})[0]))
+    busy.start()
+    assert started.wait(10)
+    queued = threading.Thread(target=lambda: results.append(_request(f"{url}/healthz")[0]))
+    queued.start()
+    while server.queue_depth() < 1:
+        threading.Event().wait(0.01)
+
+    status, headers, _ = _request(f"{url}/healthz")
+    release.set()
+    busy.join()
+    queued.join()
+
+    assert status == 503
+    assert headers["Retry-After"] == "1"
+    assert sorted(results) == [200, 200]
+    assert server.metrics.rejected == 1
+
+
+def test_metrics_expose_latency_histograms_and_cache_hits(serve):
+    """``/metrics`` has per-endpoint latency histograms and the caches' hit counts after warming."""
+    server, url = serve(workers=1)  # a request's latency is recorded after its response: keep them in order
+    assert server.warm(["template-rust"]) == ["template-rust"]
+    _request(f"{url}/generate", {"template": "rust"})
+    _request(f"{url}/healthz")
+
+    status, headers, body = _request(f"{url}/metrics")
+    text = body.decode("utf-8")
+
+    assert status == 200
+    assert headers["Content-Type"].startswith("text/plain")
+    assert 'repo_scaffold_request_duration_seconds_count{endpoint="/generate",status="200"} 1' in text
+    assert 'repo_scaffold_request_duration_seconds_bucket{endpoint="/healthz",status="200",le="+Inf"} 1' in text
+    assert "repo_scaffold_templates_warm 1" in text
+    hits = server.engine.bytecode_cache.hits
+    assert f'repo_scaffold_cache_lookups_total{{cache="bytecode",result="hit"}} {hits}' in text
+    assert 'repo_scaffold_cache_hit_ratio{cache="render"}' in text
+
+
+def test_histogram_buckets_are_cumulative():
+    """Bucket samples count every observation at or below their bound."""
+    histogram = Histogram((0.1, 1.0))
+    for seconds in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(seconds)
+
+    assert histogram.lines("latency", 'endpoint="/x"') == [
+        'latency_bucket{endpoint="/x",le="0.1"} 2',
+        'latency_bucket{endpoint="/x",le="1.0"} 3',
+        'latency_bucket{endpoint="/x",le="+Inf"} 4',
+        'latency_sum{endpoint="/x"} 3.650000',
+        'latency_count{endpoint="/x"} 4',
+    ]
+
+
+def test_generate_rejects_jinja_in_answers(serve, tmp_path):
+    """Answers are rendered as Jinja by cookiecutter, so template syntax in them never reaches it."""
+    _, url = serve(root=tmp_path / "projects")
+    marker = tmp_path / "pwned"
+    payload = f"{{{{ cycler.__init__.__globals__.os.popen('touch {marker}').read() }}}}"
+
+    for body in (
+        {"template": "python", "answers": {"repo_name": payload}},
+        {"template": "python", "answers": {"repo_name": payload}, "output_dir": "team"},
+        {"template": "python", "answers": {"description": "{% raw %}x{% endraw %}"}},
+        {"template": "python", "answers": {"repo_name": ["ok", "{# comment #}"]}},
+    ):
+        status, _, response = _request(f"{url}/generate", body)
+        assert status == 400
+        assert "must not contain Jinja syntax" in json.loads(response)["error"]
+
+    assert not marker.exists()
+    assert not (tmp_path / "projects").exists()
+
+
+def test_generate_rejects_private_answer_keys(serve):
+    """Keys starting with ``_`` are template settings (schema, conditional paths, hooks), not answers."""
+    _, url = serve()
+
+    status, _, body = _request(f"{url}/generate", {"template": "python", "answers": {"_answer_schema": {}}})
+
+    assert status == 400
+    assert json.loads(body)["error"] == "Answer '_answer_schema' is private to the template"
+
+
+def test_generate_refuses_project_dir_outside_root(serve, monkeypatch, tmp_path):
+    """The final project directory is checked against ``--root`` too, not just ``output_dir``."""
+    monkeypatch.setattr("repo_scaffold.render.engine.validate_answers", lambda variables: None)
+    _, url = serve(root=tmp_path / "projects")
+    answers = {"project_slug": "../../escaped", "install_after_generate": "no", "init_git": "no"}
+
+    status, _, body = _request(f"{url}/generate", {"template": "python", "answers": answers, "output_dir": "team"})
+
+    assert status == 403
+    assert "is outside" in json.loads(body)["error"]
+    assert not (tmp_path / "escaped").exists()
+    assert [*tmp_path.glob("*escaped*")] == []
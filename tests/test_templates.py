@@ -2,6 +2,7 @@
 
 import json
 import subprocess
+import sys
 import tomllib
 from pathlib import Path
 from unittest.mock import Mock
@@ -73,11 +74,18 @@ def test_template_question_defaults_are_user_friendly():
     assert python_config["include_cli"] == ["yes", "no"]
 
 
+def _mock_render_engine(monkeypatch) -> list[dict]:
+    """Replace the CLI's render engine with one that records ``generate`` calls."""
+    calls = []
+    engine = Mock()
+    engine.return_value.generate.side_effect = lambda template, **kwargs: calls.append({"template": template, **kwargs})
+    monkeypatch.setattr("repo_scaffold.cli.RenderEngine", engine)
+    return calls
+
+
 def test_cli_create_resolves_template_key_and_title(monkeypatch, tmp_path):
     """Test create command resolves both registry key and template title."""
-    calls = []
-    mock_cookiecutter = Mock(side_effect=lambda **kwargs: calls.append(kwargs))
-    monkeypatch.setattr("repo_scaffold.cli.cookiecutter", mock_cookiecutter)
+    calls = _mock_render_engine(monkeypatch)
 
     runner = CliRunner()
     by_key = runner.invoke(cli, ["create", "template-uv-workspace", "--no-input", "-o", str(tmp_path)])
@@ -87,17 +95,15 @@ def test_cli_create_resolves_template_key_and_title(monkeypatch, tmp_path):
     assert by_title.exit_code == 0
     assert len(calls) == 2
     assert all(call["no_input"] is True for call in calls)
-    assert all(call["output_dir"] == str(tmp_path) for call in calls)
-    assert all(call["template"].endswith("template-uv-workspace") for call in calls)
+    assert all(call["output_dir"] == tmp_path for call in calls)
+    assert all(call["template"] == "template-uv-workspace" for call in calls)
     assert calls[0]["extra_context"] == {"install_after_generate": "yes", "init_git": "yes"}
     assert calls[1]["extra_context"] == {"install_after_generate": "no", "init_git": "yes"}
 
 
 def test_cli_create_no_git_sets_extra_context(monkeypatch, tmp_path):
     """``--no-git`` flips the init_git extra_context value to 'no'."""
-    calls = []
-    mock_cookiecutter = Mock(side_effect=lambda **kwargs: calls.append(kwargs))
-    monkeypatch.setattr("repo_scaffold.cli.cookiecutter", mock_cookiecutter)
+    calls = _mock_render_engine(monkeypatch)
 
     result = CliRunner().invoke(cli, ["create", "template-python", "--no-input", "--no-git", "-o", str(tmp_path)])
 
@@ -290,17 +296,11 @@ def test_python_post_gen_hook_uses_project_root_and_can_skip_install(monkeypatch
     monkeypatch.chdir(tmp_path)
     hook_path = Path(get_package_path("templates/template-python/hooks/post_gen_project.py"))
     source = hook_path.read_text(encoding="utf-8")
-    source = source.replace('"{{cookiecutter.project_slug}}"', '"demo"')
-    source = source.replace('"{{cookiecutter.min_python_version}}"', '"3.12"')
-    source = source.replace('"{{cookiecutter.max_python_version}}"', '"3.12"')
-    source = source.replace('"{{cookiecutter.include_cli}}"', '"yes"')
-    source = source.replace('"{{cookiecutter.use_github_actions}}"', '"yes"')
-    source = source.replace('"{{cookiecutter.use_podman}}"', '"yes"')
-    source = source.replace('"{{cookiecutter.install_after_generate}}"', '"no"')
+    context = {"install_after_generate": "no", "init_git": "yes"}
 
     namespace = {"__name__": "hook_under_test"}
     exec(compile(source, str(hook_path), "exec"), namespace)
-    initializer = namespace["ProjectInitializer"]()
+    initializer = namespace["ProjectInitializer"](context, tmp_path)
     initializer.setup_environment()
 
 
@@ -309,8 +309,7 @@ def test_python_post_gen_hook_inits_git_on_master(monkeypatch, tmp_path):
     monkeypatch.chdir(tmp_path)
     hook_path = Path(get_package_path("templates/template-python/hooks/post_gen_project.py"))
     source = hook_path.read_text(encoding="utf-8")
-    source = source.replace('"{{cookiecutter.install_after_generate}}"', '"no"')
-    source = source.replace('"{{cookiecutter.init_git}}"', '"yes"')
+    context = {"install_after_generate": "no", "init_git": "yes"}
 
     calls = []
 
@@ -320,9 +319,9 @@ def test_python_post_gen_hook_inits_git_on_master(monkeypatch, tmp_path):
 
     namespace = {"__name__": "hook_under_test"}
     exec(compile(source, str(hook_path), "exec"), namespace)
-    monkeypatch.setattr(namespace["subprocess"], "run", fake_run)
+    monkeypatch.setattr(subprocess, "run", fake_run)
 
-    namespace["ProjectInitializer"]().init_git_repo()
+    namespace["ProjectInitializer"](context, tmp_path).init_git_repo()
 
     assert calls == [["git", "init", "-b", "master"]]
 
@@ -332,14 +331,14 @@ def test_python_post_gen_hook_skips_git_when_disabled(monkeypatch, tmp_path):
     monkeypatch.chdir(tmp_path)
     hook_path = Path(get_package_path("templates/template-python/hooks/post_gen_project.py"))
     source = hook_path.read_text(encoding="utf-8")
-    source = source.replace('"{{cookiecutter.init_git}}"', '"no"')
+    context = {"install_after_generate": "no", "init_git": "no"}
 
     calls = []
     namespace = {"__name__": "hook_under_test"}
     exec(compile(source, str(hook_path), "exec"), namespace)
-    monkeypatch.setattr(namespace["subprocess"], "run", lambda *a, **k: calls.append(a))
+    monkeypatch.setattr(subprocess, "run", lambda *a, **k: calls.append(a))
 
-    namespace["ProjectInitializer"]().init_git_repo()
+    namespace["ProjectInitializer"](context, tmp_path).init_git_repo()
 
     assert calls == []
     """Test workspace hook invokes uv sync from the current project root."""
@@ -347,38 +346,40 @@ def test_python_post_gen_hook_skips_git_when_disabled(monkeypatch, tmp_path):
     (tmp_path / "pyproject.toml").write_text("[project]\nname = 'demo'\nversion = '0.1.0'\n", encoding="utf-8")
     calls = []
 
-    def fake_run(command, check):
-        calls.append((command, check, Path.cwd()))
+    real_popen = subprocess.Popen
+
+    def fake_popen(command, cwd, **kwargs):
+        calls.append((command, Path(cwd)))
+        return real_popen([sys.executable, "-c", "pass"], cwd=cwd, **kwargs)
 
     hook_path = Path(get_package_path("templates/template-uv-workspace/hooks/post_gen_project.py"))
     source = hook_path.read_text(encoding="utf-8")
-    source = source.replace('"{{cookiecutter.project_slug}}"', '"demo"')
-    source = source.replace('"{{cookiecutter.package_slug}}"', '"demo-core"')
-    source = source.replace('"{{cookiecutter.package_module}}"', '"demo_core"')
-    source = source.replace('"{{cookiecutter.min_python_version}}"', '"3.12"')
-    source = source.replace('"{{cookiecutter.max_python_version}}"', '"3.12"')
-    source = source.replace('"{{cookiecutter.use_github_actions}}"', '"yes"')
-    source = source.replace('"{{cookiecutter.install_after_generate}}"', '"yes"')
+    context = {"install_after_generate": "yes", "init_git": "yes"}
 
     namespace = {"__name__": "hook_under_test"}
     exec(compile(source, str(hook_path), "exec"), namespace)
-    monkeypatch.setattr(namespace["subprocess"], "run", fake_run)
+    monkeypatch.setattr(subprocess, "Popen", fake_popen)
 
-    initializer = namespace["ProjectInitializer"]()
+    initializer = namespace["ProjectInitializer"](context, tmp_path)
     initializer.setup_environment()
 
+    assert calls == [(["uv", "sync", "--all-groups"], tmp_path)]
+
 
 def test_python_post_gen_hook_rejects_invalid_version_range():
     """Test Python hook rejects impossible Python support ranges."""
     hook_path = Path(get_package_path("templates/template-python/hooks/post_gen_project.py"))
     source = hook_path.read_text(encoding="utf-8")
-    source = source.replace('"{{cookiecutter.project_slug}}"', '"demo"')
-    source = source.replace('"{{cookiecutter.min_python_version}}"', '"3.14"')
-    source = source.replace('"{{cookiecutter.max_python_version}}"', '"3.12"')
+    context = {
+        **_load_cookiecutter_config("template-python"),
+        "project_slug": "demo",
+        "min_python_version": "3.14",
+        "max_python_version": "3.12",
+    }
 
     namespace = {"__name__": "hook_under_test"}
     exec(compile(source, str(hook_path), "exec"), namespace)
-    validator = namespace["ProjectValidator"]()
+    validator = namespace["ProjectValidator"](context)
 
     try:
         validator.validate()
@@ -392,15 +393,18 @@ def test_workspace_post_gen_hook_rejects_invalid_module_name():
     """Test workspace hook rejects invalid generated module names."""
     hook_path = Path(get_package_path("templates/template-uv-workspace/hooks/post_gen_project.py"))
     source = hook_path.read_text(encoding="utf-8")
-    source = source.replace('"{{cookiecutter.project_slug}}"', '"demo"')
-    source = source.replace('"{{cookiecutter.package_slug}}"', '"demo-core"')
-    source = source.replace('"{{cookiecutter.package_module}}"', '"123_bad"')
-    source = source.replace('"{{cookiecutter.min_python_version}}"', '"3.12"')
-    source = source.replace('"{{cookiecutter.max_python_version}}"', '"3.12"')
+    context = {
+        **_load_cookiecutter_config("template-uv-workspace"),
+        "project_slug": "demo",
+        "package_slug": "demo-core",
+        "package_module": "123_bad",
+        "min_python_version": "3.12",
+        "max_python_version": "3.12",
+    }
 
     namespace = {"__name__": "hook_under_test"}
     exec(compile(source, str(hook_path), "exec"), namespace)
-    validator = namespace["ProjectValidator"]()
+    validator = namespace["ProjectValidator"](context)
 
     try:
         validator.validate()
@@ -0,0 +1,130 @@
+"""Per-phase trace instrumentation tests."""
+
+import json
+from unittest.mock import Mock
+
+from click.testing import CliRunner
+
+from repo_scaffold import trace
+from repo_scaffold.cli import cli
+from repo_scaffold.hooks import TaskGraph
+from repo_scaffold.render import RenderEngine
+from repo_scaffold.trace import span
+from repo_scaffold.trace import summarize
+from repo_scaffold.trace import timeline
+from repo_scaffold.trace import trace_path
+from repo_scaffold.trace import tracing
+
+
+def _spans(path):
+    return [event for event in json.loads(path.read_text())["traceEvents"] if event["ph"] == "X"]
+
+
+def test_span_is_a_no_op_without_tracing():
+    """Instrumented code runs unchanged when tracing is off."""
+    assert trace._active is None
+    with span("render"):
+        pass
+
+
+def test_tracing_writes_chrome_trace_with_nested_spans(tmp_path):
+    """Spans nest by time and failures are tagged with the exception type."""
+    path = tmp_path / "trace.json"
+
+    with tracing(path):
+        with span("create", template="python"), span("render"):
+            pass
+        try:
+            with span("post_gen_project"):
+                raise SystemExit(1)
+        except SystemExit:
+            pass
+
+    document = json.loads(path.read_text())
+    spans = {event["name"]: event for event in _spans(path)}
+    assert document["displayTimeUnit"] == "ms"
+    assert {"create", "render", "post_gen_project"} <= set(spans)
+    assert spans["create"]["ts"] <= spans["render"]["ts"]
+    assert spans["render"]["ts"] + spans["render"]["dur"] <= spans["create"]["ts"] + spans["create"]["dur"]
+    assert spans["create"]["args"] == {"template": "python"}
+    assert spans["post_gen_project"]["args"] == {"error": "SystemExit"}
+    assert trace._active is None
+
+
+def test_tracing_records_post_gen_hook_spans_in_process(monkeypatch, tmp_path):
+    """The in-process post-gen hook's spans nest under ``post_gen_project`` in the same process."""
+    monkeypatch.setenv("REPO_SCAFFOLD_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "trace.json"
+    answers = {"repo_name": "demo", "install_after_generate": "no", "init_git": "no"}
+
+    with tracing(path):
+        RenderEngine().generate("python", output_dir=tmp_path / "out", extra_context=answers)
+
+    spans = {event["name"]: event for event in _spans(path)}
+    hook, validate = spans["post_gen_project"], spans["validate"]
+    assert validate["pid"] == hook["pid"]
+    assert hook["ts"] <= validate["ts"] <= hook["ts"] + hook["dur"]
+    document = json.loads(path.read_text())
+    assert [event["args"]["name"] for event in document["traceEvents"] if event["ph"] == "M"] == ["repo-scaffold"]
+
+
+def test_task_graph_records_one_span_per_task(tmp_path):
+    """Hook initialization tasks show up as spans named after the task."""
+    path = tmp_path / "trace.json"
+    graph = TaskGraph()
+    graph.add("git", lambda: None)
+    graph.add("install", lambda: None)
+
+    with tracing(path):
+        graph.run()
+
+    assert sorted(event["name"] for event in _spans(path)) == ["git", "install"]
+
+
+def test_trace_path_prefers_environment(monkeypatch, tmp_path):
+    """``REPO_SCAFFOLD_TRACE`` enables tracing on its own and overrides the default path."""
+    monkeypatch.delenv("REPO_SCAFFOLD_TRACE", raising=False)
+    assert trace_path(profile=False) is None
+    assert trace_path(profile=True).name == "repo-scaffold-trace.json"
+
+    monkeypatch.setenv("REPO_SCAFFOLD_TRACE", str(tmp_path / "t.json"))
+    assert trace_path(profile=False) == tmp_path / "t.json"
+
+
+def test_summarize_lists_spans_in_start_order():
+    """The ``--profile`` table lists phases by start time with millisecond durations."""
+    events = [
+        {"name": "render", "ph": "X", "ts": 20.0, "dur": 1500.0},
+        {"name": "process_name", "ph": "M"},
+        {"name": "create", "ph": "X", "ts": 10.0, "dur": 4000.0},
+    ]
+
+    assert summarize(events) == ["create        4.0 ms", "render        1.5 ms"]
+
+
+def test_timeline_shows_start_offsets_and_overlap():
+    """Timeline bars are placed by start offset, so concurrent phases overlap."""
+    events = [
+        {"name": "push", "ph": "X", "ts": 2000.0, "dur": 2000.0},
+        {"name": "docs build", "ph": "X", "ts": 0.0, "dur": 3000.0},
+        {"name": "gh-init", "ph": "X", "ts": 0.0, "dur": 4000.0},
+    ]
+
+    assert timeline(events, width=8) == [
+        "docs build  +     0.0 ms        3.0 ms  |######  |",
+        "gh-init     +     0.0 ms        4.0 ms  |########|",
+        "push        +     2.0 ms        2.0 ms  |    ####|",
+    ]
+
+
+def test_cli_create_profile_writes_trace(monkeypatch, tmp_path):
+    """``create --profile`` prints phase timings and writes the trace file."""
+    engine = Mock()
+    monkeypatch.setattr("repo_scaffold.cli.RenderEngine", engine)
+    monkeypatch.setenv("REPO_SCAFFOLD_TRACE", str(tmp_path / "trace.json"))
+
+    result = CliRunner().invoke(cli, ["create", "python", "--no-input", "-o", str(tmp_path), "--profile"])
+
+    assert result.exit_code == 0, result.output
+    assert "Phase timings:" in result.output
+    assert {"create", "import"} <= {event["name"] for event in _spans(tmp_path / "trace.json")}
@@ -0,0 +1,144 @@
+"""Lockfile, three-way merge and ``repo-scaffold update`` tests."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from repo_scaffold.cli import cli
+from repo_scaffold.render import LOCKFILE_NAME
+from repo_scaffold.render import RenderEngine
+from repo_scaffold.render import read_lockfile
+from repo_scaffold.render import update_project
+from repo_scaffold.render.cache import content_hash
+from repo_scaffold.render.cache import store_base
+from repo_scaffold.render.merge import merge3
+
+
+def _lines(text):
+    return text.splitlines(keepends=True)
+
+
+@pytest.fixture
+def project(monkeypatch, tmp_path):
+    """A python project generated with an isolated cache (and so an isolated base store)."""
+    monkeypatch.setenv("REPO_SCAFFOLD_CACHE_DIR", str(tmp_path / "cache"))
+    return RenderEngine().generate(
+        "python", output_dir=tmp_path / "out", extra_context={"use_podman": "no"}, accept_hooks=False
+    )
+
+
+def _pretend_template_changed(project, path, old_content):
+    """Rewrite the lockfile as if ``path`` had been generated as ``old_content`` by an older template."""
+    lock = json.loads((project / LOCKFILE_NAME).read_text())
+    lock["files"][path]["source_hash"] = "0" * 64
+    lock["files"][path]["hash"] = store_base(old_content.encode())
+    (project / LOCKFILE_NAME).write_text(json.dumps(lock))
+
+
+def test_merge3_combines_non_overlapping_edits():
+    """Edits to different lines are both kept; identical edits are taken once."""
+    base = _lines("a\nb\nc\nd\ne\n")
+    ours = _lines("a\nB\nc\nd\ne\nours\n")
+    theirs = _lines("a\nB\nc\nD\ne\n")
+
+    merged, conflicts = merge3(base, ours, theirs)
+
+    assert "".join(merged) == "a\nB\nc\nD\ne\nours\n"
+    assert conflicts == 0
+
+
+def test_merge3_marks_overlapping_edits():
+    """Different edits to the same lines are emitted between conflict markers."""
+    merged, conflicts = merge3(_lines("a\nb\nc\n"), _lines("a\nmine\nc\n"), _lines("a\ntheirs\nc\n"))
+
+    assert "".join(merged) == "a\n<<<<<<< project\nmine\n=======\ntheirs\n>>>>>>> template\nc\n"
+    assert conflicts == 1
+
+
+def test_generate_writes_lockfile(project):
+    """The lockfile records the template, answers and a hash for every generated file."""
+    lock = read_lockfile(project)
+
+    assert lock.template == "template-python"
+    assert lock.answers["use_podman"] == "no"
+    assert not any(key.startswith("_") for key in lock.answers)
+    assert lock.files["pyproject.toml"].hash == content_hash((project / "pyproject.toml").read_bytes())
+    assert LOCKFILE_NAME not in lock.files
+    assert not (project / "container").exists()
+
+
+def test_update_without_template_changes_renders_nothing(project):
+    """An up-to-date project re-renders no files and changes nothing."""
+    before = (project / LOCKFILE_NAME).read_text()
+
+    result = update_project(project)
+
+    assert result.rendered == 0
+    assert result.changes == []
+    assert (project / LOCKFILE_NAME).read_text() == before
+
+
+def test_update_replaces_unedited_files_and_merges_edited_ones(project):
+    """Unedited files take the new output; user edits are merged with the template's changes."""
+    readme = (project / "README.md").read_text()
+    old_readme = "# Old title\n" + "".join(_lines(readme)[1:])
+    (project / "README.md").write_text(old_readme + "\nLocal notes\n")
+    _pretend_template_changed(project, "README.md", old_readme)
+    old_justfile = (project / "justfile").read_text() + "# removed upstream\n"
+    (project / "justfile").write_text(old_justfile)
+    _pretend_template_changed(project, "justfile", old_justfile)
+
+    result = update_project(project)
+
+    assert result.rendered == 2
+    assert {change.path: change.status for change in result.changes} == {"README.md": "merged", "justfile": "updated"}
+    assert (project / "README.md").read_text() == readme + "\nLocal notes\n"
+    assert "# removed upstream" not in (project / "justfile").read_text()
+    assert read_lockfile(project).files["README.md"].hash == content_hash(readme.encode())
+    assert update_project(project).changes == []
+
+
+def test_update_reports_conflicts_and_respects_deletions(project):
+    """Overlapping edits get markers; files the user deleted stay deleted."""
+    readme = (project / "README.md").read_text()
+    old_readme = "# Old title\n" + "".join(_lines(readme)[1:])
+    (project / "README.md").write_text("# My title\n" + "".join(_lines(readme)[1:]))
+    _pretend_template_changed(project, "README.md", old_readme)
+    (project / "mkdocs.yml").unlink()
+    _pretend_template_changed(project, "mkdocs.yml", "site_name: old\n")
+
+    result = CliRunner().invoke(cli, ["update", str(project)])
+
+    assert result.exit_code == 1
+    assert "conflict  README.md (1 conflicts)" in result.output
+    assert "skipped   mkdocs.yml" in result.output
+    assert "<<<<<<< project\n# My title\n=======\n" in (project / "README.md").read_text()
+    assert not (project / "mkdocs.yml").exists()
+
+
+def test_update_removes_files_the_template_dropped(project):
+    """Unedited files whose source is gone are deleted; edited ones are kept."""
+    lock = json.loads((project / LOCKFILE_NAME).read_text())
+    for name, content in [("old.txt", "old\n"), ("edited.txt", "old\n")]:
+        lock["files"][name] = {"source": name, "source_hash": "0" * 64, "hash": content_hash(content.encode())}
+    (project / LOCKFILE_NAME).write_text(json.dumps(lock))
+    (project / "old.txt").write_text("old\n")
+    (project / "edited.txt").write_text("mine\n")
+
+    result = update_project(project, dry_run=True)
+    assert (project / "old.txt").exists()
+    update_project(project)
+
+    assert {change.path: change.status for change in result.changes} == {"old.txt": "removed", "edited.txt": "kept"}
+    assert not (project / "old.txt").exists()
+    assert (project / "edited.txt").exists()
+    assert "old.txt" not in read_lockfile(project).files
+
+
+def test_cli_update_requires_lockfile(tmp_path):
+    """Projects without a lockfile are rejected with a clear error."""
+    result = CliRunner().invoke(cli, ["update", str(tmp_path)])
+
+    assert result.exit_code == 1
+    assert LOCKFILE_NAME in result.output